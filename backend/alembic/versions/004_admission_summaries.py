@@ -0,0 +1,44 @@
+"""admission summary read model
+
+Revision ID: 004_admission_summaries
+Revises: 003_attachment_read_models
+Create Date: 2026-10-19 09:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.types import GUID
+
+# revision identifiers, used by Alembic.
+revision = "004_admission_summaries"
+down_revision = "003_attachment_read_models"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "admission_summaries",
+        sa.Column("id", GUID(), primary_key=True),
+        sa.Column("tenant_id", GUID(), nullable=False),
+        sa.Column("patient_id", GUID(), nullable=True),
+        sa.Column("admit_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("discharge_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("current_location", sa.String(length=200), nullable=True),
+        sa.Column("current_location_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("current_risk", sa.String(length=100), nullable=True),
+        sa.Column("current_risk_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_procedure_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("location_change_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("clinical_event_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("idx_admission_summary_tenant_patient", "admission_summaries", ["tenant_id", "patient_id"])
+    op.create_index("idx_admission_summary_tenant_location", "admission_summaries", ["tenant_id", "current_location"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_admission_summary_tenant_location", table_name="admission_summaries")
+    op.drop_index("idx_admission_summary_tenant_patient", table_name="admission_summaries")
+    op.drop_table("admission_summaries")
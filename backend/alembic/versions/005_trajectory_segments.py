@@ -0,0 +1,55 @@
+"""trajectory segments and point sequence
+
+Revision ID: 005_trajectory_segments
+Revises: 004_admission_summaries
+Create Date: 2026-10-19 10:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.types import GUID
+
+# revision identifiers, used by Alembic.
+revision = "005_trajectory_segments"
+down_revision = "004_admission_summaries"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "trajectory_points",
+        sa.Column("sequence", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    op.create_table(
+        "trajectory_segments",
+        sa.Column("id", GUID(), primary_key=True),
+        sa.Column("tenant_id", GUID(), nullable=False),
+        sa.Column("admission_id", GUID(), nullable=False),
+        sa.Column("location", sa.String(length=200), nullable=False),
+        sa.Column("start_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("end_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("duration_hours", sa.Float(), nullable=True),
+        sa.Column("sequence", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("position", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("corrects_point_id", GUID(), nullable=True),
+        sa.Column("active", sa.Boolean(), nullable=False, server_default=sa.text("true")),
+    )
+    op.create_index("idx_segment_tenant", "trajectory_segments", ["tenant_id"])
+    op.create_index(
+        "idx_segment_admission_order",
+        "trajectory_segments",
+        ["admission_id", "active", "start_at", "sequence", "position"],
+    )
+    op.create_index("idx_segment_corrects", "trajectory_segments", ["corrects_point_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_segment_corrects", table_name="trajectory_segments")
+    op.drop_index("idx_segment_admission_order", table_name="trajectory_segments")
+    op.drop_index("idx_segment_tenant", table_name="trajectory_segments")
+    op.drop_table("trajectory_segments")
+
+    op.drop_column("trajectory_points", "sequence")
@@ -0,0 +1,64 @@
+"""unit census and occupancy span indexes
+
+Revision ID: 006_unit_census
+Revises: 005_trajectory_segments
+Create Date: 2026-10-19 11:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.types import GUID
+
+# revision identifiers, used by Alembic.
+revision = "006_unit_census"
+down_revision = "005_trajectory_segments"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "unit_census",
+        sa.Column("tenant_id", GUID(), primary_key=True),
+        sa.Column("location", sa.String(length=200), primary_key=True),
+        sa.Column("occupancy", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+    op.create_table(
+        "census_occupants",
+        sa.Column("admission_id", GUID(), primary_key=True),
+        sa.Column("tenant_id", GUID(), nullable=False),
+        sa.Column("location", sa.String(length=200), nullable=False),
+        sa.Column("since", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("idx_census_occupant_location", "census_occupants", ["tenant_id", "location"])
+
+    op.create_index(
+        "idx_segment_location_start", "trajectory_segments", ["tenant_id", "location", "start_at"]
+    )
+    op.create_index(
+        "idx_segment_location_end", "trajectory_segments", ["tenant_id", "location", "end_at"]
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        # Interval index for point-in-time census queries (range @> timestamp).
+        op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+        op.create_index(
+            "idx_segment_location_span",
+            "trajectory_segments",
+            ["tenant_id", "location", sa.text("tstzrange(start_at, end_at)")],
+            postgresql_using="gist",
+            postgresql_where=sa.text("active"),
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("idx_segment_location_span", table_name="trajectory_segments")
+    op.drop_index("idx_segment_location_end", table_name="trajectory_segments")
+    op.drop_index("idx_segment_location_start", table_name="trajectory_segments")
+
+    op.drop_index("idx_census_occupant_location", table_name="census_occupants")
+    op.drop_table("census_occupants")
+    op.drop_table("unit_census")
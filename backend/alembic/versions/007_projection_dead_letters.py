@@ -0,0 +1,46 @@
+"""projection dead letters
+
+Revision ID: 007_projection_dead_letters
+Revises: 006_unit_census
+Create Date: 2026-10-19 12:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.types import GUID
+
+# revision identifiers, used by Alembic.
+revision = "007_projection_dead_letters"
+down_revision = "006_unit_census"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "projection_dead_letters",
+        sa.Column("id", GUID(), primary_key=True),
+        sa.Column("subscription_id", sa.String(length=200), nullable=False),
+        sa.Column("projection", sa.String(length=200), nullable=False),
+        sa.Column("tenant_id", GUID(), nullable=False),
+        sa.Column("event_id", GUID(), nullable=False),
+        sa.Column("event_type", sa.String(length=200), nullable=False),
+        sa.Column("global_position", sa.BigInteger(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("last_attempt_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("resolved_at", sa.DateTime(timezone=True), nullable=True),
+        sa.UniqueConstraint("subscription_id", "projection", "event_id", name="uq_dead_letter_event"),
+    )
+    op.create_index(
+        "idx_dead_letters_pending",
+        "projection_dead_letters",
+        ["subscription_id", "resolved_at", "global_position"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_dead_letters_pending", table_name="projection_dead_letters")
+    op.drop_table("projection_dead_letters")
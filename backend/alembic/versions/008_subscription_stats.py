@@ -0,0 +1,23 @@
+"""subscription runner stats
+
+Revision ID: 008_subscription_stats
+Revises: 007_projection_dead_letters
+Create Date: 2026-10-19 13:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "008_subscription_stats"
+down_revision = "007_projection_dead_letters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("subscriptions", sa.Column("stats", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("subscriptions", "stats")
@@ -0,0 +1,29 @@
+"""event source index for projection lanes
+
+Revision ID: 009_event_source_index
+Revises: 008_subscription_stats
+Create Date: 2026-10-19 14:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "009_event_source_index"
+down_revision = "008_subscription_stats"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.create_index(
+            "idx_events_source_position",
+            "events",
+            ["tenant_id", sa.text("(metadata ->> 'source')"), "global_position"],
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("idx_events_source_position", table_name="events")
@@ -0,0 +1,49 @@
+"""care team assignments
+
+Revision ID: 010_care_team_assignments
+Revises: 009_event_source_index
+Create Date: 2026-10-19 15:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.types import GUID
+
+# revision identifiers, used by Alembic.
+revision = "010_care_team_assignments"
+down_revision = "009_event_source_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "care_team_assignments",
+        sa.Column("id", GUID(), primary_key=True),
+        sa.Column("tenant_id", GUID(), nullable=False),
+        sa.Column("clinician_key", sa.String(length=200), nullable=False),
+        sa.Column("clinician_name", sa.String(length=200), nullable=False),
+        sa.Column("role", sa.String(length=100), nullable=False),
+        sa.Column("admission_id", GUID(), nullable=False),
+        sa.Column("location", sa.String(length=200), nullable=True),
+        sa.Column("source", sa.String(length=50), nullable=False),
+        sa.Column("source_id", GUID(), nullable=False),
+        sa.Column("start_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("end_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("active", sa.Boolean(), nullable=False, server_default=sa.text("true")),
+    )
+    op.create_index(
+        "idx_care_team_clinician",
+        "care_team_assignments",
+        ["tenant_id", "clinician_key", "role", "start_at"],
+    )
+    op.create_index("idx_care_team_role_open", "care_team_assignments", ["tenant_id", "role", "end_at"])
+    op.create_index("idx_care_team_admission", "care_team_assignments", ["admission_id", "source"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_care_team_admission", table_name="care_team_assignments")
+    op.drop_index("idx_care_team_role_open", table_name="care_team_assignments")
+    op.drop_index("idx_care_team_clinician", table_name="care_team_assignments")
+    op.drop_table("care_team_assignments")
@@ -0,0 +1,46 @@
+"""review queue
+
+Revision ID: 011_review_queue
+Revises: 010_care_team_assignments
+Create Date: 2026-10-19 16:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.types import GUID
+
+# revision identifiers, used by Alembic.
+revision = "011_review_queue"
+down_revision = "010_care_team_assignments"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "review_queue",
+        sa.Column("admission_id", GUID(), primary_key=True),
+        sa.Column("tenant_id", GUID(), nullable=False),
+        sa.Column("patient_id", GUID(), nullable=True),
+        sa.Column("admit_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("review_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("is_current", sa.Boolean(), nullable=False, server_default=sa.text("true")),
+        sa.Column("on_track", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("correction_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("on_track_set", sa.Boolean(), nullable=True),
+        sa.Column("on_track_set_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index(
+        "idx_review_queue_order",
+        "review_queue",
+        ["tenant_id", "is_current", "review_date", "on_track"],
+    )
+    op.create_index("idx_review_queue_patient", "review_queue", ["patient_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_review_queue_patient", table_name="review_queue")
+    op.drop_index("idx_review_queue_order", table_name="review_queue")
+    op.drop_table("review_queue")
@@ -0,0 +1,130 @@
+"""typed read models per clinical event kind
+
+Revision ID: 012_clinical_kind_read_models
+Revises: 011_review_queue
+Create Date: 2026-10-19 17:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.types import GUID
+
+# revision identifiers, used by Alembic.
+revision = "012_clinical_kind_read_models"
+down_revision = "011_review_queue"
+branch_labels = None
+depends_on = None
+
+
+def _common() -> list[sa.Column]:
+    return [
+        sa.Column("id", GUID(), primary_key=True),
+        sa.Column("tenant_id", GUID(), nullable=False),
+        sa.Column("admission_id", GUID(), nullable=False),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "clinical_annotations",
+        *_common(),
+        sa.Column("annotation", sa.Text(), nullable=True),
+        sa.Column("annotation_type", sa.String(length=50), nullable=True),
+        sa.Column("href", sa.Text(), nullable=True),
+        sa.Column("special_node", sa.String(length=200), nullable=True),
+        sa.Column("format", sa.String(length=300), nullable=True),
+    )
+    op.create_index("idx_annotation_admission", "clinical_annotations", ["admission_id", "occurred_at"])
+    op.create_index(
+        "idx_annotation_type", "clinical_annotations", ["tenant_id", "annotation_type", "occurred_at"]
+    )
+
+    op.create_table(
+        "clinical_feedbacks",
+        *_common(),
+        sa.Column("exit_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("score", sa.String(length=50), nullable=True),
+        sa.Column("score_value", sa.Float(), nullable=True),
+        sa.Column("performance", sa.String(length=50), nullable=True),
+        sa.Column("outcome", sa.String(length=50), nullable=True),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column("graph_visible", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("suggested_edit", sa.String(length=10), nullable=True),
+    )
+    op.create_index("idx_feedback_admission", "clinical_feedbacks", ["admission_id", "occurred_at"])
+    op.create_index("idx_feedback_outcome", "clinical_feedbacks", ["tenant_id", "outcome", "occurred_at"])
+    op.create_index("idx_feedback_score", "clinical_feedbacks", ["tenant_id", "score_value"])
+
+    op.create_table(
+        "clinical_conferences",
+        *_common(),
+        sa.Column("conference_type", sa.String(length=50), nullable=True),
+        sa.Column("action_items", sa.Text(), nullable=True),
+        sa.Column("notes", sa.Text(), nullable=True),
+    )
+    op.create_index("idx_conference_admission", "clinical_conferences", ["admission_id", "occurred_at"])
+    op.create_index(
+        "idx_conference_type", "clinical_conferences", ["tenant_id", "conference_type", "occurred_at"]
+    )
+
+    op.create_table(
+        "clinical_bedside_procedures",
+        *_common(),
+        sa.Column("end_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("procedure_type", sa.String(length=50), nullable=True),
+        sa.Column("teams", sa.Text(), nullable=True),
+        sa.Column("notes", sa.Text(), nullable=True),
+    )
+    op.create_index(
+        "idx_bedside_procedure_admission", "clinical_bedside_procedures", ["admission_id", "occurred_at"]
+    )
+    op.create_index(
+        "idx_bedside_procedure_type",
+        "clinical_bedside_procedures",
+        ["tenant_id", "procedure_type", "occurred_at"],
+    )
+
+    op.create_table(
+        "clinical_continuous_therapies",
+        *_common(),
+        sa.Column("therapy_type", sa.String(length=200), nullable=True),
+        sa.Column("status", sa.String(length=200), nullable=True),
+        sa.Column("notes", sa.Text(), nullable=True),
+    )
+    op.create_index(
+        "idx_continuous_therapy_admission", "clinical_continuous_therapies", ["admission_id", "occurred_at"]
+    )
+    op.create_index(
+        "idx_continuous_therapy_type",
+        "clinical_continuous_therapies",
+        ["tenant_id", "therapy_type", "status"],
+    )
+
+    op.create_table(
+        "clinical_course_corrections",
+        *_common(),
+        sa.Column("correction_type", sa.String(length=50), nullable=True),
+        sa.Column("detail", sa.Text(), nullable=True),
+    )
+    op.create_index(
+        "idx_course_correction_admission", "clinical_course_corrections", ["admission_id", "occurred_at"]
+    )
+    op.create_index(
+        "idx_course_correction_type",
+        "clinical_course_corrections",
+        ["tenant_id", "correction_type", "occurred_at"],
+    )
+
+
+def downgrade() -> None:
+    for table in (
+        "clinical_course_corrections",
+        "clinical_continuous_therapies",
+        "clinical_bedside_procedures",
+        "clinical_conferences",
+        "clinical_feedbacks",
+        "clinical_annotations",
+    ):
+        op.drop_table(table)
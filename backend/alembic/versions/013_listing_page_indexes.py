@@ -0,0 +1,30 @@
+"""keyset pagination indexes for patient and admission listings
+
+Revision ID: 013_listing_page_indexes
+Revises: 012_clinical_kind_read_models
+Create Date: 2026-10-19 18:00:00
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "013_listing_page_indexes"
+down_revision = "012_clinical_kind_read_models"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("idx_patient_page", "patient_read_models", ["tenant_id", "created_at", "id"])
+    op.create_index("idx_admission_page", "admission_read_models", ["tenant_id", "created_at", "id"])
+    op.create_index(
+        "idx_admission_patient_page",
+        "admission_read_models",
+        ["tenant_id", "patient_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_admission_patient_page", table_name="admission_read_models")
+    op.drop_index("idx_admission_page", table_name="admission_read_models")
+    op.drop_index("idx_patient_page", table_name="patient_read_models")
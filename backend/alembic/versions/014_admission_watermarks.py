@@ -0,0 +1,31 @@
+"""per-admission projection watermarks
+
+Revision ID: 014_admission_watermarks
+Revises: 013_listing_page_indexes
+Create Date: 2026-10-19 19:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.types import GUID
+
+# revision identifiers, used by Alembic.
+revision = "014_admission_watermarks"
+down_revision = "013_listing_page_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "admission_watermarks",
+        sa.Column("admission_id", GUID(), primary_key=True),
+        sa.Column("tenant_id", GUID(), nullable=False),
+        sa.Column("last_position", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("projected_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("admission_watermarks")
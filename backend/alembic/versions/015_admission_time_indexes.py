@@ -0,0 +1,44 @@
+"""(admission_id, time) indexes for windowed timeline reads
+
+Revision ID: 015_admission_time_indexes
+Revises: 014_admission_watermarks
+Create Date: 2026-10-19 20:00:00
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "015_admission_time_indexes"
+down_revision = "014_admission_watermarks"
+branch_labels = None
+depends_on = None
+
+# The composite indexes also serve the admission_id lookups the old
+# single-column indexes did, so those are replaced.
+INDEXES = [
+    ("timeline_events", "idx_timeline_admission", "idx_timeline_admission_occurred", ["admission_id", "occurred_at"]),
+    (
+        "trajectory_points",
+        "idx_trajectory_admission",
+        "idx_trajectory_admission_effective",
+        ["admission_id", "effective_at", "sequence"],
+    ),
+    (
+        "attachment_read_models",
+        "idx_attachment_admission",
+        "idx_attachment_admission_occurred",
+        ["admission_id", "occurred_at"],
+    ),
+]
+
+
+def upgrade() -> None:
+    for table, old, new, columns in INDEXES:
+        op.create_index(new, table, columns)
+        op.drop_index(old, table_name=table)
+
+
+def downgrade() -> None:
+    for table, old, new, _ in INDEXES:
+        op.create_index(old, table, ["admission_id"])
+        op.drop_index(new, table_name=table)
@@ -0,0 +1,35 @@
+"""stable paging and an explicit created flag for admission summaries
+
+Revision ID: 016_admission_summary_paging
+Revises: 015_admission_time_indexes
+Create Date: 2026-10-20 09:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "016_admission_summary_paging"
+down_revision = "015_admission_time_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "admission_summaries",
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.add_column(
+        "admission_summaries",
+        sa.Column("admission_created", sa.Boolean(), server_default=sa.text("false"), nullable=False),
+    )
+    # Rows written before the flag existed recorded admission.created as a patient_id.
+    op.execute("UPDATE admission_summaries SET admission_created = patient_id IS NOT NULL")
+    op.create_index("idx_admission_summary_page", "admission_summaries", ["tenant_id", "created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_admission_summary_page", table_name="admission_summaries")
+    op.drop_column("admission_summaries", "admission_created")
+    op.drop_column("admission_summaries", "created_at")
@@ -0,0 +1,26 @@
+"""last applied event position on admission summaries
+
+Revision ID: 017_admission_summary_position
+Revises: 016_admission_summary_paging
+Create Date: 2026-10-21 09:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "017_admission_summary_position"
+down_revision = "016_admission_summary_paging"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "admission_summaries",
+        sa.Column("position", sa.BigInteger(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("admission_summaries", "position")
@@ -0,0 +1,78 @@
+"""Route dependencies that serve read-model responses from the response cache.
+
+A route takes a ``CachedResponse`` dependency, returns ``await cache.get()``
+when it is not None, and otherwise returns ``await cache.put(payload)``.
+Both hand back the route's own headers (such as the ETag) on the response.
+Each dependency resolves the route's ETag dependency (cached per request,
+so it is read once) and keys the entry on it; a body is only served for
+the projected state it was built from.
+With the cache disabled, ``get`` always misses and ``put`` returns the
+payload unchanged. A payload that is already an encoded body (see
+``app.api.raw_json``) is stored and sent as it is.
+"""
+from typing import Any
+from urllib.parse import urlencode
+from uuid import UUID
+
+from fastapi import Depends, Request, Response
+
+from app.api.etags import admission_etag, checkpoint_etag
+from app.api.raw_json import RawJSONResponse
+from app.core.tenant import get_tenant_id
+from app.infrastructure.response_cache import (
+    admission_tag,
+    cache_key,
+    patient_tag,
+    response_cache,
+)
+
+
+class CachedResponse:
+    def __init__(self, tenant_id: UUID, key: str, tags: list[str], response: Response) -> None:
+        self.tenant_id = tenant_id
+        self.key = key
+        self.tags = tags
+        self.response = response
+        self.generation = response_cache.generation(tenant_id)
+
+    async def get(self) -> Response | None:
+        if not response_cache.enabled:
+            return None
+        body = await response_cache.get(self.key)
+        return self._wrap(body) if body is not None else None
+
+    async def put(self, payload: Any) -> Any:
+        if not response_cache.enabled:
+            return self._wrap(payload) if isinstance(payload, bytes) else payload
+        return self._wrap(await response_cache.put(self.key, payload, self.tags, self.tenant_id, self.generation))
+
+    def _wrap(self, body: bytes) -> Response:
+        return RawJSONResponse(body, headers=dict(self.response.headers))
+
+
+def _key(request: Request, tenant_id: UUID, etag: str) -> str:
+    # min_position only delays the read; the ETag, read after the wait, pins the state served.
+    params = sorted(item for item in request.query_params.multi_items() if item[0] != "min_position")
+    return cache_key(tenant_id, request.url.path, etag, urlencode(params))
+
+
+async def admission_cache(
+    admission_id: UUID,
+    request: Request,
+    response: Response,
+    tenant_id: UUID = Depends(get_tenant_id),
+    etag: str = Depends(admission_etag),
+) -> CachedResponse:
+    return CachedResponse(
+        tenant_id, _key(request, tenant_id, etag), [admission_tag(tenant_id, admission_id)], response
+    )
+
+
+async def patient_cache(
+    patient_id: UUID,
+    request: Request,
+    response: Response,
+    tenant_id: UUID = Depends(get_tenant_id),
+    etag: str = Depends(checkpoint_etag),
+) -> CachedResponse:
+    return CachedResponse(tenant_id, _key(request, tenant_id, etag), [patient_tag(tenant_id, patient_id)], response)
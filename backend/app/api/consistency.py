@@ -0,0 +1,51 @@
+"""Read-your-writes for read endpoints.
+
+Command responses carry ``global_position``. A read that sends it back as
+the ``min_position`` query parameter, or the ``X-Min-Position`` header, is
+held until the tenant's live projection checkpoint reaches that position.
+If the projections do not catch up within
+``read_consistency_timeout_seconds``, the read fails with 503 rather than
+returning data that is missing the write.
+"""
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Depends, Header, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.database import get_session
+from app.core.tenant import get_tenant_id
+from app.models.event_store import SubscriptionModel
+from app.projections.progress import projection_progress
+from app.projections.registry import LIVE_LANE, subscription_id_for
+
+
+async def wait_for_min_position(
+    min_position: Optional[int] = Query(default=None, ge=0),
+    x_min_position: Optional[int] = Header(default=None, ge=0),
+    session: AsyncSession = Depends(get_session),
+    tenant_id: UUID = Depends(get_tenant_id),
+) -> None:
+    position = max(min_position or 0, x_min_position or 0)
+    if not position:
+        return
+    subscription_id = subscription_id_for(tenant_id, LIVE_LANE)
+
+    async def read_checkpoint() -> int:
+        result = await session.execute(
+            select(SubscriptionModel.last_position).where(SubscriptionModel.subscription_id == subscription_id)
+        )
+        current = int(result.scalar_one_or_none() or 0)
+        # Don't sit idle in a transaction between polls.
+        await session.rollback()
+        return current
+
+    timeout = get_settings().read_consistency_timeout_seconds
+    if not await projection_progress.wait_for(subscription_id, position, timeout, read_checkpoint):
+        raise HTTPException(
+            status_code=503,
+            detail=f"read models have not reached position {position}",
+            headers={"Retry-After": "1"},
+        )
@@ -0,0 +1,73 @@
+"""Largest-Triangle-Three-Buckets downsampling for time series responses.
+
+LTTB keeps the first and last points and, from each of ``target - 2``
+equal-count buckets in between, the point forming the largest triangle with
+the point kept from the previous bucket and the mean of the next bucket.
+Peaks and troughs survive; flat stretches collapse.
+
+Lanes with no numeric value to preserve (locations, attachments, untyped
+events) are thinned by ``uniform_time_indices`` instead, which keeps the
+points nearest evenly spaced times.
+
+The selection is plain Python. Each bucket's choice depends on the point
+kept from the one before, so it cannot be vectorized across buckets, and
+one pass over a series of tens of thousands of points is cheap next to
+reading it from the database.
+"""
+from bisect import bisect_left
+from typing import Sequence
+
+
+def lttb_indices(xs: Sequence[float], ys: Sequence[float], target: int) -> list[int]:
+    """Indexes of the points to keep, in order; all of them when ``target`` >= len."""
+    count = len(xs)
+    if target >= count or target < 3:
+        return list(range(count))
+    kept = [0]
+    a = 0
+    for bucket in range(target - 2):
+        start, end = _bucket_bounds(count, target, bucket)
+        next_start, next_end = _bucket_bounds(count, target, bucket + 1)
+        if bucket == target - 3:
+            next_start, next_end = count - 1, count
+        span = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / span
+        avg_y = sum(ys[next_start:next_end]) / span
+
+        ax, ay = xs[a], ys[a]
+        best, best_area = start, -1.0
+        for index in range(start, end):
+            area = abs((ax - avg_x) * (ys[index] - ay) - (ax - xs[index]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = index, area
+        kept.append(best)
+        a = best
+    kept.append(count - 1)
+    return kept
+
+
+def uniform_time_indices(xs: Sequence[float], target: int) -> list[int]:
+    """Indexes of the points nearest ``target`` evenly spaced times, in order.
+
+    ``xs`` must be sorted. The first and last points are always kept; points
+    bunched together in time collapse to one, so fewer than ``target`` may
+    come back.
+    """
+    count = len(xs)
+    if target >= count or target < 3:
+        return list(range(count))
+    first, step = xs[0], (xs[-1] - xs[0]) / (target - 1)
+    kept = {0, count - 1}
+    for k in range(1, target - 1):
+        at = first + k * step
+        index = bisect_left(xs, at, 1, count - 1)
+        if at - xs[index - 1] <= xs[index] - at:
+            index -= 1
+        kept.add(index)
+    return sorted(kept)
+
+
+def _bucket_bounds(count: int, target: int, bucket: int) -> tuple[int, int]:
+    every = (count - 2) / (target - 2)
+    return int(bucket * every) + 1, min(int((bucket + 1) * every) + 1, count - 1)
+
@@ -0,0 +1,57 @@
+"""Sparse fieldsets: ``fields=a,b`` returns only those keys of each payload.
+
+The projection runs in SQL. Each requested key is read with the JSON ``->``
+operator, which both PostgreSQL and SQLite (3.38+) evaluate to the value's
+JSON text, or NULL when the payload lacks the key. The texts are spliced
+into one object per row without decoding, so a list view that skips a
+bulky key such as ``legacy_fields`` never reads it out of the database.
+
+Keys missing from a payload are left out of its object. Field names are
+top-level keys made of letters, digits and underscores; SQLite would read
+other characters as JSON path syntax. On SQLite older than 3.38, which has
+no ``->``, a ``fields`` request is answered with 501.
+"""
+import re
+import sqlite3
+from typing import Optional, Sequence
+
+from fastapi import Depends, HTTPException, Query
+from sqlalchemy import Text, cast, literal
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.raw_json import dumps, raw_data
+from app.core.database import get_session
+
+MAX_FIELDS = 50
+MIN_SQLITE_VERSION = (3, 38, 0)
+_FIELD = re.compile(r"^[A-Za-z_][A-Za-z0-9_]{0,99}$")
+
+
+def parse_fields(
+    fields: Optional[str] = Query(default=None, max_length=2000, description="Comma-separated payload keys"),
+    session: AsyncSession = Depends(get_session),
+) -> Optional[list[str]]:
+    if fields is None:
+        return None
+    names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    if not names or len(names) > MAX_FIELDS or not all(_FIELD.match(name) for name in names):
+        raise HTTPException(status_code=400, detail="invalid fields")
+    if session.get_bind().dialect.name == "sqlite" and sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+        raise HTTPException(status_code=501, detail="fields requires SQLite 3.38 or later")
+    return names
+
+
+def data_columns(model, fields: Optional[list[str]]) -> list:
+    """Columns reading ``model.data`` as JSON text: whole, or one per field."""
+    if fields is None:
+        return [raw_data(model)]
+    return [cast(model.data.op("->")(literal(name, Text)), Text) for name in fields]
+
+
+def data_text(fields: Optional[list[str]], values: Sequence[Optional[str]]) -> str:
+    """The payload text for one row, from the values ``data_columns`` selected."""
+    if fields is None:
+        # The whole payload column is NOT NULL.
+        return values[0] or "{}"
+    pairs = [dumps(name).decode() + ":" + value for name, value in zip(fields, values) if value is not None]
+    return "{" + ",".join(pairs) + "}"
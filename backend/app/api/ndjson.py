@@ -0,0 +1,57 @@
+"""Newline-delimited JSON responses for large read-model results.
+
+A client sending ``Accept: application/x-ndjson`` gets one JSON document
+per line instead of an ``{"items": [...]}`` envelope. Rows come from a
+server-side cursor (``yield_per``) and each partition is encoded and
+written before the next is fetched, so memory stays bounded by the
+partition size rather than the admission's history. The request session
+stays open until the body has been sent.
+"""
+import json
+from typing import Any, AsyncIterator, Callable, Iterable
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+STREAM_PARTITION_ROWS = 500
+
+
+def wants_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_rows(
+    session: AsyncSession,
+    query,
+    encode: Callable[[Any], Any],
+    headers: dict[str, str] | None = None,
+    first: Iterable[Any] = (),
+) -> StreamingResponse:
+    """Stream ``encode(row)`` for each row ``query`` selects, one line per row.
+
+    ``first`` holds already-encoded items sent ahead of the rows.
+    """
+
+    async def lines() -> AsyncIterator[bytes]:
+        if first:
+            yield _encode_lines(first)
+        result = await session.stream_scalars(query.execution_options(yield_per=STREAM_PARTITION_ROWS))
+        async for partition in result.partitions():
+            yield _encode_lines(encode(row) for row in partition)
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE, headers=headers)
+
+
+def ndjson_items(items: Iterable[Any], headers: dict[str, str] | None = None) -> StreamingResponse:
+    """Stream items that are already in memory, such as a downsampled series."""
+
+    async def lines() -> AsyncIterator[bytes]:
+        yield _encode_lines(items)
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE, headers=headers)
+
+
+def _encode_lines(items: Iterable[Any]) -> bytes:
+    return b"".join(json.dumps(item, separators=(",", ":")).encode() + b"\n" for item in items)
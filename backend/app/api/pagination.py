@@ -0,0 +1,33 @@
+"""Opaque keyset cursors for list endpoints.
+
+A cursor is the sort key of the last row on a page, JSON-encoded and
+base64url'd. The next page is read with ``key > cursor`` on an index, so
+every page costs the same no matter how deep it is.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    raw = json.dumps([created_at.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(status_code=400, detail="invalid cursor") from exc
+
+
+def page_response(items: list[Any], rows: list[Any], limit: int, offset: int) -> dict[str, Any]:
+    """List payload for a query that fetched ``limit + 1`` rows."""
+    next_cursor = encode_cursor(rows[limit - 1].created_at, rows[limit - 1].id) if len(rows) > limit else None
+    return {"items": items[:limit], "limit": limit, "offset": offset, "next_cursor": next_cursor}
@@ -0,0 +1,64 @@
+"""Pass stored JSON payloads through to responses without decoding them.
+
+Read-model rows keep their payload in a JSON ``data`` column. Selecting the
+ORM row makes the driver decode it into dicts, and FastAPI then walks and
+re-encodes those dicts for the response. ``raw_data(model)`` selects the
+column as text instead (``CAST(data AS TEXT)``), and ``splice`` writes that
+text into the body verbatim; only the small envelope around it is encoded.
+
+orjson is in requirements.txt and encodes the envelope. The import is still
+optional: without it ``dumps`` falls back to the standard ``json`` module
+with compact separators, which produces the same JSON, only more slowly.
+
+Use it where a route returns ``data`` unchanged. Routes that read into the
+payload (series, downsampling) still select rows.
+"""
+import json
+from typing import Any
+
+from fastapi import Response
+from sqlalchemy import Text, cast
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+
+def raw_data(model):
+    """The model's ``data`` column as JSON text, labelled ``data``."""
+    return cast(model.data, Text).label("data")
+
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def splice(payload: dict[str, Any], *raw_keys: str) -> bytes:
+    """Encode ``payload``, writing the values under ``raw_keys`` verbatim.
+
+    A raw value is one JSON document as text, or a list of them, written
+    as an array.
+    """
+    parts = []
+    for key, value in payload.items():
+        if key not in raw_keys:
+            parts.append(dumps(key) + b":" + dumps(value))
+        elif isinstance(value, str):
+            parts.append(dumps(key) + b":" + value.encode())
+        else:
+            parts.append(dumps(key) + b":[" + ",".join(value).encode() + b"]")
+    return b"{" + b",".join(parts) + b"}"
+
+
+class RawJSONResponse(Response):
+    """JSON response whose content is either an encoded body or a value to encode."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
@@ -0,0 +1,121 @@
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import distinct, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.consistency import wait_for_min_position
+from app.core.database import get_session
+from app.core.tenant import get_tenant_id
+from app.models.read_models import CareTeamAssignmentModel
+from app.projections.read_model_projections import clinician_key
+
+router = APIRouter(prefix="/api/v1", tags=["care-team"], dependencies=[Depends(wait_for_min_position)])
+
+
+@router.get("/care-team/clinicians/{clinician}/admissions")
+async def list_clinician_admissions(
+    clinician: str,
+    role: Optional[str] = Query(default=None),
+    location: Optional[str] = Query(default=None),
+    at: Optional[datetime] = Query(default=None),
+    current: bool = Query(default=False),
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    session: AsyncSession = Depends(get_session),
+    tenant_id: UUID = Depends(get_tenant_id),
+) -> dict[str, Any]:
+    """Admissions a clinician is on the team for ("my patients").
+
+    ``current`` keeps only open assignments; ``at`` keeps the ones covering
+    that moment.
+    """
+    query = select(CareTeamAssignmentModel).where(
+        CareTeamAssignmentModel.tenant_id == tenant_id,
+        CareTeamAssignmentModel.clinician_key == clinician_key(clinician),
+        CareTeamAssignmentModel.active.is_(True),
+    )
+    if role:
+        query = query.where(CareTeamAssignmentModel.role == role.lower())
+    if location:
+        query = query.where(CareTeamAssignmentModel.location == location)
+    if current:
+        query = query.where(CareTeamAssignmentModel.end_at.is_(None))
+    if at is not None:
+        query = query.where(
+            CareTeamAssignmentModel.start_at <= at,
+            or_(CareTeamAssignmentModel.end_at.is_(None), CareTeamAssignmentModel.end_at > at),
+        )
+    query = query.order_by(CareTeamAssignmentModel.start_at.desc()).limit(limit).offset(offset)
+
+    result = await session.execute(query)
+    items = [_assignment(row) for row in result.scalars().all()]
+    return {"items": items, "limit": limit, "offset": offset}
+
+
+@router.get("/care-team/workload")
+async def get_care_team_workload(
+    role: Optional[str] = Query(default=None),
+    location: Optional[str] = Query(default=None),
+    session: AsyncSession = Depends(get_session),
+    tenant_id: UUID = Depends(get_tenant_id),
+) -> dict[str, Any]:
+    """Open admissions per clinician and role, busiest first."""
+    admissions = func.count(distinct(CareTeamAssignmentModel.admission_id))
+    query = (
+        select(
+            CareTeamAssignmentModel.clinician_key,
+            func.max(CareTeamAssignmentModel.clinician_name),
+            CareTeamAssignmentModel.role,
+            admissions,
+        )
+        .where(
+            CareTeamAssignmentModel.tenant_id == tenant_id,
+            CareTeamAssignmentModel.active.is_(True),
+            CareTeamAssignmentModel.end_at.is_(None),
+        )
+        .group_by(CareTeamAssignmentModel.clinician_key, CareTeamAssignmentModel.role)
+        .order_by(admissions.desc(), CareTeamAssignmentModel.clinician_key)
+    )
+    if role:
+        query = query.where(CareTeamAssignmentModel.role == role.lower())
+    if location:
+        query = query.where(CareTeamAssignmentModel.location == location)
+
+    result = await session.execute(query)
+    items = [
+        {"clinician": key, "name": name, "role": row_role, "admissions": count}
+        for key, name, row_role, count in result.all()
+    ]
+    return {"items": items}
+
+
+@router.get("/admissions/{admission_id}/care-team")
+async def get_admission_care_team(
+    admission_id: UUID,
+    session: AsyncSession = Depends(get_session),
+    tenant_id: UUID = Depends(get_tenant_id),
+) -> dict[str, Any]:
+    result = await session.execute(
+        select(CareTeamAssignmentModel)
+        .where(CareTeamAssignmentModel.tenant_id == tenant_id)
+        .where(CareTeamAssignmentModel.admission_id == admission_id)
+        .where(CareTeamAssignmentModel.active.is_(True))
+        .order_by(CareTeamAssignmentModel.start_at, CareTeamAssignmentModel.role)
+    )
+    return {"admission_id": str(admission_id), "items": [_assignment(r) for r in result.scalars().all()]}
+
+
+def _assignment(row: CareTeamAssignmentModel) -> dict[str, Any]:
+    return {
+        "admission_id": str(row.admission_id),
+        "clinician": row.clinician_key,
+        "name": row.clinician_name,
+        "role": row.role,
+        "location": row.location,
+        "source": row.source,
+        "start_at": row.start_at.isoformat(),
+        "end_at": row.end_at.isoformat() if row.end_at else None,
+    }
@@ -0,0 +1,135 @@
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.consistency import wait_for_min_position
+from app.core.database import get_session
+from app.core.tenant import get_tenant_id
+from app.models.read_models import (
+    CensusOccupantModel,
+    TrajectorySegmentModel,
+    UnitCensusModel,
+)
+
+router = APIRouter(prefix="/api/v1", tags=["census"], dependencies=[Depends(wait_for_min_position)])
+
+MAX_HOURLY_WINDOW = timedelta(days=31)
+
+
+@router.get("/census")
+async def list_census(
+    session: AsyncSession = Depends(get_session),
+    tenant_id: UUID = Depends(get_tenant_id),
+) -> dict[str, Any]:
+    result = await session.execute(
+        select(UnitCensusModel)
+        .where(UnitCensusModel.tenant_id == tenant_id)
+        .order_by(UnitCensusModel.location)
+    )
+    rows = result.scalars().all()
+    return {"items": [{"location": r.location, "occupancy": r.occupancy} for r in rows]}
+
+
+@router.get("/census/{location}")
+async def get_unit_census(
+    location: str,
+    at: Optional[datetime] = Query(default=None),
+    session: AsyncSession = Depends(get_session),
+    tenant_id: UUID = Depends(get_tenant_id),
+) -> dict[str, Any]:
+    if at is None:
+        census = await session.get(UnitCensusModel, (tenant_id, location))
+        result = await session.execute(
+            select(CensusOccupantModel)
+            .where(CensusOccupantModel.tenant_id == tenant_id)
+            .where(CensusOccupantModel.location == location)
+            .order_by(CensusOccupantModel.since)
+        )
+        occupants = [
+            {"admission_id": str(r.admission_id), "since": r.since.isoformat()}
+            for r in result.scalars().all()
+        ]
+        return {
+            "location": location,
+            "occupancy": census.occupancy if census else 0,
+            "occupants": occupants,
+        }
+
+    spans = await _spans_overlapping(session, tenant_id, location, at, at)
+    spans_out: list[dict[str, str | None]] = [
+        {
+            "admission_id": str(r.admission_id),
+            "since": r.start_at.isoformat(),
+            "until": r.end_at.isoformat() if r.end_at else None,
+        }
+        for r in spans
+    ]
+    return {"location": location, "at": at.isoformat(), "occupancy": len(spans_out), "occupants": spans_out}
+
+
+@router.get("/census/{location}/hourly")
+async def get_unit_census_hourly(
+    location: str,
+    from_: datetime = Query(alias="from"),
+    to: datetime = Query(),
+    session: AsyncSession = Depends(get_session),
+    tenant_id: UUID = Depends(get_tenant_id),
+) -> dict[str, Any]:
+    start = _as_utc(from_).replace(minute=0, second=0, microsecond=0)
+    end = _as_utc(to)
+    if end <= start or end - start > MAX_HOURLY_WINDOW:
+        raise HTTPException(status_code=400, detail="window must be positive and at most 31 days")
+
+    spans = await _spans_overlapping(session, tenant_id, location, start, end)
+    # A span covers an hour mark when start <= hour < end, so occupancy is the
+    # number of starts at or before the mark minus the ends at or before it.
+    starts = sorted(_as_utc(r.start_at) for r in spans)
+    ends = sorted(_as_utc(r.end_at) for r in spans if r.end_at is not None)
+
+    items = []
+    hour = start
+    while hour < end:
+        occupancy = bisect_right(starts, hour) - bisect_right(ends, hour)
+        items.append({"hour": hour.isoformat(), "occupancy": occupancy})
+        hour += timedelta(hours=1)
+    return {"location": location, "items": items}
+
+
+async def _spans_overlapping(
+    session: AsyncSession,
+    tenant_id: UUID,
+    location: str,
+    start: datetime,
+    end: datetime,
+) -> list[TrajectorySegmentModel]:
+    """Active segments for a unit that overlap [start, end].
+
+    On PostgreSQL the range predicate is served by the GiST interval index;
+    elsewhere the (tenant, location, end_at) index bounds the scan.
+    """
+    query = select(TrajectorySegmentModel).where(
+        TrajectorySegmentModel.tenant_id == tenant_id,
+        TrajectorySegmentModel.location == location,
+        TrajectorySegmentModel.active.is_(True),
+    )
+    if session.get_bind().dialect.name == "postgresql":
+        span = func.tstzrange(TrajectorySegmentModel.start_at, TrajectorySegmentModel.end_at)
+        query = query.where(span.op("&&")(func.tstzrange(start, end, "[]")))
+    else:
+        query = query.where(
+            and_(
+                TrajectorySegmentModel.start_at <= end,
+                or_(TrajectorySegmentModel.end_at.is_(None), TrajectorySegmentModel.end_at > start),
+            )
+        )
+    result = await session.execute(query.order_by(TrajectorySegmentModel.start_at))
+    return list(result.scalars().all())
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
@@ -0,0 +1,94 @@
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import String, Text, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.consistency import wait_for_min_position
+from app.core.database import get_session
+from app.core.tenant import get_tenant_id
+from app.models.read_models import CLINICAL_KIND_MODELS, CareTeamAssignmentModel
+from app.projections.read_model_projections import CLINICAL_KIND_FIELDS, clinician_key
+
+router = APIRouter(prefix="/api/v1", tags=["clinical"], dependencies=[Depends(wait_for_min_position)])
+
+RESERVED_PARAMS = {"admission_id", "from", "to", "clinician", "role", "min_score", "max_score", "limit", "offset", "min_position"}
+
+
+@router.get("/clinical/{kind}")
+async def list_clinical_kind(
+    kind: str,
+    request: Request,
+    admission_id: Optional[UUID] = Query(default=None),
+    from_: Optional[datetime] = Query(default=None, alias="from"),
+    to: Optional[datetime] = Query(default=None),
+    clinician: Optional[str] = Query(default=None),
+    role: Optional[str] = Query(default=None),
+    min_score: Optional[float] = Query(default=None),
+    max_score: Optional[float] = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    session: AsyncSession = Depends(get_session),
+    tenant_id: UUID = Depends(get_tenant_id),
+) -> dict[str, Any]:
+    """Rows of one clinical event kind from its typed table.
+
+    Any short promoted column can be matched exactly as a query parameter
+    (``?outcome=Good``, ``?therapy_type=ECMO&status=Active``); parameters
+    that name no column of this kind are ignored, as on other routes.
+    ``clinician`` (with an optional ``role``) limits rows to admissions on
+    that clinician's care team.
+    """
+    model = CLINICAL_KIND_MODELS.get(kind)
+    if model is None:
+        return {"detail": "not found"}
+    table = model.__table__
+
+    query = select(model).where(model.tenant_id == tenant_id)
+    for name, value in request.query_params.items():
+        if name in RESERVED_PARAMS or name not in CLINICAL_KIND_FIELDS[kind]:
+            continue
+        # Short promoted columns only; free text (Text) is not indexed.
+        column_type = table.c[name].type
+        if not isinstance(column_type, String) or isinstance(column_type, Text):
+            raise HTTPException(status_code=400, detail=f"cannot filter {kind} by {name}")
+        query = query.where(table.c[name] == value)
+
+    if admission_id is not None:
+        query = query.where(model.admission_id == admission_id)
+    if from_ is not None:
+        query = query.where(model.occurred_at >= from_)
+    if to is not None:
+        query = query.where(model.occurred_at < to)
+    if min_score is not None or max_score is not None:
+        if "score_value" not in table.c:
+            raise HTTPException(status_code=400, detail=f"{kind} has no score")
+        if min_score is not None:
+            query = query.where(table.c.score_value >= min_score)
+        if max_score is not None:
+            query = query.where(table.c.score_value <= max_score)
+    if clinician:
+        team = select(CareTeamAssignmentModel.admission_id).where(
+            CareTeamAssignmentModel.tenant_id == tenant_id,
+            CareTeamAssignmentModel.clinician_key == clinician_key(clinician),
+            CareTeamAssignmentModel.active.is_(True),
+        )
+        if role:
+            team = team.where(CareTeamAssignmentModel.role == role.lower())
+        query = query.where(model.admission_id.in_(team))
+
+    query = query.order_by(model.occurred_at, model.id).limit(limit).offset(offset)
+    result = await session.execute(query)
+    columns = [column.name for column in table.columns if column.name != "tenant_id"]
+    items = [{name: _jsonable(getattr(row, name)) for name in columns} for row in result.scalars().all()]
+    return {"items": items, "limit": limit, "offset": offset}
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
@@ -20,6 +20,7 @@ class AdmissionCreate(BaseModel):
     admit_date: datetime
     chief_complaint: str | None = None
     admission_type: str | None = None
+    review_date: datetime | None = None
     created_by: UUID
 
 
@@ -30,6 +31,7 @@ class LocationChange(BaseModel):
     to_bed: str | None = None
     effective_at: datetime
     reason: str | None = None
+    teams: dict[str, list[dict[str, Any]]] | None = None
     created_by: UUID
 
 
@@ -59,6 +61,7 @@ async def create_admission(
             "admit_date": payload.admit_date.isoformat(),
             "chief_complaint": payload.chief_complaint,
             "admission_type": payload.admission_type,
+            **({"review_date": payload.review_date.isoformat()} if payload.review_date else {}),
         },
         metadata={},
         created_by=payload.created_by,
@@ -70,7 +73,7 @@ async def create_admission(
         expected_version=None,
     )
     await session.commit()
-    return {"new_version": new_version}
+    return {"new_version": new_version, "global_position": event_store.last_position}
 
 
 @router.post("/admissions/{admission_id}/location")
@@ -91,6 +94,7 @@ async def change_location(
             "to_bed": payload.to_bed,
             "effective_at": payload.effective_at.isoformat(),
             "reason": payload.reason,
+            **({"teams": payload.teams} if payload.teams else {}),
         },
         metadata={},
         created_by=payload.created_by,
@@ -102,7 +106,7 @@ async def change_location(
         expected_version=None,
     )
     await session.commit()
-    return {"new_version": new_version}
+    return {"new_version": new_version, "global_position": event_store.last_position}
 
 
 @router.post("/clinical-events")
@@ -131,4 +135,4 @@ async def record_clinical_event(
         expected_version=None,
     )
     await session.commit()
-    return {"new_version": new_version}
+    return {"new_version": new_version, "global_position": event_store.last_position}
@@ -28,6 +28,8 @@ class EventAppendRequest(BaseModel):
 
 class EventAppendResponse(BaseModel):
     new_version: int
+    # Pass as ``min_position`` to read endpoints to read this write.
+    global_position: Optional[int] = None
 
 
 @router.post("/events", response_model=EventAppendResponse)
@@ -55,4 +57,4 @@ async def append_events(
     )
 
     await session.commit()
-    return EventAppendResponse(new_version=new_version)
+    return EventAppendResponse(new_version=new_version, global_position=event_store.last_position)
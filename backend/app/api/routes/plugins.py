@@ -1,6 +1,13 @@
-from fastapi import APIRouter
+from typing import Any, Optional
+from uuid import UUID
 
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_session
 from app.core.plugins.registry import plugin_registry
+from app.core.tenant import get_tenant_id
 
 router = APIRouter(prefix="/api/v1", tags=["plugins"])
 
@@ -23,3 +30,39 @@ async def get_specialty_config(name: str) -> dict:
     if not plugin:
         return {"detail": "not found"}
     return plugin.manifest.get("spec", {}).get("ui", {})
+
+
+@router.get("/specialties/{name}/projections/{projection}")
+async def list_specialty_projection_rows(
+    name: str,
+    projection: str,
+    admission_id: Optional[UUID] = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    session: AsyncSession = Depends(get_session),
+    tenant_id: UUID = Depends(get_tenant_id),
+) -> dict[str, Any]:
+    compiled = plugin_registry.get_projection(name, projection)
+    if not compiled:
+        return {"detail": "not found"}
+
+    table = compiled.table
+    query = select(table).where(table.c.tenant_id == tenant_id)
+    if admission_id is not None and "admission_id" in table.c:
+        query = query.where(table.c.admission_id == admission_id)
+    query = query.order_by(*table.primary_key.columns).limit(limit).offset(offset)
+
+    result = await session.execute(query)
+    items = [
+        {key: _jsonable(value) for key, value in row.items() if key != "tenant_id"}
+        for row in result.mappings().all()
+    ]
+    return {"items": items, "limit": limit, "offset": offset}
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
@@ -0,0 +1,26 @@
+from typing import Any
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_session
+from app.core.tenant import get_tenant_id
+from app.infrastructure.response_cache import response_cache
+from app.projections.status import projection_status
+
+router = APIRouter(prefix="/api/v1/projections", tags=["projections"])
+
+
+@router.get("/metrics")
+async def get_projection_metrics(
+    session: AsyncSession = Depends(get_session),
+    tenant_id: UUID = Depends(get_tenant_id),
+) -> dict[str, Any]:
+    return await projection_status(session, tenant_id)
+
+
+@router.get("/response-cache")
+async def get_response_cache_stats() -> dict[str, Any]:
+    """Hit ratio and memory of this API process's read-model response cache."""
+    return response_cache.stats()
@@ -1,10 +1,23 @@
-from typing import Any, Optional
+import json
+import math
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Optional, Sequence
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import Select, SQLColumnExpression, and_, case, literal, or_, select, tuple_, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.caching import CachedResponse, admission_cache, patient_cache
+from app.api.consistency import wait_for_min_position
+from app.api.downsample import lttb_indices, uniform_time_indices
+from app.api.etags import admission_etag, checkpoint_etag
+from app.api.fieldsets import data_columns, data_text, parse_fields
+from app.api.ndjson import STREAM_PARTITION_ROWS, ndjson_items, ndjson_rows, wants_ndjson
+from app.api.pagination import decode_cursor, page_response
+from app.api.raw_json import RawJSONResponse, raw_data, splice
 from app.core.database import get_session
 from app.core.tenant import get_tenant_id
 from app.models.read_models import (
@@ -14,121 +27,585 @@ from app.models.read_models import (
     TimelineEventModel,
     TrajectoryPointModel,
     AttachmentReadModel,
+    AdmissionSummaryModel,
+    TrajectorySegmentModel,
 )
+from app.models.types import GUID
 
-router = APIRouter(prefix="/api/v1", tags=["read-models"])
+router = APIRouter(prefix="/api/v1", tags=["read-models"], dependencies=[Depends(wait_for_min_position)])
 
+MAX_BATCH_ADMISSIONS = 300
+MAX_SERIES_POINTS = 10000
 
-@router.get("/patients")
+
+class TimelineBatchRequest(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    admission_ids: list[UUID] = Field(min_length=1, max_length=MAX_BATCH_ADMISSIONS)
+    from_: Optional[datetime] = Field(default=None, alias="from")
+    to: Optional[datetime] = None
+    # Per lane and admission; lanes are thinned evenly in time.
+    points: Optional[int] = Field(default=None, ge=3, le=MAX_SERIES_POINTS)
+
+
+@router.get("/patients", dependencies=[Depends(checkpoint_etag)], response_model=None)
 async def list_patients(
+    response: Response,
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(default=None),
+    fields: Optional[list[str]] = Depends(parse_fields),
     session: AsyncSession = Depends(get_session),
     tenant_id: UUID = Depends(get_tenant_id),
-) -> dict[str, Any]:
-    result = await session.execute(
-        select(PatientReadModel)
-        .where(PatientReadModel.tenant_id == tenant_id)
-        .offset(offset)
-        .limit(limit)
+) -> Response | dict[str, Any]:
+    """Patients in (created_at, id) order; pass ``next_cursor`` back as ``cursor``.
+
+    ``fields`` limits each payload to the named keys.
+    """
+    query = select(PatientReadModel.created_at, PatientReadModel.id, *data_columns(PatientReadModel, fields)).where(
+        PatientReadModel.tenant_id == tenant_id
     )
-    rows = result.scalars().all()
-    return {"items": [r.data for r in rows], "limit": limit, "offset": offset}
+    rows = await _page(session, query, PatientReadModel, limit, offset, cursor)
+    body = splice(page_response([data_text(fields, r[2:]) for r in rows], rows, limit, offset), "items")
+    return RawJSONResponse(body, headers=dict(response.headers))
 
 
-@router.get("/patients/{patient_id}")
+@router.get("/patients/{patient_id}", dependencies=[Depends(checkpoint_etag)], response_model=None)
 async def get_patient(
     patient_id: UUID,
+    fields: Optional[list[str]] = Depends(parse_fields),
     session: AsyncSession = Depends(get_session),
     tenant_id: UUID = Depends(get_tenant_id),
-) -> dict[str, Any]:
+    cache: CachedResponse = Depends(patient_cache),
+) -> Response | dict[str, Any]:
+    cached = await cache.get()
+    if cached is not None:
+        return cached
     result = await session.execute(
-        select(PatientReadModel)
+        select(*data_columns(PatientReadModel, fields))
         .where(PatientReadModel.tenant_id == tenant_id)
         .where(PatientReadModel.id == patient_id)
     )
-    row = result.scalar_one_or_none()
-    if row is None:
-        return {"detail": "not found"}
-    return row.data
+    row = result.one_or_none()
+    return await cache.put(data_text(fields, row).encode() if row is not None else {"detail": "not found"})
 
 
-@router.get("/admissions")
+@router.get("/admissions", dependencies=[Depends(checkpoint_etag)], response_model=None)
 async def list_admissions(
+    response: Response,
     patient_id: Optional[UUID] = Query(default=None),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(default=None),
+    fields: Optional[list[str]] = Depends(parse_fields),
     session: AsyncSession = Depends(get_session),
     tenant_id: UUID = Depends(get_tenant_id),
-) -> dict[str, Any]:
-    query = select(AdmissionReadModel).where(AdmissionReadModel.tenant_id == tenant_id)
+) -> Response | dict[str, Any]:
+    """Admissions in (created_at, id) order; pass ``next_cursor`` back as ``cursor``.
+
+    ``fields`` limits each payload to the named keys.
+    """
+    query = select(
+        AdmissionReadModel.created_at, AdmissionReadModel.id, *data_columns(AdmissionReadModel, fields)
+    ).where(AdmissionReadModel.tenant_id == tenant_id)
     if patient_id:
         query = query.where(AdmissionReadModel.patient_id == patient_id)
-    result = await session.execute(query.offset(offset).limit(limit))
-    rows = result.scalars().all()
-    return {"items": [r.data for r in rows], "limit": limit, "offset": offset}
+    rows = await _page(session, query, AdmissionReadModel, limit, offset, cursor)
+    body = splice(page_response([data_text(fields, r[2:]) for r in rows], rows, limit, offset), "items")
+    return RawJSONResponse(body, headers=dict(response.headers))
 
 
-@router.get("/flightplans/{flightplan_id}")
+@router.get("/flightplans/{flightplan_id}", dependencies=[Depends(checkpoint_etag)], response_model=None)
 async def get_flightplan(
     flightplan_id: UUID,
+    response: Response,
     session: AsyncSession = Depends(get_session),
     tenant_id: UUID = Depends(get_tenant_id),
-) -> dict[str, Any]:
+) -> Response | dict[str, Any]:
     result = await session.execute(
-        select(FlightPlanReadModel)
+        select(raw_data(FlightPlanReadModel))
         .where(FlightPlanReadModel.tenant_id == tenant_id)
         .where(FlightPlanReadModel.id == flightplan_id)
     )
-    row = result.scalar_one_or_none()
-    if row is None:
+    data = result.scalar_one_or_none()
+    if data is None:
         return {"detail": "not found"}
-    return row.data
+    return RawJSONResponse(data.encode(), headers=dict(response.headers))
 
 
-@router.get("/admissions/{admission_id}/timeline")
+@router.get("/admissions/{admission_id}/timeline", dependencies=[Depends(admission_etag)], response_model=None)
 async def get_timeline(
     admission_id: UUID,
+    request: Request,
+    response: Response,
+    from_: Optional[datetime] = Query(default=None, alias="from"),
+    to: Optional[datetime] = Query(default=None),
+    points: Optional[int] = Query(default=None, ge=3, le=MAX_SERIES_POINTS),
+    value: Optional[str] = Query(default=None, max_length=200),
     session: AsyncSession = Depends(get_session),
     tenant_id: UUID = Depends(get_tenant_id),
-) -> dict[str, Any]:
-    result = await session.execute(
+    cache: CachedResponse = Depends(admission_cache),
+) -> Response | dict[str, Any]:
+    """Clinical events in time order, optionally windowed to ``[from, to)``.
+
+    ``value`` names a numeric field of the event data and returns only the
+    events carrying it, as a series. ``points`` downsamples to at most that
+    many items: with LTTB, keeping peaks and troughs of the ``value`` series,
+    or evenly in time without one. The response then also carries ``total``.
+    """
+    query = (
         select(TimelineEventModel)
         .where(TimelineEventModel.tenant_id == tenant_id)
         .where(TimelineEventModel.admission_id == admission_id)
-        .order_by(TimelineEventModel.occurred_at)
     )
-    rows = result.scalars().all()
-    return {"items": [r.data for r in rows]}
+    if from_ is not None:
+        query = query.where(TimelineEventModel.occurred_at >= from_)
+    if to is not None:
+        query = query.where(TimelineEventModel.occurred_at < to)
+    query = query.order_by(TimelineEventModel.occurred_at)
+    response.headers["Vary"] = "Accept"
+    ndjson = wants_ndjson(request)
+    if ndjson and points is None and value is None:
+        return ndjson_rows(session, query, lambda row: row.data, headers=dict(response.headers))
 
+    cached = None if ndjson else await cache.get()
+    if cached is not None:
+        return cached
+    if not ndjson and points is None and value is None:
+        texts = (await session.execute(query.with_only_columns(raw_data(TimelineEventModel)))).scalars().all()
+        return await cache.put(splice({"items": texts}, "items"))
+    rows = (await session.execute(query)).scalars().all()
+    series = _series(rows, lambda row: row.occurred_at, points, value)
+    # A series or downsample needs every row, so it is built in memory either way.
+    return ndjson_items(series["items"], headers=dict(response.headers)) if ndjson else await cache.put(series)
 
-@router.get("/admissions/{admission_id}/trajectory")
+
+@router.get("/admissions/{admission_id}/trajectory", dependencies=[Depends(admission_etag)], response_model=None)
 async def get_trajectory(
     admission_id: UUID,
+    request: Request,
+    response: Response,
+    from_: Optional[datetime] = Query(default=None, alias="from"),
+    to: Optional[datetime] = Query(default=None),
+    points: Optional[int] = Query(default=None, ge=3, le=MAX_SERIES_POINTS),
     session: AsyncSession = Depends(get_session),
     tenant_id: UUID = Depends(get_tenant_id),
-) -> dict[str, Any]:
-    result = await session.execute(
-        select(TrajectoryPointModel)
+    cache: CachedResponse = Depends(admission_cache),
+) -> Response | dict[str, Any]:
+    """Location steps in order, optionally windowed to ``[from, to)``.
+
+    A windowed trajectory starts with the last step before ``from``, which
+    is the location in effect when the window opens. ``points`` thins the
+    steps evenly in time, always keeping the first and last.
+    """
+    response.headers["Vary"] = "Accept"
+    ndjson = wants_ndjson(request)
+    cached = None if ndjson else await cache.get()
+    if cached is not None:
+        return cached
+    # Without thinning, the steps' data is passed through undecoded.
+    raw = points is None and not ndjson
+    admission_points = (
+        select(raw_data(TrajectoryPointModel) if raw else TrajectoryPointModel)
         .where(TrajectoryPointModel.tenant_id == tenant_id)
         .where(TrajectoryPointModel.admission_id == admission_id)
-        .order_by(TrajectoryPointModel.effective_at)
     )
-    rows = result.scalars().all()
-    return {"items": [r.data for r in rows]}
+    order = (TrajectoryPointModel.effective_at, TrajectoryPointModel.sequence)
+    query = admission_points
+    if from_ is not None:
+        query = query.where(TrajectoryPointModel.effective_at >= from_)
+    if to is not None:
+        query = query.where(TrajectoryPointModel.effective_at < to)
+    query = query.order_by(*order)
+    opening = []
+    if from_ is not None:
+        result = await session.execute(
+            admission_points.where(TrajectoryPointModel.effective_at < from_)
+            .order_by(*(column.desc() for column in order))
+            .limit(1)
+        )
+        opening = list(result.scalars().all())
+    if ndjson and points is None:
+        return ndjson_rows(
+            session, query, lambda row: row.data, headers=dict(response.headers), first=[row.data for row in opening]
+        )
+
+    rows = opening + list((await session.execute(query)).scalars().all())
+    if raw:
+        return await cache.put(splice({"items": rows}, "items"))
+    series = _series(rows, lambda row: row.effective_at, points)
+    return ndjson_items(series["items"], headers=dict(response.headers)) if ndjson else await cache.put(series)
 
 
-@router.get("/admissions/{admission_id}/attachments")
+@router.get("/admissions/{admission_id}/attachments", dependencies=[Depends(admission_etag)], response_model=None)
 async def get_attachments(
     admission_id: UUID,
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_session),
     tenant_id: UUID = Depends(get_tenant_id),
-) -> dict[str, Any]:
-    result = await session.execute(
+    cache: CachedResponse = Depends(admission_cache),
+) -> Response | dict[str, Any]:
+    query = (
         select(AttachmentReadModel)
         .where(AttachmentReadModel.tenant_id == tenant_id)
         .where(AttachmentReadModel.admission_id == admission_id)
         .order_by(AttachmentReadModel.occurred_at)
     )
-    rows = result.scalars().all()
-    return {"items": [r.data for r in rows]}
+    response.headers["Vary"] = "Accept"
+    if wants_ndjson(request):
+        return ndjson_rows(session, query, lambda row: row.data, headers=dict(response.headers))
+    cached = await cache.get()
+    if cached is not None:
+        return cached
+    texts = (await session.execute(query.with_only_columns(raw_data(AttachmentReadModel)))).scalars().all()
+    return await cache.put(splice({"items": texts}, "items"))
+
+
+@router.get("/admissions/{admission_id}/bundle", dependencies=[Depends(admission_etag)], response_model=None)
+async def get_admission_bundle(
+    admission_id: UUID,
+    session: AsyncSession = Depends(get_session),
+    tenant_id: UUID = Depends(get_tenant_id),
+    cache: CachedResponse = Depends(admission_cache),
+) -> Response | dict[str, Any]:
+    """Summary plus the location, event and attachment lanes in time order.
+
+    One statement, one round trip: the lanes are a UNION ALL merged and
+    ordered by the database, and both they and the summary are left-joined
+    to a one-row anchor on the admission id, so the first row carries the
+    summary even when the admission has no lane rows yet.
+
+    The response is ETag'd and cached on the admission watermark, so the
+    summary leaves out ``length_of_stay_days``, which moves with the clock;
+    clients derive it from ``admit_at`` and ``discharge_at``.
+    """
+    cached = await cache.get()
+    if cached is not None:
+        return cached
+    anchor = select(literal(admission_id, GUID()).label("admission_id")).subquery("anchor")
+    lanes = _lanes_query(tenant_id, [admission_id]).subquery()
+    result = await session.execute(
+        select(AdmissionSummaryModel, lanes.c.lane, lanes.c.at, lanes.c.data)
+        .select_from(anchor)
+        .outerjoin(
+            AdmissionSummaryModel,
+            and_(AdmissionSummaryModel.id == anchor.c.admission_id, AdmissionSummaryModel.tenant_id == tenant_id),
+        )
+        .outerjoin(lanes, lanes.c.admission_id == anchor.c.admission_id)
+        .order_by(lanes.c.at, lanes.c.lane_rank, lanes.c.sequence)
+    )
+    rows = result.all()
+    summary = rows[0][0]
+    items = [{"lane": lane, "at": _iso(at), "data": data} for _, lane, at, data in rows if lane is not None]
+    return await cache.put(
+        {
+            "admission_id": str(admission_id),
+            "summary": _projected_summary(summary) if summary else None,
+            "items": items,
+        }
+    )
+
+
+@router.post("/admissions/timelines")
+async def get_timelines_batch(
+    payload: TimelineBatchRequest,
+    session: AsyncSession = Depends(get_session),
+    tenant_id: UUID = Depends(get_tenant_id),
+) -> StreamingResponse:
+    """Timelines for many admissions, grouped per admission in request order.
+
+    The lanes are one UNION ALL of ``admission_id IN (...)`` selects, so a
+    ward view costs one query however many admissions it shows. The database
+    orders the rows by request position and time, and they are read through
+    a server-side cursor while the body streams: each admission is encoded
+    once its last row has arrived, so memory is bounded by the largest
+    admission rather than the ward.
+    """
+    admission_ids = list(dict.fromkeys(payload.admission_ids))
+    lanes = union_all(*_lane_selects(tenant_id, admission_ids, payload.from_, payload.to)).subquery()
+    request_order = case(
+        *((lanes.c.admission_id == admission_id, index) for index, admission_id in enumerate(admission_ids))
+    )
+    query = select(lanes.c.admission_id, lanes.c.lane, lanes.c.at, lanes.c.data).order_by(
+        request_order, lanes.c.at, lanes.c.lane_rank, lanes.c.sequence
+    )
+    return StreamingResponse(
+        _stream_timelines(session, query, admission_ids, payload.points),
+        media_type="application/json",
+    )
+
+
+@router.get("/admissions/{admission_id}/summary")
+async def get_admission_summary(
+    admission_id: UUID,
+    session: AsyncSession = Depends(get_session),
+    tenant_id: UUID = Depends(get_tenant_id),
+) -> dict[str, Any]:
+    result = await session.execute(
+        select(AdmissionSummaryModel)
+        .where(AdmissionSummaryModel.tenant_id == tenant_id)
+        .where(AdmissionSummaryModel.id == admission_id)
+    )
+    row = result.scalar_one_or_none()
+    if row is None:
+        return {"detail": "not found"}
+    return _summary_to_dict(row)
+
+
+@router.get("/admission-summaries")
+async def list_admission_summaries(
+    patient_id: Optional[UUID] = Query(default=None),
+    location: Optional[str] = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(default=None),
+    session: AsyncSession = Depends(get_session),
+    tenant_id: UUID = Depends(get_tenant_id),
+) -> dict[str, Any]:
+    """Summaries in (created_at, id) order; pass ``next_cursor`` back as ``cursor``."""
+    query = select(AdmissionSummaryModel).where(AdmissionSummaryModel.tenant_id == tenant_id)
+    if patient_id:
+        query = query.where(AdmissionSummaryModel.patient_id == patient_id)
+    if location:
+        query = query.where(AdmissionSummaryModel.current_location == location)
+    rows = [row[0] for row in await _page(session, query, AdmissionSummaryModel, limit, offset, cursor)]
+    return page_response([_summary_to_dict(r) for r in rows], rows, limit, offset)
+
+
+@router.get("/admissions/{admission_id}/segments", dependencies=[Depends(admission_etag)], response_model=None)
+async def get_trajectory_segments(
+    admission_id: UUID,
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_session),
+    tenant_id: UUID = Depends(get_tenant_id),
+    cache: CachedResponse = Depends(admission_cache),
+) -> Response | dict[str, Any]:
+    query = (
+        select(TrajectorySegmentModel)
+        .where(TrajectorySegmentModel.tenant_id == tenant_id)
+        .where(TrajectorySegmentModel.admission_id == admission_id)
+        .where(TrajectorySegmentModel.active.is_(True))
+        .order_by(
+            TrajectorySegmentModel.start_at,
+            TrajectorySegmentModel.sequence,
+            TrajectorySegmentModel.position,
+        )
+    )
+    response.headers["Vary"] = "Accept"
+    if wants_ndjson(request):
+        return ndjson_rows(session, query, _segment_to_dict, headers=dict(response.headers))
+    cached = await cache.get()
+    if cached is not None:
+        return cached
+    rows = (await session.execute(query)).scalars().all()
+    return await cache.put({"items": [_segment_to_dict(r) for r in rows]})
+
+
+@router.get("/admissions/{admission_id}/time-in-location")
+async def get_time_in_location(
+    admission_id: UUID,
+    from_: Optional[datetime] = Query(default=None, alias="from"),
+    to: Optional[datetime] = Query(default=None),
+    session: AsyncSession = Depends(get_session),
+    tenant_id: UUID = Depends(get_tenant_id),
+) -> dict[str, Any]:
+    query = (
+        select(TrajectorySegmentModel)
+        .where(TrajectorySegmentModel.tenant_id == tenant_id)
+        .where(TrajectorySegmentModel.admission_id == admission_id)
+        .where(TrajectorySegmentModel.active.is_(True))
+    )
+    if to is not None:
+        query = query.where(TrajectorySegmentModel.start_at < to)
+    if from_ is not None:
+        query = query.where(
+            or_(TrajectorySegmentModel.end_at.is_(None), TrajectorySegmentModel.end_at > from_)
+        )
+    result = await session.execute(query.order_by(TrajectorySegmentModel.start_at))
+
+    now = datetime.now(timezone.utc)
+    window_start = _as_utc(from_) if from_ else None
+    window_end = _as_utc(to) if to else now
+    hours: dict[str, float] = {}
+    for row in result.scalars().all():
+        start = _as_utc(row.start_at)
+        end = _as_utc(row.end_at) if row.end_at else now
+        if window_start and start < window_start:
+            start = window_start
+        end = min(end, window_end)
+        if end > start:
+            hours[row.location] = hours.get(row.location, 0.0) + (end - start).total_seconds() / 3600
+    return {"items": [{"location": location, "hours": round(value, 4)} for location, value in hours.items()]}
+
+
+def _summary_to_dict(row: AdmissionSummaryModel) -> dict[str, Any]:
+    length_of_stay_days = None
+    if row.admit_at is not None:
+        end = row.discharge_at or datetime.now(timezone.utc)
+        length_of_stay_days = (end.date() - row.admit_at.date()).days
+    summary = _projected_summary(row)
+    summary["length_of_stay_days"] = length_of_stay_days
+    return summary
+
+
+def _projected_summary(row: AdmissionSummaryModel) -> dict[str, Any]:
+    """Summary fields that change only when events are projected, so they can be ETag'd."""
+    return {
+        "admission_id": str(row.id),
+        "patient_id": str(row.patient_id) if row.patient_id else None,
+        "admit_at": _iso(row.admit_at),
+        "discharge_at": _iso(row.discharge_at),
+        "current_location": row.current_location,
+        "current_location_at": _iso(row.current_location_at),
+        "current_risk": row.current_risk,
+        "current_risk_at": _iso(row.current_risk_at),
+        "last_procedure_at": _iso(row.last_procedure_at),
+        "location_change_count": row.location_change_count,
+        "clinical_event_count": row.clinical_event_count,
+    }
+
+
+def _segment_to_dict(row: TrajectorySegmentModel) -> dict[str, Any]:
+    return {
+        "trajectory_id": str(row.id),
+        "admission_id": str(row.admission_id),
+        "location": row.location,
+        "start_at": _iso(row.start_at),
+        "end_at": _iso(row.end_at),
+        "duration_hours": row.duration_hours,
+        "sequence": row.sequence,
+        "corrects_point_id": str(row.corrects_point_id) if row.corrects_point_id else None,
+    }
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+async def _page(session: AsyncSession, query, model, limit: int, offset: int, cursor: Optional[str]) -> list:
+    # One extra row tells page_response whether another page exists.
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.where(tuple_(model.created_at, model.id) > (created_at, row_id))
+    elif offset:
+        query = query.offset(offset)
+    result = await session.execute(query.order_by(model.created_at, model.id).limit(limit + 1))
+    return list(result.all())
+
+
+async def _stream_timelines(
+    session: AsyncSession,
+    query: Select,
+    admission_ids: list[UUID],
+    points: Optional[int],
+) -> AsyncIterator[str]:
+    # Admissions without rows are written, empty, when the rows pass their turn.
+    waiting = iter(admission_ids)
+    current: UUID | None = None
+    rows: list[tuple] = []
+    separator = ""
+    yield '{"items":['
+    result = await session.stream(query.execution_options(yield_per=STREAM_PARTITION_ROWS))
+    async for partition in result.partitions():
+        groups = []
+        for admission_id, lane, at, data in partition:
+            if admission_id != current:
+                if current is not None:
+                    groups.append(_timeline_group(current, rows, points))
+                for skipped in waiting:
+                    if skipped == admission_id:
+                        break
+                    groups.append(_timeline_group(skipped, [], points))
+                current, rows = admission_id, []
+            rows.append((lane, at, data))
+        if groups:
+            yield separator + ",".join(groups)
+            separator = ","
+    groups = [_timeline_group(current, rows, points)] if current is not None else []
+    groups.extend(_timeline_group(skipped, [], points) for skipped in waiting)
+    yield (separator if groups else "") + ",".join(groups) + "]}"
+
+
+def _timeline_group(admission_id: UUID, rows: list[tuple], points: Optional[int]) -> str:
+    """One admission's merged lanes, each thinned evenly in time to ``points``."""
+    if points is not None:
+        by_lane: dict[str, list[int]] = {}
+        for index, (lane, _, _) in enumerate(rows):
+            by_lane.setdefault(lane, []).append(index)
+        keep: set[int] = set()
+        for indexes in by_lane.values():
+            xs = [_as_utc(rows[index][1]).timestamp() for index in indexes]
+            keep.update(indexes[kept] for kept in uniform_time_indices(xs, points))
+        rows = [row for index, row in enumerate(rows) if index in keep]
+    items = [{"lane": lane, "at": _iso(at), "data": data} for lane, at, data in rows]
+    return json.dumps({"admission_id": str(admission_id), "items": items})
+
+
+def _series(rows: Sequence[Any], at, points: Optional[int], value: Optional[str] = None) -> dict[str, Any]:
+    if value is not None:
+        pairs = [(row, number) for row in rows if (number := _number(row.data.get(value))) is not None]
+    else:
+        pairs = [(row, 0.0) for row in rows]
+    if points is None:
+        return {"items": [row.data for row, _ in pairs]}
+    xs = [_as_utc(at(row)).timestamp() for row, _ in pairs]
+    keep = uniform_time_indices(xs, points) if value is None else lttb_indices(xs, [y for _, y in pairs], points)
+    return {"items": [pairs[index][0].data for index in keep], "total": len(pairs)}
+
+
+def _number(value: Any) -> float | None:
+    if isinstance(value, bool):
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _lanes_query(tenant_id: UUID, admission_ids: list[UUID]):
+    """UNION ALL of the three timeline lanes for the given admissions."""
+    return union_all(*_lane_selects(tenant_id, admission_ids))
+
+
+def _lane_selects(
+    tenant_id: UUID,
+    admission_ids: list[UUID],
+    from_: Optional[datetime] = None,
+    to: Optional[datetime] = None,
+) -> list[Select]:
+    """One ``admission_id IN (...)`` select per timeline lane, with matching columns."""
+    lanes: list[
+        tuple[
+            str,
+            type[TrajectoryPointModel] | type[TimelineEventModel] | type[AttachmentReadModel],
+            SQLColumnExpression[datetime],
+            SQLColumnExpression[int],
+        ]
+    ] = [
+        ("locations", TrajectoryPointModel, TrajectoryPointModel.effective_at, TrajectoryPointModel.sequence),
+        ("events", TimelineEventModel, TimelineEventModel.occurred_at, literal(0)),
+        ("attachments", AttachmentReadModel, AttachmentReadModel.occurred_at, literal(0)),
+    ]
+    selects = []
+    for rank, (lane, model, at, sequence) in enumerate(lanes):
+        query = select(
+            model.admission_id.label("admission_id"),
+            literal(lane).label("lane"),
+            literal(rank).label("lane_rank"),
+            at.label("at"),
+            sequence.label("sequence"),
+            model.data.label("data"),
+        ).where(model.tenant_id == tenant_id, model.admission_id.in_(admission_ids))
+        if from_ is not None:
+            query = query.where(at >= from_)
+        if to is not None:
+            query = query.where(at < to)
+        selects.append(query)
+    return selects
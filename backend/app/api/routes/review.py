@@ -0,0 +1,69 @@
+from datetime import date, datetime, time, timezone
+from typing import Any, Literal, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.consistency import wait_for_min_position
+from app.core.database import get_session
+from app.core.tenant import get_tenant_id
+from app.models.read_models import ReviewQueueModel
+
+router = APIRouter(prefix="/api/v1", tags=["review"], dependencies=[Depends(wait_for_min_position)])
+
+
+@router.get("/review-queue")
+async def list_review_queue(
+    up_for_review: Optional[bool] = Query(default=True),
+    on_track: Optional[bool] = Query(default=None),
+    sort: Literal["review_date", "-review_date"] = Query(default="review_date"),
+    as_of: Optional[date] = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    session: AsyncSession = Depends(get_session),
+    tenant_id: UUID = Depends(get_tenant_id),
+) -> dict[str, Any]:
+    """Patients' current admissions by review date, off-track first on each date.
+
+    An admission is up for review while its review date is today (``as_of``)
+    or later; pass ``up_for_review=false`` for past reviews, or leave it empty
+    for both.
+    """
+    today = datetime.combine(as_of or datetime.now(timezone.utc).date(), time.min, tzinfo=timezone.utc)
+    query = select(ReviewQueueModel).where(
+        ReviewQueueModel.tenant_id == tenant_id,
+        ReviewQueueModel.is_current.is_(True),
+    )
+    if up_for_review is True:
+        query = query.where(ReviewQueueModel.review_date >= today)
+    elif up_for_review is False:
+        query = query.where(ReviewQueueModel.review_date < today)
+    if on_track is not None:
+        query = query.where(ReviewQueueModel.on_track.is_(on_track))
+
+    review_order = ReviewQueueModel.review_date.desc() if sort.startswith("-") else ReviewQueueModel.review_date
+    query = query.order_by(
+        review_order,
+        ReviewQueueModel.on_track,
+        ReviewQueueModel.admission_id,
+    ).limit(limit).offset(offset)
+
+    result = await session.execute(query)
+    items = [
+        {
+            "admission_id": str(r.admission_id),
+            "patient_id": str(r.patient_id) if r.patient_id else None,
+            "review_date": r.review_date.isoformat() if r.review_date else None,
+            "up_for_review": r.review_date is not None and _as_utc(r.review_date) >= today,
+            "on_track": r.on_track,
+            "course_corrections": r.correction_count,
+        }
+        for r in result.scalars().all()
+    ]
+    return {"items": items, "limit": limit, "offset": offset}
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
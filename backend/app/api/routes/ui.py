@@ -154,6 +154,39 @@ async def timeline_preview() -> Response:
             return resp.json();
           }}
 
+          // fields= needs JSON functions (SQLite 3.38 or later); servers
+          // without them answer 501, so ask again for the full payloads.
+          async function fetchFields(url, fields) {{
+            try {{
+              return await fetchJson(`${{url}}&fields=${{fields}}`);
+            }} catch (error) {{
+              if (error.message !== "Request failed: 501") {{
+                throw error;
+              }}
+              return fetchJson(url);
+            }}
+          }}
+
+          async function postJson(url, body) {{
+            const resp = await fetch(url, {{
+              method: "POST",
+              headers: {{
+                "X-Tenant-ID": TENANT_ID,
+                "Content-Type": "application/json",
+              }},
+              body: JSON.stringify(body),
+            }});
+            if (!resp.ok) {{
+              throw new Error(`Request failed: ${{resp.status}}`);
+            }}
+            return resp.json();
+          }}
+
+      // The server thins each lane to this many points; more would overlap
+      // at this width anyway.
+      const MAX_POINTS_PER_LANE = 120;
+      const MIN_LABEL_GAP = 64;
+
       function makeSvgTimeline(data) {{
         const width = 1000;
         const height = 220;
@@ -196,10 +229,16 @@ async def timeline_preview() -> Response:
           <text x="16" y="${{laneY.attachments + 4}}" class="lane-label">Attachments</text>
         `;
 
+        // Label a point only when it clears the previous label in its lane.
+        const lastLabelX = {{}};
         const points = data.points
           .map((item) => {{
             const cx = scaleX(item.time);
             const cy = laneY[item.lane];
+            const labelled = lastLabelX[item.lane] === undefined || cx - lastLabelX[item.lane] >= MIN_LABEL_GAP;
+            if (labelled) {{
+              lastLabelX[item.lane] = cx;
+            }}
             const color =
               item.lane === "locations"
                 ? "var(--accent)"
@@ -207,8 +246,8 @@ async def timeline_preview() -> Response:
                 ? "var(--accent-2)"
                 : "var(--accent-3)";
             return `
-              <circle cx="${{cx}}" cy="${{cy}}" r="6" fill="${{color}}" />
-              <text x="${{cx + 8}}" y="${{cy - 10}}" font-size="11" fill="#4a3f36">${{item.label}}</text>
+              <circle cx="${{cx}}" cy="${{cy}}" r="6" fill="${{color}}"><title>${{item.label}}</title></circle>
+              ${{labelled ? `<text x="${{cx + 8}}" y="${{cy - 10}}" font-size="11" fill="#4a3f36">${{item.label}}</text>` : ""}}
             `;
           }})
           .join("");
@@ -225,70 +264,58 @@ async def timeline_preview() -> Response:
         `;
       }}
 
-      function buildPoints(timeline, trajectory, attachments) {{
-        const points = [];
-        for (const item of trajectory) {{
-          points.push({{
-            lane: "locations",
-            time: toMillis(item.effective_at || item.effectiveAt),
-            label: item.to_location || item.location || "Location",
-          }});
-        }}
-        for (const item of timeline) {{
-          const details = item.details || item;
-          points.push({{
-            lane: "events",
-            time: toMillis(item.occurred_at || item.occurredAt),
-            label: item.event_type || details?.label || "Event",
-          }});
-        }}
-        for (const item of attachments) {{
-          points.push({{
-            lane: "attachments",
-            time: toMillis(item.occurred_at || item.occurredAt),
-            label: item.filename || "Attachment",
-          }});
-        }}
-        return points;
+      function buildPoints(items) {{
+        // Bundle items arrive merged in time order, each tagged with its lane.
+        return items.map((item) => {{
+          const data = item.data || {{}};
+          let label = data.filename || "Attachment";
+          if (item.lane === "locations") {{
+            label = data.to_location || data.location || "Location";
+          }} else if (item.lane === "events") {{
+            const details = data.details || data;
+            label = data.event_type || details?.label || "Event";
+          }}
+          return {{ lane: item.lane, time: toMillis(item.at), label }};
+        }});
       }}
 
       async function loadTimelines() {{
         const root = document.getElementById("timeline-root");
         root.innerHTML = "";
         try {{
-          const patients = await fetchJson("/api/v1/patients?limit=2");
+          const patients = await fetchFields("/api/v1/patients?limit=2", "patient_id");
           const patientItems = patients.items || [];
           if (patientItems.length === 0) {{
             root.innerHTML = '<div class="card empty">No patients found.</div>';
             return;
           }}
-          let index = 0;
-          for (const patient of patientItems) {{
-            index += 1;
-            const patientId = patient.patient_id;
-            const admissions = await fetchJson(`/api/v1/admissions?patient_id=${{patientId}}`);
-            const admissionItems = admissions.items || [];
-            if (admissionItems.length === 0) {{
+          const admissionLists = await Promise.all(
+            patientItems.map((patient) => fetchFields(`/api/v1/admissions?patient_id=${{patient.patient_id}}`, "admission_id"))
+          );
+          const admissionIds = admissionLists
+            .map((admissions) => (admissions.items || [])[0])
+            .filter(Boolean)
+            .map((admission) => admission.admission_id);
+          const timelines = admissionIds.length
+            ? await postJson("/api/v1/admissions/timelines", {{
+                admission_ids: admissionIds,
+                points: MAX_POINTS_PER_LANE,
+              }})
+            : {{ items: [] }};
+          const itemsByAdmission = new Map(timelines.items.map((group) => [group.admission_id, group.items]));
+
+          admissionLists.forEach((admissions, position) => {{
+            const index = position + 1;
+            const admission = (admissions.items || [])[0];
+            if (!admission) {{
               const card = document.createElement("div");
               card.className = "card";
               card.innerHTML = `<h2>Patient ${{index}}</h2><small>No admissions found.</small>`;
               root.appendChild(card);
-              continue;
+              return;
             }}
-            const admission = admissionItems[0];
             const admissionId = admission.admission_id;
-
-            const [timeline, trajectory, attachments] = await Promise.all([
-              fetchJson(`/api/v1/admissions/${{admissionId}}/timeline`),
-              fetchJson(`/api/v1/admissions/${{admissionId}}/trajectory`),
-              fetchJson(`/api/v1/admissions/${{admissionId}}/attachments`),
-            ]);
-
-            const points = buildPoints(
-              timeline.items || [],
-              trajectory.items || [],
-              attachments.items || [],
-            );
+            const points = buildPoints(itemsByAdmission.get(admissionId) || []);
 
             const card = document.createElement("div");
             card.className = "card";
@@ -303,7 +330,7 @@ async def timeline_preview() -> Response:
               ${{points.length ? makeSvgTimeline({{points}}) : '<div class="empty">No timeline data for this admission.</div>'}}
             `;
             root.appendChild(card);
-          }}
+          }});
         }} catch (error) {{
           root.innerHTML = `<div class="card empty">Error loading timeline: ${{error.message}}</div>`;
         }}
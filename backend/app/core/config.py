@@ -8,6 +8,12 @@ class Settings(BaseSettings):
     database_url: str = "postgresql+asyncpg://localhost/flightplan_dev"
     default_tenant_id: str = "00000000-0000-0000-0000-000000000000"
     plugins_dir: str = "plugins"
+    # 0 disables the read-model response cache.
+    response_cache_ttl_seconds: float = 0.0
+    response_cache_max_entries: int = 10000
+    response_cache_max_bytes: int = 64 * 1024 * 1024
+    # How long a read with min_position waits for the projections.
+    read_consistency_timeout_seconds: float = 5.0
 
 
 @lru_cache
@@ -0,0 +1,299 @@
+"""Read models declared by specialty plugins.
+
+A plugin lists projections under ``spec.projections`` in its manifest::
+
+    projections:
+      - name: ecmo_runs
+        events: [clinical_event.recorded]
+        where: {event_type: continuous_therapy, therapy_type: ECMO}
+        columns:
+          admission_id: {field: admission_id, type: uuid, index: true}
+          started_at: {field: occurred_at, type: datetime}
+
+Each declaration is compiled once, at plugin load, into a table and a
+handler with precomputed field extractors and filters. The runner applies
+the handlers in the same session and transaction as the built-in
+projections, so they share its batching, checkpoint and dead-letter
+handling.
+
+``mode: upsert`` (the default) keeps one row per tenant and ``key`` (a data
+field, or ``@event_id`` by default); later events fill in columns they carry and
+leave the others untouched, and an event older than the row's ``position``
+(a retried dead letter) changes nothing. ``mode: count`` keeps one row per distinct
+combination of the declared columns with a running ``count``.
+
+The tables are created by ``PluginRegistry.create_tables`` when the runner
+starts, not by the Alembic migrations, and an existing table is never
+altered; see docs/PLUGIN_DEVELOPMENT.md for changing a declaration.
+"""
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field, field_validator
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Insert,
+    Integer,
+    JSON,
+    MetaData,
+    String,
+    Table,
+    Text,
+    func,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.types import GUID
+from app.projections.envelope import EventEnvelope
+
+IDENTIFIER = re.compile(r"^[a-z][a-z0-9_]{0,39}$")
+RESERVED_COLUMNS = {"id", "tenant_id", "count", "position", "updated_at"}
+
+COLUMN_TYPES: dict[str, Callable[[], Any]] = {
+    "string": lambda: String(200),
+    "text": Text,
+    "integer": Integer,
+    "float": Float,
+    "boolean": Boolean,
+    "datetime": lambda: DateTime(timezone=True),
+    "uuid": GUID,
+    "json": JSON,
+}
+
+
+class PluginColumnSpec(BaseModel):
+    field: str
+    type: Literal["string", "text", "integer", "float", "boolean", "datetime", "uuid", "json"] = "string"
+    index: bool = False
+
+
+class PluginProjectionSpec(BaseModel):
+    name: str
+    events: list[str] = Field(min_length=1)
+    where: dict[str, Any] = Field(default_factory=dict)
+    mode: Literal["upsert", "count"] = "upsert"
+    key: str = "@event_id"
+    columns: dict[str, PluginColumnSpec] = Field(min_length=1)
+
+    @field_validator("name")
+    @classmethod
+    def _check_name(cls, value: str) -> str:
+        if not IDENTIFIER.match(value):
+            raise ValueError(f"projection name {value!r} must be a lowercase identifier")
+        return value
+
+    @field_validator("columns")
+    @classmethod
+    def _check_columns(cls, value: dict[str, PluginColumnSpec]) -> dict[str, PluginColumnSpec]:
+        for name in value:
+            if not IDENTIFIER.match(name) or name in RESERVED_COLUMNS:
+                raise ValueError(f"column name {name!r} is invalid or reserved")
+        return value
+
+
+def table_name_for(plugin: str, projection: str) -> str:
+    return f"plugin_{re.sub(r'[^a-z0-9]+', '_', plugin.lower())}_{projection}"
+
+
+@dataclass
+class CompiledProjection:
+    """A manifest projection compiled into a table and field extractors."""
+
+    plugin: str
+    spec: PluginProjectionSpec
+    table: Table
+    extractors: list[tuple[str, Callable[[EventEnvelope], Any]]]
+    filters: list[Callable[[EventEnvelope], bool]]
+    key: Callable[[EventEnvelope], Any]
+
+    @property
+    def name(self) -> str:
+        return f"{self.plugin}.{self.spec.name}"
+
+    def bind(self, session: AsyncSession, tenant_id: UUID) -> "PluginProjection":
+        return PluginProjection(self, session, tenant_id)
+
+
+class PluginProjection:
+    """Runner-facing handler for one compiled plugin projection."""
+
+    def __init__(self, compiled: CompiledProjection, session: AsyncSession, tenant_id: UUID) -> None:
+        self.compiled = compiled
+        self.session = session
+        self.tenant_id = tenant_id
+        self.name = compiled.name
+        self._event_types = frozenset(compiled.spec.events)
+        self._statement: Insert | None = None
+
+    async def handle(self, event: EventEnvelope | dict) -> None:
+        event = EventEnvelope.wrap(event)
+        if event.event_type not in self._event_types:
+            return
+        compiled = self.compiled
+        for matches in compiled.filters:
+            if not matches(event):
+                return
+
+        row: dict[str, Any] = {"tenant_id": self.tenant_id, "updated_at": event.now}
+        for column, extract in compiled.extractors:
+            row[column] = extract(event)
+        if compiled.spec.mode == "count":
+            if any(row[column] is None for column, _ in compiled.extractors):
+                return
+            row["count"] = 1
+        else:
+            key = compiled.key(event)
+            if key is None:
+                return
+            row["id"] = str(key)
+            row["position"] = event.global_position
+
+        statement = self._statement
+        if statement is None:
+            statement = self._statement = _upsert_statement(compiled, self.session.get_bind().dialect.name)
+        await self.session.execute(statement, row)
+
+
+def compile_projection(plugin: str, spec: PluginProjectionSpec, metadata: MetaData) -> CompiledProjection:
+    table_name = table_name_for(plugin, spec.name)
+    if table_name in metadata.tables:
+        metadata.remove(metadata.tables[table_name])
+
+    declared = [
+        Column(name, COLUMN_TYPES[column.type](), nullable=spec.mode == "upsert")
+        for name, column in spec.columns.items()
+    ]
+    if spec.mode == "upsert":
+        # Keys come from event data, so two tenants can share one: scope it.
+        columns = [
+            Column("tenant_id", GUID(), primary_key=True),
+            Column("id", String(200), primary_key=True),
+            *declared,
+            Column("position", BigInteger, nullable=False),
+            Column("updated_at", DateTime(timezone=True), nullable=False),
+        ]
+    else:
+        # Group columns form the key; NULLs would never match on conflict.
+        columns = [
+            Column("tenant_id", GUID(), primary_key=True),
+            *(Column(c.name, c.type, primary_key=True) for c in declared),
+            Column("count", BigInteger, nullable=False),
+            Column("updated_at", DateTime(timezone=True), nullable=False),
+        ]
+    indexes = [
+        Index(f"idx_{table_name}_{name}", "tenant_id", name)
+        for name, column in spec.columns.items()
+        if column.index
+    ]
+    table = Table(table_name, metadata, *columns, *indexes)
+
+    extractors = [
+        (name, _extractor(column.field, column.type, missing_default=spec.mode == "count"))
+        for name, column in spec.columns.items()
+    ]
+    return CompiledProjection(
+        plugin=plugin,
+        spec=spec,
+        table=table,
+        extractors=extractors,
+        filters=[_filter(field, expected) for field, expected in spec.where.items()],
+        key=_extractor(spec.key, "string"),
+    )
+
+
+def _upsert_statement(compiled: CompiledProjection, dialect: str) -> Insert:
+    table = compiled.table
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    statement = insert(table)
+    keys = [column.name for column in table.primary_key.columns]
+    if compiled.spec.mode == "count":
+        updates = {"count": table.c["count"] + 1, "updated_at": statement.excluded.updated_at}
+        return statement.on_conflict_do_update(index_elements=keys, set_=updates)
+    updates = {
+        column.name: func.coalesce(statement.excluded[column.name], column)
+        for column in table.columns
+        if column.name not in keys
+    }
+    updates["position"] = statement.excluded.position
+    updates["updated_at"] = statement.excluded.updated_at
+    # A retried dead letter must not roll the row back to an older event.
+    return statement.on_conflict_do_update(
+        index_elements=keys, set_=updates, where=table.c.position <= statement.excluded.position
+    )
+
+
+def _extractor(field: str, type_name: str, missing_default: bool = False) -> Callable[[EventEnvelope], Any]:
+    if field == "@event_id":
+        return lambda event: event.event_id
+    if field == "@event_type":
+        return lambda event: event.event_type
+    if field == "@global_position":
+        return lambda event: event.global_position
+
+    path = tuple(field.split("."))
+    top = path[0] if len(path) == 1 else None
+    if type_name == "uuid" and top:
+        return lambda event: event.optional_uuid(top)
+    if type_name == "datetime" and top:
+        return lambda event: event.timestamp(top) if event.data.get(top) else None
+
+    convert = _CONVERTERS.get(type_name)
+    default = "" if missing_default and type_name in ("string", "text") else None
+
+    def extract(event: EventEnvelope) -> Any:
+        value = _lookup(event.data, path)
+        if value is None or value == "":
+            return default
+        if convert is None:
+            return value
+        try:
+            return convert(value)
+        except (TypeError, ValueError):
+            return default
+
+    return extract
+
+
+def _filter(field: str, expected: Any) -> Callable[[EventEnvelope], bool]:
+    path = tuple(field.split("."))
+    if isinstance(expected, dict) and "in" in expected:
+        allowed = frozenset(expected["in"])
+        return lambda event: _lookup(event.data, path) in allowed
+    if isinstance(expected, dict) and "prefix" in expected:
+        prefix = str(expected["prefix"]).lower()
+        return lambda event: str(_lookup(event.data, path) or "").lower().startswith(prefix)
+    return lambda event: _lookup(event.data, path) == expected
+
+
+def _lookup(data: dict, path: tuple[str, ...]) -> Any:
+    value: Any = data
+    for part in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _parse_datetime(value: Any) -> datetime:
+    parsed = datetime.fromisoformat(str(value))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "string": lambda value: str(value)[:200],
+    "text": str,
+    "integer": int,
+    "float": float,
+    "boolean": lambda value: value if isinstance(value, bool) else str(value).lower() in ("1", "true", "yes"),
+    "datetime": _parse_datetime,
+    "uuid": lambda value: UUID(str(value)),
+}
@@ -1,10 +1,19 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
+from uuid import UUID
 import yaml
+from sqlalchemy import MetaData, Table
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from app.core.config import get_settings
 from app.core.plugins.manifest import PluginManifest
+from app.core.plugins.projections import (
+    CompiledProjection,
+    PluginProjection,
+    PluginProjectionSpec,
+    compile_projection,
+)
 
 
 @dataclass
@@ -13,6 +22,7 @@ class SpecialtyPlugin:
     version: str
     display_name: str | None
     manifest: dict
+    projections: list[CompiledProjection] = field(default_factory=list)
 
 
 class PluginRegistry:
@@ -22,6 +32,7 @@ class PluginRegistry:
         self.plugins_dir = plugins_dir
         self._plugins: dict[str, SpecialtyPlugin] = {}
         self._loaded = False
+        self.metadata = MetaData()
 
     def discover_plugins(self) -> list[str]:
         plugins: list[str] = []
@@ -40,12 +51,21 @@ class PluginRegistry:
             manifest_dict = yaml.safe_load(f)
 
         manifest = PluginManifest.model_validate(manifest_dict)
+        projections = [
+            compile_projection(
+                manifest.metadata.name,
+                PluginProjectionSpec.model_validate(spec),
+                self.metadata,
+            )
+            for spec in manifest.spec.get("projections") or []
+        ]
 
         plugin = SpecialtyPlugin(
             name=manifest.metadata.name,
             version=manifest.metadata.version,
             display_name=manifest.metadata.displayName,
             manifest=manifest_dict,
+            projections=projections,
         )
 
         self._plugins[plugin.name] = plugin
@@ -56,6 +76,10 @@ class PluginRegistry:
             self.load_plugin(name)
         self._loaded = True
 
+    def ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load_all()
+
     def get_plugin(self, name: str) -> Optional[SpecialtyPlugin]:
         return self._plugins.get(name)
 
@@ -68,6 +92,40 @@ class PluginRegistry:
             return {}
         return plugin.manifest.get("spec", {}).get("ui", {})
 
+    def get_projection(self, specialty: str, name: str) -> Optional[CompiledProjection]:
+        plugin = self._plugins.get(specialty)
+        if not plugin:
+            return None
+        return next((p for p in plugin.projections if p.spec.name == name), None)
+
+    def build_projections(self, session: AsyncSession, tenant_id: UUID) -> list[PluginProjection]:
+        self.ensure_loaded()
+        return [
+            projection.bind(session, tenant_id)
+            for plugin in self._plugins.values()
+            for projection in plugin.projections
+        ]
+
+    def tables(self) -> tuple[Table, ...]:
+        self.ensure_loaded()
+        return tuple(
+            projection.table
+            for plugin in self._plugins.values()
+            for projection in plugin.projections
+        )
+
+    async def create_tables(self, engine: AsyncEngine) -> None:
+        """Create any missing plugin read-model tables.
+
+        Plugin tables live outside the Alembic migrations because they come
+        and go with the installed plugins.
+        """
+        tables = list(self.tables())
+        if not tables:
+            return
+        async with engine.begin() as conn:
+            await conn.run_sync(self.metadata.create_all, tables=tables)
+
 
 settings = get_settings()
 _base = Path(__file__).resolve().parents[3]
@@ -2,15 +2,29 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.event_store import EventModel, SnapshotModel
 
 
+def source_filter(
+    sources: Optional[Sequence[str]] = None,
+    exclude_sources: Optional[Sequence[str]] = None,
+):
+    """SQL predicate on an event's ``metadata.source``."""
+    source = EventModel.metadata_["source"].as_string()
+    clauses = []
+    if sources is not None:
+        clauses.append(source.in_(list(sources)))
+    if exclude_sources is not None:
+        clauses.append(or_(source.is_(None), source.not_in(list(exclude_sources))))
+    return and_(*clauses)
+
+
 @dataclass
 class EventToAppend:
     event_type: str
@@ -29,6 +43,9 @@ class EventStore:
     def __init__(self, session: AsyncSession, tenant_id: UUID):
         self.session = session
         self.tenant_id = tenant_id
+        # Global position of the last event written by append(), for
+        # read-your-writes tokens.
+        self.last_position: int | None = None
 
     async def append(
         self,
@@ -60,6 +77,7 @@ class EventStore:
                 global_position=next_global_position,
             )
             self.session.add(event_model)
+            self.last_position = next_global_position
             next_global_position += 1
 
         await self.session.flush()
@@ -109,13 +127,35 @@ class EventStore:
         self,
         position: int,
         limit: int = 1000,
+        sources: Optional[Sequence[str]] = None,
+        exclude_sources: Optional[Sequence[str]] = None,
     ) -> list[dict[str, Any]]:
+        """Events after ``position`` in global order.
+
+        ``sources`` / ``exclude_sources`` filter on ``metadata.source``; events
+        without a source count as excluded from every named source.
+        """
         query = select(EventModel).where(
             and_(
                 EventModel.global_position > position,
                 EventModel.tenant_id == self.tenant_id,
             )
         ).order_by(EventModel.global_position).limit(limit)
+        if sources is not None or exclude_sources is not None:
+            query = query.where(source_filter(sources, exclude_sources))
+
+        result = await self.session.execute(query)
+        return [self._to_dict(em) for em in result.scalars().all()]
+
+    async def get_events_at_positions(self, positions: list[int]) -> list[dict[str, Any]]:
+        if not positions:
+            return []
+        query = select(EventModel).where(
+            and_(
+                EventModel.global_position.in_(positions),
+                EventModel.tenant_id == self.tenant_id,
+            )
+        ).order_by(EventModel.global_position)
 
         result = await self.session.execute(query)
         return [self._to_dict(em) for em in result.scalars().all()]
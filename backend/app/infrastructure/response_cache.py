@@ -0,0 +1,187 @@
+"""Response cache for read endpoints, invalidated by the projection runner.
+
+Entries are encoded JSON bodies keyed by (tenant, route, ETag, query
+string) and tagged with the admissions and patients they were built from.
+The ETag is the admission watermark or the read-model checkpoints read for
+the request (``app.api.etags``), so once the projected state moves on, the
+old entry is never looked up again, whichever process moved it. The TTL
+only bounds how long an entry lives; it does not decide whether the entry
+is fresh.
+
+After each committed batch, the runner drops every entry tagged with an
+admission or patient that the batch touched, which frees superseded
+entries straight away. ``LocalCacheBackend`` only sees invalidations from
+runners in the same process; with the runner in a separate worker its
+stale entries are unreachable and age out by TTL and LRU, or configure a
+shared backend implementing ``CacheBackend`` in both processes. The cache
+is off unless ``response_cache_ttl_seconds`` is set.
+"""
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Protocol
+from uuid import UUID
+
+from app.core.config import get_settings
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes, tags: Iterable[str], ttl_seconds: float) -> None: ...
+
+    async def invalidate(self, tags: Iterable[str]) -> int: ...
+
+    def stats(self) -> dict[str, Any]: ...
+
+
+class LocalCacheBackend:
+    """LRU dict with per-entry expiry and a tag index, bounded by entries and bytes."""
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[bytes, float, tuple[str, ...]]] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self._bytes = 0
+        self.evictions = 0
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, tags: Iterable[str], ttl_seconds: float) -> None:
+        if len(value) > self.max_bytes:
+            return
+        self._remove(key)
+        tags = tuple(tags)
+        self._entries[key] = (value, time.monotonic() + ttl_seconds, tags)
+        self._bytes += len(key) + len(value)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    async def invalidate(self, tags: Iterable[str]) -> int:
+        removed = 0
+        for tag in tags:
+            for key in self._tags.pop(tag, ()):
+                removed += self._remove(key)
+        return removed
+
+    def stats(self) -> dict[str, Any]:
+        return {"entries": len(self._entries), "bytes": self._bytes, "evictions": self.evictions}
+
+    def _remove(self, key: str) -> int:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return 0
+        value, _, tags = entry
+        self._bytes -= len(key) + len(value)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+        return 1
+
+
+class ResponseCache:
+    def __init__(self, backend: CacheBackend, ttl_seconds: float = 0.0) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        # Bumped per tenant on each invalidation; a response built across a
+        # bump of its tenant may be stale. Other tenants' puts are unaffected.
+        self._generations: dict[UUID, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def configure(self, backend: CacheBackend | None = None, ttl_seconds: float | None = None) -> None:
+        if backend is not None:
+            self.backend = backend
+        if ttl_seconds is not None:
+            self.ttl_seconds = ttl_seconds
+
+    async def get(self, key: str) -> bytes | None:
+        value = await self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def generation(self, tenant_id: UUID) -> int:
+        return self._generations.get(tenant_id, 0)
+
+    async def put(self, key: str, payload: Any, tags: Iterable[str], tenant_id: UUID, generation: int) -> bytes:
+        """Encode ``payload`` and store it unless the tenant was invalidated since ``generation``.
+
+        ``payload`` may already be an encoded body.
+        """
+        body = payload if isinstance(payload, bytes) else json.dumps(payload, separators=(",", ":")).encode()
+        if generation == self.generation(tenant_id):
+            await self.backend.set(key, body, tags, self.ttl_seconds)
+        return body
+
+    async def invalidate(
+        self,
+        tenant_id: UUID,
+        admission_ids: Iterable[UUID] = (),
+        patient_ids: Iterable[UUID] = (),
+    ) -> int:
+        if not self.enabled:
+            return 0
+        tags = [admission_tag(tenant_id, admission_id) for admission_id in admission_ids]
+        tags += [patient_tag(tenant_id, patient_id) for patient_id in patient_ids]
+        self._generations[tenant_id] = self.generation(tenant_id) + 1
+        removed = await self.backend.invalidate(tags) if tags else 0
+        self.invalidations += removed
+        return removed
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            **self.backend.stats(),
+        }
+
+
+def cache_key(tenant_id: UUID, route: str, etag: str, params: str) -> str:
+    return f"{tenant_id}|{route}|{etag}|{params}"
+
+
+def admission_tag(tenant_id: UUID, admission_id: UUID) -> str:
+    return f"{tenant_id}|admission|{admission_id}"
+
+
+def patient_tag(tenant_id: UUID, patient_id: UUID) -> str:
+    return f"{tenant_id}|patient|{patient_id}"
+
+
+settings = get_settings()
+response_cache = ResponseCache(
+    LocalCacheBackend(
+        max_entries=settings.response_cache_max_entries,
+        max_bytes=settings.response_cache_max_bytes,
+    ),
+    ttl_seconds=settings.response_cache_ttl_seconds,
+)
@@ -7,6 +7,11 @@ from app.api.routes.read_models import router as read_models_router
 from app.api.routes.commands import router as command_router
 from app.api.routes.plugins import router as plugins_router
 from app.api.routes.ui import router as ui_router
+from app.api.routes.census import router as census_router
+from app.api.routes.projections import router as projections_router
+from app.api.routes.care_team import router as care_team_router
+from app.api.routes.review import router as review_router
+from app.api.routes.clinical import router as clinical_router
 from app.core.plugins.registry import plugin_registry
 
 @asynccontextmanager
@@ -23,3 +28,8 @@ app.include_router(read_models_router)
 app.include_router(command_router)
 app.include_router(plugins_router)
 app.include_router(ui_router)
+app.include_router(census_router)
+app.include_router(projections_router)
+app.include_router(care_team_router)
+app.include_router(review_router)
+app.include_router(clinical_router)
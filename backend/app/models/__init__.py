@@ -1,11 +1,29 @@
 from app.models.base import Base
-from app.models.event_store import EventModel, SnapshotModel, SubscriptionModel
+from app.models.event_store import (
+    EventModel,
+    SnapshotModel,
+    SubscriptionModel,
+    ProjectionDeadLetterModel,
+)
 from app.models.read_models import (
     PatientReadModel,
     AdmissionReadModel,
     FlightPlanReadModel,
     TimelineEventModel,
     TrajectoryPointModel,
+    AdmissionSummaryModel,
+    TrajectorySegmentModel,
+    UnitCensusModel,
+    CensusOccupantModel,
+    CareTeamAssignmentModel,
+    ReviewQueueModel,
+    AdmissionWatermarkModel,
+    AnnotationReadModel,
+    FeedbackReadModel,
+    ConferenceReadModel,
+    BedsideProcedureReadModel,
+    ContinuousTherapyReadModel,
+    CourseCorrectionReadModel,
 )
 from app.models.tenant import Tenant
 
@@ -14,10 +32,24 @@ __all__ = [
     "EventModel",
     "SnapshotModel",
     "SubscriptionModel",
+    "ProjectionDeadLetterModel",
     "PatientReadModel",
     "AdmissionReadModel",
     "FlightPlanReadModel",
     "TimelineEventModel",
     "TrajectoryPointModel",
+    "AdmissionSummaryModel",
+    "TrajectorySegmentModel",
+    "UnitCensusModel",
+    "CensusOccupantModel",
+    "CareTeamAssignmentModel",
+    "ReviewQueueModel",
+    "AdmissionWatermarkModel",
+    "AnnotationReadModel",
+    "FeedbackReadModel",
+    "ConferenceReadModel",
+    "BedsideProcedureReadModel",
+    "ContinuousTherapyReadModel",
+    "CourseCorrectionReadModel",
     "Tenant",
 ]
@@ -1,7 +1,7 @@
 from datetime import datetime
 import uuid
 
-from sqlalchemy import BigInteger, DateTime, Integer, String, Index, UniqueConstraint, func, JSON
+from sqlalchemy import BigInteger, DateTime, Integer, String, Text, Index, UniqueConstraint, func, JSON, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -33,6 +33,13 @@ class EventModel(Base):
         Index("idx_events_tenant", "tenant_id", "created_at"),
         Index("idx_events_global_position", "global_position"),
         Index("idx_events_created_at", "created_at"),
+        # Lane reads: a tenant's events from one origin in global order.
+        Index(
+            "idx_events_source_position",
+            "tenant_id",
+            text("(metadata ->> 'source')"),
+            "global_position",
+        ).ddl_if(dialect="postgresql"),
     )
 
 
@@ -57,8 +64,33 @@ class SubscriptionModel(Base):
 
     subscription_id: Mapped[str] = mapped_column(String(200), primary_key=True)
     last_position: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    stats: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     __table_args__ = (
         Index("idx_subscriptions_updated", "updated_at"),
     )
+
+
+class ProjectionDeadLetterModel(Base):
+    """An event a projection failed to apply, parked so the runner can move on."""
+
+    __tablename__ = "projection_dead_letters"
+
+    id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True, default=uuid.uuid4)
+    subscription_id: Mapped[str] = mapped_column(String(200), nullable=False)
+    projection: Mapped[str] = mapped_column(String(200), nullable=False)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(GUID(), nullable=False)
+    event_id: Mapped[uuid.UUID] = mapped_column(GUID(), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(200), nullable=False)
+    global_position: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    error: Mapped[str] = mapped_column(Text, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_attempt_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    resolved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("subscription_id", "projection", "event_id", name="uq_dead_letter_event"),
+        Index("idx_dead_letters_pending", "subscription_id", "resolved_at", "global_position"),
+    )
@@ -1,7 +1,8 @@
 from datetime import datetime
+from typing import cast
 import uuid
 
-from sqlalchemy import DateTime, String, Index, JSON, func
+from sqlalchemy import BigInteger, Boolean, DateTime, Float, Integer, String, Table, Text, Index, JSON, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -19,6 +20,7 @@ class PatientReadModel(Base):
 
     __table_args__ = (
         Index("idx_patient_tenant", "tenant_id"),
+        Index("idx_patient_page", "tenant_id", "created_at", "id"),
     )
 
 
@@ -35,6 +37,8 @@ class AdmissionReadModel(Base):
     __table_args__ = (
         Index("idx_admission_tenant", "tenant_id"),
         Index("idx_admission_patient", "patient_id"),
+        Index("idx_admission_page", "tenant_id", "created_at", "id"),
+        Index("idx_admission_patient_page", "tenant_id", "patient_id", "created_at", "id"),
     )
 
 
@@ -66,7 +70,7 @@ class TimelineEventModel(Base):
 
     __table_args__ = (
         Index("idx_timeline_tenant", "tenant_id"),
-        Index("idx_timeline_admission", "admission_id"),
+        Index("idx_timeline_admission_occurred", "admission_id", "occurred_at"),
         Index("idx_timeline_occurred", "occurred_at"),
     )
 
@@ -79,11 +83,12 @@ class TrajectoryPointModel(Base):
     admission_id: Mapped[uuid.UUID] = mapped_column(GUID(), nullable=False)
     location: Mapped[str] = mapped_column(String(200), nullable=False)
     effective_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    sequence: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     data: Mapped[dict] = mapped_column(JSON, nullable=False)
 
     __table_args__ = (
         Index("idx_trajectory_tenant", "tenant_id"),
-        Index("idx_trajectory_admission", "admission_id"),
+        Index("idx_trajectory_admission_effective", "admission_id", "effective_at", "sequence"),
         Index("idx_trajectory_effective", "effective_at"),
     )
 
@@ -99,6 +104,296 @@ class AttachmentReadModel(Base):
 
     __table_args__ = (
         Index("idx_attachment_tenant", "tenant_id"),
-        Index("idx_attachment_admission", "admission_id"),
+        Index("idx_attachment_admission_occurred", "admission_id", "occurred_at"),
         Index("idx_attachment_occurred", "occurred_at"),
     )
+
+
+class AdmissionSummaryModel(Base):
+    __tablename__ = "admission_summaries"
+
+    id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(GUID(), nullable=False)
+    patient_id: Mapped[uuid.UUID | None] = mapped_column(GUID(), nullable=True)
+    admit_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    discharge_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    current_location: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    current_location_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    current_risk: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    current_risk_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_procedure_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    location_change_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    clinical_event_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Set by admission.created; other events can create the row first.
+    admission_created: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    # Highest event position applied, so a retried older event cannot win a tie.
+    position: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("idx_admission_summary_tenant_patient", "tenant_id", "patient_id"),
+        Index("idx_admission_summary_tenant_location", "tenant_id", "current_location"),
+        Index("idx_admission_summary_page", "tenant_id", "created_at", "id"),
+    )
+
+
+class TrajectorySegmentModel(Base):
+    __tablename__ = "trajectory_segments"
+
+    id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(GUID(), nullable=False)
+    admission_id: Mapped[uuid.UUID] = mapped_column(GUID(), nullable=False)
+    location: Mapped[str] = mapped_column(String(200), nullable=False)
+    start_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    end_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    duration_hours: Mapped[float | None] = mapped_column(Float, nullable=True)
+    sequence: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    position: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    corrects_point_id: Mapped[uuid.UUID | None] = mapped_column(GUID(), nullable=True)
+    active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+
+    __table_args__ = (
+        Index("idx_segment_tenant", "tenant_id"),
+        Index("idx_segment_admission_order", "admission_id", "active", "start_at", "sequence", "position"),
+        Index("idx_segment_corrects", "corrects_point_id"),
+        Index("idx_segment_location_start", "tenant_id", "location", "start_at"),
+        Index("idx_segment_location_end", "tenant_id", "location", "end_at"),
+        # Interval index for point-in-time census queries; needs btree_gist.
+        Index(
+            "idx_segment_location_span",
+            "tenant_id",
+            "location",
+            text("tstzrange(start_at, end_at)"),
+            postgresql_using="gist",
+            postgresql_where=text("active"),
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+class UnitCensusModel(Base):
+    __tablename__ = "unit_census"
+
+    tenant_id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True)
+    location: Mapped[str] = mapped_column(String(200), primary_key=True)
+    occupancy: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class CensusOccupantModel(Base):
+    __tablename__ = "census_occupants"
+
+    admission_id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(GUID(), nullable=False)
+    location: Mapped[str] = mapped_column(String(200), nullable=False)
+    since: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("idx_census_occupant_location", "tenant_id", "location"),
+    )
+
+
+class CareTeamAssignmentModel(Base):
+    """One clinician in one role on one admission, for a span of time.
+
+    Location steps carry the team for the time spent in that location; the
+    span follows the step's trajectory segment. Bedside procedures carry the
+    team for the procedure's start and end.
+    """
+
+    __tablename__ = "care_team_assignments"
+
+    id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(GUID(), nullable=False)
+    clinician_key: Mapped[str] = mapped_column(String(200), nullable=False)
+    clinician_name: Mapped[str] = mapped_column(String(200), nullable=False)
+    role: Mapped[str] = mapped_column(String(100), nullable=False)
+    admission_id: Mapped[uuid.UUID] = mapped_column(GUID(), nullable=False)
+    location: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    source: Mapped[str] = mapped_column(String(50), nullable=False)
+    source_id: Mapped[uuid.UUID] = mapped_column(GUID(), nullable=False)
+    start_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    end_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+
+    __table_args__ = (
+        Index("idx_care_team_clinician", "tenant_id", "clinician_key", "role", "start_at"),
+        Index("idx_care_team_role_open", "tenant_id", "role", "end_at"),
+        Index("idx_care_team_admission", "admission_id", "source"),
+    )
+
+
+class ReviewQueueModel(Base):
+    """Review state per admission, kept current by the projection.
+
+    ``review_date`` is compared with today at read time; the on-track flag
+    follows the legacy rule: off track after a course correction of type
+    ``set`` whose detail says ``ontrack:no``, on track once any correction
+    exists otherwise.
+    """
+
+    __tablename__ = "review_queue"
+
+    admission_id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(GUID(), nullable=False)
+    patient_id: Mapped[uuid.UUID | None] = mapped_column(GUID(), nullable=True)
+    admit_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    review_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    is_current: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    on_track: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    correction_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    on_track_set: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+    on_track_set_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("idx_review_queue_order", "tenant_id", "is_current", "review_date", "on_track"),
+        Index("idx_review_queue_patient", "patient_id"),
+    )
+
+
+class AdmissionWatermarkModel(Base):
+    """Global position of the last event applied to each admission.
+
+    Read endpoints build their ETags from it, so an unchanged admission can
+    be answered with 304 after one primary-key lookup.
+    """
+
+    __tablename__ = "admission_watermarks"
+
+    admission_id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(GUID(), nullable=False)
+    last_position: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    # Changes when a rebuild replays the same positions into new rows.
+    projected_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class ClinicalKindModel(Base):
+    """Columns shared by the typed table of every clinical event kind."""
+
+    __abstract__ = True
+
+    # Kept ahead of each kind's own columns, as in the migrations.
+    id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True, sort_order=-1)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(GUID(), nullable=False, sort_order=-1)
+    admission_id: Mapped[uuid.UUID] = mapped_column(GUID(), nullable=False, sort_order=-1)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, sort_order=-1)
+
+
+class AnnotationReadModel(ClinicalKindModel):
+    __tablename__ = "clinical_annotations"
+
+    annotation: Mapped[str | None] = mapped_column(Text, nullable=True)
+    annotation_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    href: Mapped[str | None] = mapped_column(Text, nullable=True)
+    special_node: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    format: Mapped[str | None] = mapped_column(String(300), nullable=True)
+
+    __table_args__ = (
+        Index("idx_annotation_admission", "admission_id", "occurred_at"),
+        Index("idx_annotation_type", "tenant_id", "annotation_type", "occurred_at"),
+    )
+
+
+class FeedbackReadModel(ClinicalKindModel):
+    __tablename__ = "clinical_feedbacks"
+
+    exit_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    score: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    # Numeric scores parsed from ``score`` for range filters and averages.
+    score_value: Mapped[float | None] = mapped_column(Float, nullable=True)
+    performance: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    outcome: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    graph_visible: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    suggested_edit: Mapped[str | None] = mapped_column(String(10), nullable=True)
+
+    __table_args__ = (
+        Index("idx_feedback_admission", "admission_id", "occurred_at"),
+        Index("idx_feedback_outcome", "tenant_id", "outcome", "occurred_at"),
+        Index("idx_feedback_score", "tenant_id", "score_value"),
+    )
+
+
+class ConferenceReadModel(ClinicalKindModel):
+    __tablename__ = "clinical_conferences"
+
+    conference_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    action_items: Mapped[str | None] = mapped_column(Text, nullable=True)
+    notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (
+        Index("idx_conference_admission", "admission_id", "occurred_at"),
+        Index("idx_conference_type", "tenant_id", "conference_type", "occurred_at"),
+    )
+
+
+class BedsideProcedureReadModel(ClinicalKindModel):
+    __tablename__ = "clinical_bedside_procedures"
+
+    end_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    procedure_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    teams: Mapped[str | None] = mapped_column(Text, nullable=True)
+    notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (
+        Index("idx_bedside_procedure_admission", "admission_id", "occurred_at"),
+        Index("idx_bedside_procedure_type", "tenant_id", "procedure_type", "occurred_at"),
+    )
+
+
+class ContinuousTherapyReadModel(ClinicalKindModel):
+    __tablename__ = "clinical_continuous_therapies"
+
+    therapy_type: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    status: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (
+        Index("idx_continuous_therapy_admission", "admission_id", "occurred_at"),
+        Index("idx_continuous_therapy_type", "tenant_id", "therapy_type", "status"),
+    )
+
+
+class CourseCorrectionReadModel(ClinicalKindModel):
+    __tablename__ = "clinical_course_corrections"
+
+    correction_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    detail: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (
+        Index("idx_course_correction_admission", "admission_id", "occurred_at"),
+        Index("idx_course_correction_type", "tenant_id", "correction_type", "occurred_at"),
+    )
+
+
+# Typed tables for clinical_event.recorded kinds, keyed by ``data.event_type``.
+CLINICAL_KIND_MODELS: dict[str, type[ClinicalKindModel]] = {
+    "annotation": AnnotationReadModel,
+    "feedback": FeedbackReadModel,
+    "conference": ConferenceReadModel,
+    "bedside_procedure": BedsideProcedureReadModel,
+    "continuous_therapy": ContinuousTherapyReadModel,
+    "course_correction": CourseCorrectionReadModel,
+}
+
+
+_READ_MODELS: tuple[type[Base], ...] = (
+    PatientReadModel,
+    AdmissionReadModel,
+    FlightPlanReadModel,
+    TimelineEventModel,
+    TrajectoryPointModel,
+    AttachmentReadModel,
+    AdmissionSummaryModel,
+    TrajectorySegmentModel,
+    UnitCensusModel,
+    CensusOccupantModel,
+    CareTeamAssignmentModel,
+    ReviewQueueModel,
+    AdmissionWatermarkModel,
+    *CLINICAL_KIND_MODELS.values(),
+)
+
+# Declarative __table__ is typed as FromClause; every one here is a Table.
+READ_MODEL_TABLES: tuple[Table, ...] = tuple(cast(Table, model.__table__) for model in _READ_MODELS)
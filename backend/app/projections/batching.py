@@ -0,0 +1,68 @@
+import logging
+
+LOG = logging.getLogger("projections.batching")
+
+CATCH_UP = "catch-up"
+LIVE = "live"
+
+
+class AdaptiveBatchController:
+    """Chooses the next batch size and idle delay for a ProjectionRunner.
+
+    A full batch means a backlog: the runner switches to catch-up mode and
+    doubles the batch size up to ``max_size`` while batches finish within
+    ``target_batch_seconds`` (halving it again if they run long), so each
+    commit flushes thousands of rows at once. A partial batch means the
+    runner has caught up: it drops back to ``min_size`` for low latency.
+    Empty polls back off exponentially from ``poll_interval_seconds`` to
+    ``max_idle_seconds``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        min_size: int = 100,
+        max_size: int = 5000,
+        poll_interval_seconds: float = 1.0,
+        max_idle_seconds: float = 10.0,
+        target_batch_seconds: float = 2.0,
+    ) -> None:
+        self.name = name
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size)
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_idle_seconds = max(max_idle_seconds, poll_interval_seconds)
+        self.target_batch_seconds = target_batch_seconds
+        self.size = min_size
+        self.mode = LIVE
+        self.transitions = 0
+        self.idle_delay = 0.0
+
+    def after_batch(self, processed: int, seconds: float) -> float:
+        """Record a batch result; returns how long to sleep before the next one."""
+        if processed >= self.size:
+            self._switch(CATCH_UP)
+            self.idle_delay = 0.0
+            if seconds < self.target_batch_seconds:
+                self.size = min(self.size * 2, self.max_size)
+            elif seconds > self.target_batch_seconds * 2:
+                self.size = max(self.size // 2, self.min_size)
+            return 0.0
+
+        self._switch(LIVE)
+        self.size = self.min_size
+        if processed:
+            self.idle_delay = 0.0
+            return 0.0
+        if self.idle_delay:
+            self.idle_delay = min(self.idle_delay * 2, self.max_idle_seconds)
+        else:
+            self.idle_delay = self.poll_interval_seconds
+        return self.idle_delay
+
+    def _switch(self, mode: str) -> None:
+        if mode == self.mode:
+            return
+        LOG.info("%s: %s -> %s mode (batch size %s)", self.name, self.mode, mode, self.size)
+        self.mode = mode
+        self.transitions += 1
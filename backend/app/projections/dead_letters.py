@@ -0,0 +1,187 @@
+import logging
+import traceback
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.event_store import EventStore
+from app.infrastructure.response_cache import response_cache
+from app.models.event_store import ProjectionDeadLetterModel, SubscriptionModel
+from app.models.read_models import AdmissionWatermarkModel
+from app.projections.envelope import EventEnvelope, touched_ids
+
+LOG = logging.getLogger("projections.dead_letters")
+
+
+@dataclass
+class ReplayReport:
+    resolved: int = 0
+    failed: int = 0
+
+
+def projection_name(projection: Any) -> str:
+    # Plugin projections share a class, so they carry their own name.
+    return getattr(projection, "name", None) or type(projection).__name__
+
+
+async def apply_isolated(
+    session: AsyncSession,
+    projection: Any,
+    event: EventEnvelope | dict,
+) -> Exception | None:
+    """Apply one event to one projection inside a savepoint.
+
+    Returns the exception on failure; the savepoint is rolled back so the
+    rest of the batch stays intact.
+    """
+    try:
+        async with session.begin_nested():
+            await projection.handle(event)
+    except Exception as exc:
+        return exc
+    return None
+
+
+async def park(
+    session: AsyncSession,
+    subscription_id: str,
+    tenant_id: UUID,
+    projection: Any,
+    event: EventEnvelope | dict,
+    exc: Exception,
+) -> None:
+    name = projection_name(projection)
+    LOG.warning(
+        "Parking event %s (%s) for %s: %s",
+        event["global_position"],
+        event["event_type"],
+        name,
+        exc,
+    )
+    error = "".join(traceback.format_exception(exc))
+    result = await session.execute(
+        select(ProjectionDeadLetterModel).where(
+            ProjectionDeadLetterModel.subscription_id == subscription_id,
+            ProjectionDeadLetterModel.projection == name,
+            ProjectionDeadLetterModel.event_id == UUID(event["event_id"]),
+        )
+    )
+    letter = result.scalar_one_or_none()
+    if letter is None:
+        session.add(
+            ProjectionDeadLetterModel(
+                subscription_id=subscription_id,
+                projection=name,
+                tenant_id=tenant_id,
+                event_id=UUID(event["event_id"]),
+                event_type=event["event_type"],
+                global_position=event["global_position"],
+                error=error,
+            )
+        )
+        return
+    letter.error = error
+    letter.attempts += 1
+    letter.last_attempt_at = datetime.now(timezone.utc)
+    letter.resolved_at = None
+
+
+async def pending_subscriptions(session: AsyncSession) -> list[tuple[UUID, str]]:
+    """(tenant_id, subscription_id) pairs that have unresolved dead letters."""
+    result = await session.execute(
+        select(ProjectionDeadLetterModel.tenant_id, ProjectionDeadLetterModel.subscription_id)
+        .where(ProjectionDeadLetterModel.resolved_at.is_(None))
+        .distinct()
+    )
+    return [(row[0], row[1]) for row in result.all()]
+
+
+async def replay_dead_letters(
+    session: AsyncSession,
+    tenant_id: UUID,
+    subscription_id: str,
+    projections: list[Any],
+) -> ReplayReport:
+    """Re-apply parked events for a subscription in their original order.
+
+    Letters that succeed are marked resolved; the rest keep their latest
+    error and attempt count for the next retry. The events may be far behind
+    the checkpoint by now, so a repair also restamps the watermarks of the
+    admissions it touched and the subscription's ``updated_at``, in the same
+    commit, and drops their cached responses: ETags and cache keys move on
+    as they do after a live batch.
+    """
+    result = await session.execute(
+        select(ProjectionDeadLetterModel)
+        .where(ProjectionDeadLetterModel.subscription_id == subscription_id)
+        .where(ProjectionDeadLetterModel.tenant_id == tenant_id)
+        .where(ProjectionDeadLetterModel.resolved_at.is_(None))
+        .order_by(ProjectionDeadLetterModel.global_position)
+    )
+    letters = list(result.scalars().all())
+    report = ReplayReport()
+    if not letters:
+        return report
+
+    event_store = EventStore(session=session, tenant_id=tenant_id)
+    events = {
+        event["global_position"]: EventEnvelope(event)
+        for event in await event_store.get_events_at_positions(
+            sorted({letter.global_position for letter in letters})
+        )
+    }
+    by_name = {projection_name(projection): projection for projection in projections}
+    repaired: list[EventEnvelope] = []
+
+    for letter in letters:
+        projection = by_name.get(letter.projection)
+        event = events.get(letter.global_position)
+        if projection is None or event is None:
+            LOG.warning(
+                "Cannot replay dead letter %s: %s",
+                letter.id,
+                "unknown projection" if projection is None else "event not found",
+            )
+            report.failed += 1
+            continue
+
+        now = datetime.now(timezone.utc)
+        exc = await apply_isolated(session, projection, event)
+        letter.last_attempt_at = now
+        if exc is None:
+            letter.resolved_at = now
+            report.resolved += 1
+            repaired.append(event)
+        else:
+            letter.error = "".join(traceback.format_exception(exc))
+            letter.attempts += 1
+            report.failed += 1
+
+    admissions, patients = touched_ids(repaired)
+    if repaired:
+        await _restamp(session, tenant_id, subscription_id, admissions)
+    await session.commit()
+    if repaired and response_cache.enabled:
+        await response_cache.invalidate(tenant_id, admissions, patients)
+    LOG.info(
+        "Replayed dead letters for %s: %s resolved, %s still failing",
+        subscription_id,
+        report.resolved,
+        report.failed,
+    )
+    return report
+
+
+async def _restamp(session: AsyncSession, tenant_id: UUID, subscription_id: str, admission_ids: set[UUID]) -> None:
+    now = datetime.now(timezone.utc)
+    for admission_id in admission_ids:
+        watermark = await session.get(AdmissionWatermarkModel, admission_id)
+        if watermark is not None and watermark.tenant_id == tenant_id:
+            watermark.projected_at = now
+    subscription = await session.get(SubscriptionModel, subscription_id)
+    if subscription is not None:
+        subscription.updated_at = now
@@ -0,0 +1,99 @@
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+
+class EventEnvelope:
+    """An event as handed to projections, decoded at most once.
+
+    The runner wraps each event once and passes the same envelope to every
+    projection, so UUIDs and timestamps parsed by one projection are reused by
+    the rest. Item access and ``get`` fall through to the raw event dict, so
+    code written against plain dicts keeps working.
+    """
+
+    __slots__ = ("raw", "event_type", "data", "global_position", "_cache", "_now")
+
+    def __init__(self, event: dict[str, Any]) -> None:
+        self.raw = event
+        self.event_type: str = event["event_type"]
+        self.data: dict[str, Any] = event.get("data") or {}
+        self.global_position: int = int(event.get("global_position") or 0)
+        self._cache: dict[Any, Any] = {}
+        self._now: datetime | None = None
+
+    @classmethod
+    def wrap(cls, event: "EventEnvelope | dict[str, Any]") -> "EventEnvelope":
+        return event if isinstance(event, EventEnvelope) else cls(event)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.raw[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.raw.get(key, default)
+
+    @property
+    def now(self) -> datetime:
+        """Processing time, fixed for the event so every projection agrees."""
+        if self._now is None:
+            self._now = datetime.now(timezone.utc)
+        return self._now
+
+    @property
+    def event_id(self) -> UUID:
+        return self._uuid(("event_id",), self.raw["event_id"])
+
+    def uuid(self, key: str) -> UUID:
+        """``data[key]`` as a UUID; raises KeyError when it is missing."""
+        return self._uuid(key, self.data[key])
+
+    def optional_uuid(self, key: str) -> UUID | None:
+        value = self.data.get(key)
+        return self._uuid(key, value) if value else None
+
+    def id_or_event_id(self, key: str) -> UUID:
+        """``data[key]`` as a UUID, falling back to the event's own id."""
+        value = self.data.get(key)
+        return self._uuid(key, value) if value else self.event_id
+
+    def timestamp(self, key: str) -> datetime:
+        """``data[key]`` as an aware datetime; missing or invalid values read as now."""
+        cache_key = ("ts", key)
+        try:
+            return self._cache[cache_key]
+        except KeyError:
+            pass
+        value = self.data.get(key)
+        parsed = self.now
+        if value is not None:
+            try:
+                parsed = datetime.fromisoformat(value)
+            except ValueError:
+                pass
+            else:
+                if parsed.tzinfo is None:
+                    parsed = parsed.replace(tzinfo=timezone.utc)
+        self._cache[cache_key] = parsed
+        return parsed
+
+    def _uuid(self, cache_key: Any, value: str) -> UUID:
+        try:
+            return self._cache[cache_key]
+        except KeyError:
+            parsed = self._cache[cache_key] = UUID(value)
+            return parsed
+
+
+def touched_ids(events: list[EventEnvelope]) -> tuple[set[UUID], set[UUID]]:
+    """Admissions and patients whose read-model rows the events may have written."""
+    admissions: set[UUID] = set()
+    patients: set[UUID] = set()
+    for event in events:
+        for key, ids in (("admission_id", admissions), ("patient_id", patients)):
+            try:
+                value = event.optional_uuid(key)
+            except (TypeError, ValueError):
+                continue
+            if value is not None:
+                ids.add(value)
+    return admissions, patients
@@ -0,0 +1,213 @@
+"""Separate projection lanes for live events and bulk backfill.
+
+Events imported from the legacy system carry ``metadata.source`` of
+``legacy_v2``; everything else comes from live commands. Each origin is
+projected through its own lane with its own checkpoint, so a multi-million
+event import does not sit in front of a bedside location change.
+
+Ordering within a stream is kept across lanes: before a lane applies an
+event, it checks the other lane for earlier, not yet projected events of the
+same stream and stops its batch there. The other lane always has at least
+one runnable event in that case, so the lanes cannot block each other.
+
+Lanes share the read-model tables (census counters, summaries), so batches
+are applied one at a time: the scheduler drains the live lane, then runs one
+backfill batch if the throttle allows, and checks the live lane again.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Sequence
+from uuid import UUID
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.event_store import EventStore, source_filter
+from app.models.event_store import EventModel, SubscriptionModel
+from app.projections.metrics import RunnerMetrics
+from app.projections.pool import ProjectionFactory
+from app.projections.registry import (
+    BACKFILL_LANE,
+    LIVE_LANE,
+    build_projections,
+    subscription_id_for,
+)
+from app.projections.runner import ProjectionRunner
+
+LOG = logging.getLogger("projections.lanes")
+
+BACKFILL_SOURCES = ("legacy_v2",)
+
+
+@dataclass(frozen=True)
+class Lane:
+    name: str
+    sources: tuple[str, ...] | None = None
+    exclude_sources: tuple[str, ...] | None = None
+
+    def filter(self):
+        return source_filter(self.sources, self.exclude_sources)
+
+
+LANES = {
+    LIVE_LANE: Lane(LIVE_LANE, exclude_sources=BACKFILL_SOURCES),
+    BACKFILL_LANE: Lane(BACKFILL_LANE, sources=BACKFILL_SOURCES),
+}
+
+
+class LaneEventSource:
+    """Event store view that yields one lane's events in stream order.
+
+    Stands in for ``EventStore`` as a ``ProjectionRunner``'s ``EventSource``.
+    """
+
+    def __init__(self, event_store: EventStore, lane: Lane, other: Lane, other_subscription_id: str) -> None:
+        self.event_store = event_store
+        self.tenant_id = event_store.tenant_id
+        self.lane = lane
+        self.other = other
+        self.other_subscription_id = other_subscription_id
+
+    async def get_all_events_since(self, position: int, limit: int = 1000) -> list[dict[str, Any]]:
+        events = await self.event_store.get_all_events_since(
+            position=position,
+            limit=limit,
+            sources=self.lane.sources,
+            exclude_sources=self.lane.exclude_sources,
+        )
+        if not events:
+            return events
+
+        pending = await self._pending_in_other_lane(events)
+        for index, event in enumerate(events):
+            barrier = pending.get(str(event["stream_id"]))
+            if barrier is not None and event["global_position"] > barrier:
+                LOG.debug(
+                    "%s lane waits at position %d for stream %s",
+                    self.lane.name,
+                    event["global_position"],
+                    event["stream_id"],
+                )
+                return events[:index]
+        return events
+
+    async def _pending_in_other_lane(self, events: list[dict[str, Any]]) -> dict[str, int]:
+        """Earliest unprojected other-lane position per stream in ``events``."""
+        session = self.event_store.session
+        checkpoint = await session.get(SubscriptionModel, self.other_subscription_id)
+        other_position = int(checkpoint.last_position) if checkpoint else 0
+        streams = {UUID(str(event["stream_id"])) for event in events}
+
+        result = await session.execute(
+            select(EventModel.stream_id, func.min(EventModel.global_position))
+            .where(
+                and_(
+                    EventModel.tenant_id == self.tenant_id,
+                    EventModel.stream_id.in_(streams),
+                    EventModel.global_position > other_position,
+                    EventModel.global_position < events[-1]["global_position"],
+                    self.other.filter(),
+                )
+            )
+            .group_by(EventModel.stream_id)
+        )
+        return {str(stream_id): int(position) for stream_id, position in result.all()}
+
+
+class BackfillThrottle:
+    """Caps the backfill lane's sustained rate in events per second."""
+
+    def __init__(self, events_per_second: float) -> None:
+        self.events_per_second = events_per_second
+        self._ready_at = 0.0
+
+    def delay(self) -> float:
+        return max(self._ready_at - time.monotonic(), 0.0)
+
+    def spent(self, events: int) -> None:
+        if self.events_per_second > 0 and events:
+            self._ready_at = max(self._ready_at, time.monotonic()) + events / self.events_per_second
+
+
+class PriorityLaneRunner:
+    """Projects one tenant through the live and backfill lanes, live first."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        tenant_id: UUID,
+        projection_factory: ProjectionFactory = build_projections,
+        live_batch_size: int = 100,
+        backfill_batch_size: int = 500,
+        backfill_events_per_second: float = 2000.0,
+        poll_interval_seconds: float = 1.0,
+    ) -> None:
+        self.session_factory = session_factory
+        self.tenant_id = tenant_id
+        self.projection_factory = projection_factory
+        self.batch_sizes = {LIVE_LANE: live_batch_size, BACKFILL_LANE: backfill_batch_size}
+        self.throttle = BackfillThrottle(backfill_events_per_second)
+        self.poll_interval_seconds = poll_interval_seconds
+        self.metrics = {LIVE_LANE: RunnerMetrics(), BACKFILL_LANE: RunnerMetrics()}
+        self._seeded = False
+
+    async def run(self) -> None:
+        while True:
+            live = await self.run_lane_batch(LIVE_LANE)
+            if live >= self.batch_sizes[LIVE_LANE]:
+                continue
+
+            delay = self.throttle.delay()
+            if delay:
+                await asyncio.sleep(min(delay, self.poll_interval_seconds))
+                continue
+
+            backfill = await self.run_lane_batch(BACKFILL_LANE)
+            self.throttle.spent(backfill)
+            if not live and not backfill:
+                await asyncio.sleep(self.poll_interval_seconds)
+
+    async def run_lane_batch(self, lane: str) -> int:
+        """Project one batch of ``lane`` and commit it with that lane's checkpoint."""
+        other = BACKFILL_LANE if lane == LIVE_LANE else LIVE_LANE
+        async with self.session_factory() as session:
+            if not self._seeded:
+                await seed_lane_checkpoints(session, self.tenant_id)
+                self._seeded = True
+            runner = ProjectionRunner(
+                event_store=LaneEventSource(
+                    EventStore(session=session, tenant_id=self.tenant_id),
+                    LANES[lane],
+                    LANES[other],
+                    subscription_id_for(self.tenant_id, other),
+                ),
+                projections=self.projection_factory(session, self.tenant_id),
+                subscription_id=subscription_id_for(self.tenant_id, lane),
+                session=session,
+                batch_size=self.batch_sizes[lane],
+                metrics=self.metrics[lane],
+            )
+            return await runner.run_once()
+
+
+async def seed_lane_checkpoints(
+    session: AsyncSession,
+    tenant_id: UUID,
+    lanes: Sequence[str] = (BACKFILL_LANE,),
+) -> None:
+    """Start new lanes where the single combined subscription left off.
+
+    The live lane reuses the combined checkpoint name. Every event at or
+    before that position is already projected, whatever its origin, so a new
+    backfill lane starts from the same position instead of replaying them.
+    """
+    combined = await session.get(SubscriptionModel, subscription_id_for(tenant_id))
+    position = int(combined.last_position) if combined else 0
+    for lane in lanes:
+        subscription_id = subscription_id_for(tenant_id, lane)
+        if await session.get(SubscriptionModel, subscription_id) is None:
+            session.add(SubscriptionModel(subscription_id=subscription_id, last_position=position))
+            LOG.info("Seeded %s at position %d", subscription_id, position)
+    await session.commit()
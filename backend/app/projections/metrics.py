@@ -0,0 +1,113 @@
+import time
+from bisect import bisect_left
+from typing import Any
+
+# Upper bounds in seconds: 50us doubling up to ~26s, plus an overflow bucket.
+BUCKET_BOUNDS = tuple(0.00005 * 2**i for i in range(20))
+
+
+class Histogram:
+    """Fixed-bucket latency histogram; cheap enough to observe every handle call."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank:
+                return BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.max
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "max": round(self.max, 6),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class RunnerMetrics:
+    """Timings collected by a ProjectionRunner.
+
+    The snapshot is stored on the subscription row with each checkpoint, so
+    the API process and the CLI can read it without talking to the runner.
+    """
+
+    def __init__(self) -> None:
+        self.fetch = Histogram()
+        self.handle: dict[tuple[str, str], Histogram] = {}
+        self.events = 0
+        self.batches = 0
+        self.events_per_second = 0.0
+        self.mode: str | None = None
+        self.batch_size: int | None = None
+        self.mode_transitions = 0
+        self.failed_batches = 0
+        self.consecutive_failures = 0
+        self.last_error: str | None = None
+        self.started_at = time.time()
+
+    def observe_handle(self, projection: str, event_type: str, seconds: float) -> None:
+        key = (projection, event_type)
+        histogram = self.handle.get(key)
+        if histogram is None:
+            histogram = self.handle[key] = Histogram()
+        histogram.observe(seconds)
+
+    def record_batch(self, events: int, seconds: float) -> None:
+        self.events += events
+        self.batches += 1
+        self.consecutive_failures = 0
+        if seconds > 0:
+            self.events_per_second = events / seconds
+
+    def record_mode(self, mode: str, batch_size: int, transitions: int) -> None:
+        self.mode = mode
+        self.batch_size = batch_size
+        self.mode_transitions = transitions
+
+    def record_failure(self, exc: BaseException) -> None:
+        """A batch that raised out of the runner and was not checkpointed."""
+        self.failed_batches += 1
+        self.consecutive_failures += 1
+        self.last_error = f"{type(exc).__name__}: {exc}"[:500]
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "events": self.events,
+            "batches": self.batches,
+            "events_per_second": round(self.events_per_second, 2),
+            "mode": self.mode,
+            "batch_size": self.batch_size,
+            "mode_transitions": self.mode_transitions,
+            "failed_batches": self.failed_batches,
+            "consecutive_failures": self.consecutive_failures,
+            "last_error": self.last_error,
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "fetch_seconds": self.fetch.to_dict(),
+            "handle_seconds": [
+                {"projection": projection, "event_type": event_type, **histogram.to_dict()}
+                for (projection, event_type), histogram in sorted(self.handle.items())
+            ],
+        }
@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import time
+from typing import Any, Callable
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.event_store import EventStore
+from app.models.event_store import SubscriptionModel
+from app.models.tenant import Tenant
+from app.projections.batching import CATCH_UP, AdaptiveBatchController
+from app.projections.metrics import RunnerMetrics
+from app.projections.registry import build_projections, subscription_id_for
+from app.projections.runner import ProjectionRunner
+
+LOG = logging.getLogger("projections.pool")
+
+ProjectionFactory = Callable[[AsyncSession, UUID], list[Any]]
+
+
+class TenantProjectionPool:
+    """Projects every active tenant over a bounded pool of workers.
+
+    Tenants are scheduled round-robin with a quantum of one batch: a tenant
+    whose batch came back full goes to the back of the ready queue, so a large
+    replay for one hospital is interleaved with live updates for the others
+    instead of running to completion first. A tenant is never queued twice,
+    which keeps its events applied in order by a single worker at a time.
+
+    Each tenant keeps its own metrics and a batch controller pinned to that
+    quantum, so its status reports catch-up or live mode as a single
+    runner's does; a backlog earns a tenant more turns, never bigger ones.
+    A tenant whose batch fails is not rescheduled until
+    an exponential backoff (``poll_interval_seconds`` doubling up to
+    ``max_backoff_seconds``) has passed; the failure is logged and counted
+    in the metrics stored on its checkpoint row.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        projection_factory: ProjectionFactory = build_projections,
+        max_workers: int = 4,
+        batch_size: int = 100,
+        poll_interval_seconds: float = 1.0,
+        max_backoff_seconds: float = 60.0,
+    ) -> None:
+        self.session_factory = session_factory
+        self.projection_factory = projection_factory
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self._queue: asyncio.Queue[UUID] = asyncio.Queue()
+        self._scheduled: set[UUID] = set()
+        self._metrics: dict[UUID, RunnerMetrics] = {}
+        self._controllers: dict[UUID, AdaptiveBatchController] = {}
+        self._retry_at: dict[UUID, float] = {}
+
+    async def run(self) -> None:
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.max_workers)]
+        try:
+            while True:
+                for tenant_id in await self.discover_tenants():
+                    self._schedule(tenant_id)
+                await asyncio.sleep(self.poll_interval_seconds)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def discover_tenants(self) -> list[UUID]:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(Tenant.id).where(Tenant.is_active.is_(True)).order_by(Tenant.created_at)
+            )
+            return list(result.scalars().all())
+
+    async def run_tenant_batch(self, tenant_id: UUID) -> int:
+        controller = self._controller(tenant_id)
+        metrics = self.metrics(tenant_id)
+        async with self.session_factory() as session:
+            runner = ProjectionRunner(
+                event_store=EventStore(session=session, tenant_id=tenant_id),
+                projections=self.projection_factory(session, tenant_id),
+                subscription_id=subscription_id_for(tenant_id),
+                session=session,
+                batch_size=controller.size,
+                metrics=metrics,
+            )
+            started = time.perf_counter()
+            processed = await runner.run_once()
+        # The pool does its own polling, so the controller's idle delay is unused.
+        controller.after_batch(processed, time.perf_counter() - started)
+        metrics.record_mode(controller.mode, controller.size, controller.transitions)
+        return processed
+
+    def metrics(self, tenant_id: UUID) -> RunnerMetrics:
+        return self._metrics.setdefault(tenant_id, RunnerMetrics())
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Per-tenant metrics snapshots, including failures and any pending backoff."""
+        now = time.monotonic()
+        return {
+            str(tenant_id): {
+                **metrics.snapshot(),
+                "retry_in_seconds": round(max(self._retry_at.get(tenant_id, now) - now, 0.0), 3),
+            }
+            for tenant_id, metrics in self._metrics.items()
+        }
+
+    def _controller(self, tenant_id: UUID) -> AdaptiveBatchController:
+        controller = self._controllers.get(tenant_id)
+        if controller is None:
+            controller = self._controllers[tenant_id] = AdaptiveBatchController(
+                name=subscription_id_for(tenant_id),
+                # A fixed quantum: growing it would let one replay hold a worker.
+                min_size=self.batch_size,
+                max_size=self.batch_size,
+                poll_interval_seconds=self.poll_interval_seconds,
+            )
+        return controller
+
+    def _schedule(self, tenant_id: UUID) -> None:
+        if tenant_id in self._scheduled:
+            return
+        if self._retry_at.get(tenant_id, 0.0) > time.monotonic():
+            return
+        self._scheduled.add(tenant_id)
+        self._queue.put_nowait(tenant_id)
+
+    async def _worker(self) -> None:
+        while True:
+            tenant_id = await self._queue.get()
+            full = False
+            try:
+                await self.run_tenant_batch(tenant_id)
+                self._retry_at.pop(tenant_id, None)
+                full = self._controller(tenant_id).mode == CATCH_UP
+            except Exception as exc:
+                await self._record_failure(tenant_id, exc)
+            finally:
+                self._queue.task_done()
+
+            if full:
+                self._queue.put_nowait(tenant_id)
+            else:
+                self._scheduled.discard(tenant_id)
+
+    async def _record_failure(self, tenant_id: UUID, exc: Exception) -> None:
+        metrics = self.metrics(tenant_id)
+        metrics.record_failure(exc)
+        delay = min(
+            self.poll_interval_seconds * 2 ** (metrics.consecutive_failures - 1),
+            self.max_backoff_seconds,
+        )
+        self._retry_at[tenant_id] = time.monotonic() + delay
+        LOG.exception(
+            "Projection batch failed for tenant %s (%s in a row); retrying in %.1fs",
+            tenant_id,
+            metrics.consecutive_failures,
+            delay,
+        )
+        # The failed batch saved no checkpoint, so publish the metrics separately.
+        try:
+            async with self.session_factory() as session:
+                await session.execute(
+                    update(SubscriptionModel)
+                    .where(SubscriptionModel.subscription_id == subscription_id_for(tenant_id))
+                    .values(stats=metrics.snapshot())
+                )
+                await session.commit()
+        except Exception:
+            LOG.warning("Could not publish failure metrics for tenant %s", tenant_id, exc_info=True)
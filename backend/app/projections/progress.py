@@ -0,0 +1,65 @@
+"""Wakes readers waiting for a projection checkpoint to reach a position.
+
+Commands return the global position of the event they wrote; a read that
+passes it back as ``min_position`` waits here until the tenant's live
+checkpoint has caught up. A runner in the same process calls ``advance``
+after each commit, which wakes waiters at once. Runners in other processes
+are only seen through the checkpoint row, so waiters also re-read it on a
+short backoff.
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+LOG = logging.getLogger("projections.progress")
+
+MIN_POLL_SECONDS = 0.02
+MAX_POLL_SECONDS = 0.25
+
+
+class ProjectionProgress:
+    def __init__(self) -> None:
+        self._positions: dict[str, int] = {}
+        self._changed: dict[str, asyncio.Event] = {}
+
+    def advance(self, subscription_id: str, position: int) -> None:
+        if position > self._positions.get(subscription_id, 0):
+            self._positions[subscription_id] = position
+        changed = self._changed.pop(subscription_id, None)
+        if changed is not None:
+            changed.set()
+
+    def position(self, subscription_id: str) -> int:
+        return self._positions.get(subscription_id, 0)
+
+    async def wait_for(
+        self,
+        subscription_id: str,
+        position: int,
+        timeout: float,
+        read_checkpoint: Callable[[], Awaitable[int]],
+    ) -> bool:
+        """Wait until ``subscription_id`` has projected ``position``; False on timeout."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = MIN_POLL_SECONDS
+        while True:
+            if self.position(subscription_id) >= position:
+                return True
+            current = await read_checkpoint()
+            if current >= position:
+                self.advance(subscription_id, current)
+                return True
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                LOG.info("Timed out waiting for %s to reach %d (at %d)", subscription_id, position, current)
+                return False
+            changed = self._changed.setdefault(subscription_id, asyncio.Event())
+            try:
+                await asyncio.wait_for(changed.wait(), min(delay, remaining))
+            except asyncio.TimeoutError:
+                pass
+            delay = min(delay * 2, MAX_POLL_SECONDS)
+
+
+projection_progress = ProjectionProgress()
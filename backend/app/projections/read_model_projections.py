@@ -1,6 +1,10 @@
+import json
 from datetime import datetime, timezone
-from uuid import UUID
+from functools import lru_cache
+from typing import Any
+from uuid import UUID, uuid5
 
+from sqlalchemy import Boolean, DateTime, Float, literal, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.read_models import (
@@ -10,7 +14,19 @@ from app.models.read_models import (
     TimelineEventModel,
     TrajectoryPointModel,
     AttachmentReadModel,
+    AdmissionSummaryModel,
+    TrajectorySegmentModel,
+    UnitCensusModel,
+    CensusOccupantModel,
+    CareTeamAssignmentModel,
+    ReviewQueueModel,
+    AdmissionWatermarkModel,
+    CLINICAL_KIND_MODELS,
 )
+from app.projections.envelope import EventEnvelope
+
+DISCHARGE_LOCATIONS = {"Discharge", "Discharged", "DC"}
+PROCEDURE_EVENT_TYPES = {"procedure", "bedside_procedure"}
 
 
 class PatientProjection:
@@ -18,23 +34,28 @@ class PatientProjection:
         self.session = session
         self.tenant_id = tenant_id
 
-    async def handle(self, event: dict) -> None:
-        if event["event_type"] != "patient.created":
+    async def handle(self, event: EventEnvelope | dict) -> None:
+        event = EventEnvelope.wrap(event)
+        if event.event_type != "patient.created":
             return
 
-        data = event["data"]
-        patient_id = UUID(data["patient_id"])
+        data = event.data
+        patient_id = event.uuid("patient_id")
 
         existing = await self.session.get(PatientReadModel, patient_id)
         if existing:
             existing.data = data
-            existing.updated_at = datetime.now(timezone.utc)
+            existing.updated_at = event.now
         else:
             self.session.add(
                 PatientReadModel(
                     id=patient_id,
                     tenant_id=self.tenant_id,
                     data=data,
+                    # Set here rather than by the server so listing cursors
+                    # compare like-formatted timestamps on every backend.
+                    created_at=event.now,
+                    updated_at=event.now,
                 )
             )
 
@@ -44,17 +65,18 @@ class AdmissionProjection:
         self.session = session
         self.tenant_id = tenant_id
 
-    async def handle(self, event: dict) -> None:
-        if event["event_type"] == "admission.created":
-            data = event["data"]
-            admission_id = UUID(data["admission_id"])
-            patient_id = UUID(data["patient_id"])
+    async def handle(self, event: EventEnvelope | dict) -> None:
+        event = EventEnvelope.wrap(event)
+        if event.event_type == "admission.created":
+            data = event.data
+            admission_id = event.uuid("admission_id")
+            patient_id = event.uuid("patient_id")
 
             existing = await self.session.get(AdmissionReadModel, admission_id)
             if existing:
                 existing.data = data
                 existing.patient_id = patient_id
-                existing.updated_at = datetime.now(timezone.utc)
+                existing.updated_at = event.now
             else:
                 self.session.add(
                     AdmissionReadModel(
@@ -62,22 +84,25 @@ class AdmissionProjection:
                         tenant_id=self.tenant_id,
                         patient_id=patient_id,
                         data=data,
+                        created_at=event.now,
+                        updated_at=event.now,
                     )
                 )
 
-        if event["event_type"] == "admission.location_changed":
-            data = event["data"]
-            admission_id = UUID(data["admission_id"])
+        if event.event_type == "admission.location_changed":
+            data = event.data
+            admission_id = event.uuid("admission_id")
             location = data.get("to_location", "")
-            effective_at = _parse_datetime(data.get("effective_at"))
+            effective_at = event.timestamp("effective_at")
 
             self.session.add(
                 TrajectoryPointModel(
-                    id=UUID(data.get("trajectory_id") or event["event_id"]),
+                    id=event.id_or_event_id("trajectory_id"),
                     tenant_id=self.tenant_id,
                     admission_id=admission_id,
                     location=location,
                     effective_at=effective_at,
+                    sequence=int(data.get("sequence") or 0),
                     data=data,
                 )
             )
@@ -88,19 +113,20 @@ class FlightPlanProjection:
         self.session = session
         self.tenant_id = tenant_id
 
-    async def handle(self, event: dict) -> None:
-        if event["event_type"] != "flightplan.created":
+    async def handle(self, event: EventEnvelope | dict) -> None:
+        event = EventEnvelope.wrap(event)
+        if event.event_type != "flightplan.created":
             return
 
-        data = event["data"]
-        flightplan_id = UUID(data["flightplan_id"])
-        admission_id = UUID(data["admission_id"])
+        data = event.data
+        flightplan_id = event.uuid("flightplan_id")
+        admission_id = event.uuid("admission_id")
 
         existing = await self.session.get(FlightPlanReadModel, flightplan_id)
         if existing:
             existing.data = data
             existing.admission_id = admission_id
-            existing.updated_at = datetime.now(timezone.utc)
+            existing.updated_at = event.now
         else:
             self.session.add(
                 FlightPlanReadModel(
@@ -117,20 +143,21 @@ class TimelineProjection:
         self.session = session
         self.tenant_id = tenant_id
 
-    async def handle(self, event: dict) -> None:
-        if event["event_type"] != "clinical_event.recorded":
+    async def handle(self, event: EventEnvelope | dict) -> None:
+        event = EventEnvelope.wrap(event)
+        if event.event_type != "clinical_event.recorded":
             return
 
-        data = event["data"]
-        admission_id = UUID(data["admission_id"])
-        occurred_at = _parse_datetime(data.get("occurred_at"))
+        data = event.data
+        admission_id = event.uuid("admission_id")
+        occurred_at = event.timestamp("occurred_at")
 
         self.session.add(
             TimelineEventModel(
-                id=UUID(data.get("event_id") or event["event_id"]),
+                id=event.id_or_event_id("event_id"),
                 tenant_id=self.tenant_id,
                 admission_id=admission_id,
-                event_type=data.get("event_type", event["event_type"]),
+                event_type=data.get("event_type", event.event_type),
                 occurred_at=occurred_at,
                 data=data,
             )
@@ -142,14 +169,15 @@ class AttachmentProjection:
         self.session = session
         self.tenant_id = tenant_id
 
-    async def handle(self, event: dict) -> None:
-        if event["event_type"] != "attachment.added":
+    async def handle(self, event: EventEnvelope | dict) -> None:
+        event = EventEnvelope.wrap(event)
+        if event.event_type != "attachment.added":
             return
 
-        data = event["data"]
-        admission_id = UUID(data["admission_id"])
-        occurred_at = _parse_datetime(data.get("occurred_at"))
-        attachment_id = UUID(data.get("attachment_id") or event["event_id"])
+        data = event.data
+        admission_id = event.uuid("admission_id")
+        occurred_at = event.timestamp("occurred_at")
+        attachment_id = event.id_or_event_id("attachment_id")
 
         self.session.add(
             AttachmentReadModel(
@@ -162,13 +190,634 @@ class AttachmentProjection:
         )
 
 
-def _parse_datetime(value: str | None) -> datetime:
-    if value is None:
-        return datetime.now(timezone.utc)
+class AdmissionSummaryProjection:
+    """Maintains one summary row per admission for list and dashboard pages."""
+
+    def __init__(self, session: AsyncSession, tenant_id: UUID) -> None:
+        self.session = session
+        self.tenant_id = tenant_id
+
+    async def handle(self, event: EventEnvelope | dict) -> None:
+        event = EventEnvelope.wrap(event)
+        event_type = event.event_type
+        if event_type not in (
+            "admission.created",
+            "admission.location_changed",
+            "clinical_event.recorded",
+        ):
+            return
+
+        data = event.data
+        summary = await self._get_or_create(event.uuid("admission_id"), event.now)
+        summary.updated_at = event.now
+        # A retried dead letter is older than the row; it wins a time tie
+        # only if it also came later in the log.
+        stale = event.global_position < summary.position
+        summary.position = max(summary.position, event.global_position)
+
+        if event_type == "admission.created":
+            summary.admission_created = True
+            summary.patient_id = event.optional_uuid("patient_id")
+            if data.get("admit_date"):
+                summary.admit_at = event.timestamp("admit_date")
+            return
+
+        if event_type == "admission.location_changed":
+            effective_at = event.timestamp("effective_at")
+            location = data.get("to_location") or ""
+            summary.location_change_count += 1
+            # Until admission.created has been applied, the earliest
+            # location step stands in for the admission time.
+            if not summary.admission_created:
+                summary.admit_at = _earliest(summary.admit_at, effective_at)
+            if _is_newer(effective_at, summary.current_location_at, strict=stale):
+                summary.current_location = location
+                summary.current_location_at = effective_at
+            if location in DISCHARGE_LOCATIONS:
+                summary.discharge_at = _earliest(summary.discharge_at, effective_at)
+            return
+
+        occurred_at = event.timestamp("occurred_at")
+        kind = data.get("event_type")
+        summary.clinical_event_count += 1
+        risk = _risk_level(data) if kind == "risk_status" else None
+        if risk and _is_newer(occurred_at, summary.current_risk_at, strict=stale):
+            summary.current_risk = risk
+            summary.current_risk_at = occurred_at
+        if kind in PROCEDURE_EVENT_TYPES or risk == "Procedure":
+            summary.last_procedure_at = _latest(summary.last_procedure_at, occurred_at)
+        if risk == "Discharge":
+            summary.discharge_at = _earliest(summary.discharge_at, occurred_at)
+
+    async def _get_or_create(self, admission_id: UUID, now: datetime) -> AdmissionSummaryModel:
+        summary = await self.session.get(AdmissionSummaryModel, admission_id)
+        if summary is None:
+            summary = AdmissionSummaryModel(
+                id=admission_id,
+                tenant_id=self.tenant_id,
+                location_change_count=0,
+                clinical_event_count=0,
+                admission_created=False,
+                position=0,
+                created_at=now,
+            )
+            self.session.add(summary)
+        return summary
+
+
+class TrajectorySegmentProjection:
+    """Maintains time spans between consecutive active trajectory points.
+
+    Points are ordered per admission by (start_at, sequence, position). Each
+    active point owns the segment that runs until the next active point, so a
+    late or corrected point only relinks its immediate neighbours. A point is
+    inactive once another point names it in ``corrects_point_id``.
+    """
+
+    def __init__(self, session: AsyncSession, tenant_id: UUID) -> None:
+        self.session = session
+        self.tenant_id = tenant_id
+
+    async def handle(self, event: EventEnvelope | dict) -> None:
+        event = EventEnvelope.wrap(event)
+        if event.event_type != "admission.location_changed":
+            return
+
+        data = event.data
+        point_id = event.id_or_event_id("trajectory_id")
+        admission_id = event.uuid("admission_id")
+        segment = TrajectorySegmentModel(
+            id=point_id,
+            tenant_id=self.tenant_id,
+            admission_id=admission_id,
+            location=data.get("to_location") or "",
+            start_at=event.timestamp("effective_at"),
+            sequence=int(data.get("sequence") or 0),
+            position=event.global_position,
+            corrects_point_id=event.optional_uuid("corrects_point_id"),
+            # A correction can be projected before the point it supersedes.
+            active=not await self._is_corrected(admission_id, point_id),
+        )
+        self.session.add(segment)
+
+        if segment.corrects_point_id is not None:
+            corrected = await self.session.get(TrajectorySegmentModel, segment.corrects_point_id)
+            # A correction only supersedes a point of its own admission.
+            if corrected is not None and corrected.active and _same_admission(corrected, segment):
+                corrected.active = False
+                await self._close_gap(corrected)
+
+        if segment.active:
+            following = await self._adjacent(segment, before=False)
+            _close_segment(segment, following.start_at if following else None)
+            previous = await self._adjacent(segment, before=True)
+            if previous is not None:
+                _close_segment(previous, segment.start_at)
+
+    async def _is_corrected(self, admission_id: UUID, point_id: UUID) -> bool:
+        result = await self.session.execute(
+            select(TrajectorySegmentModel.id)
+            .where(TrajectorySegmentModel.tenant_id == self.tenant_id)
+            .where(TrajectorySegmentModel.admission_id == admission_id)
+            .where(TrajectorySegmentModel.corrects_point_id == point_id)
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def _close_gap(self, removed: TrajectorySegmentModel) -> None:
+        previous = await self._adjacent(removed, before=True)
+        if previous is not None:
+            following = await self._adjacent(removed, before=False)
+            _close_segment(previous, following.start_at if following else None)
+
+    async def _adjacent(
+        self, segment: TrajectorySegmentModel, before: bool
+    ) -> TrajectorySegmentModel | None:
+        key = tuple_(
+            TrajectorySegmentModel.start_at,
+            TrajectorySegmentModel.sequence,
+            TrajectorySegmentModel.position,
+        )
+        bound = tuple_(
+            literal(segment.start_at, TrajectorySegmentModel.start_at.type),
+            literal(segment.sequence, TrajectorySegmentModel.sequence.type),
+            literal(segment.position, TrajectorySegmentModel.position.type),
+        )
+        query = select(TrajectorySegmentModel).where(
+            TrajectorySegmentModel.tenant_id == self.tenant_id,
+            TrajectorySegmentModel.admission_id == segment.admission_id,
+            TrajectorySegmentModel.active.is_(True),
+            key < bound if before else key > bound,
+        )
+        if before:
+            query = query.order_by(
+                TrajectorySegmentModel.start_at.desc(),
+                TrajectorySegmentModel.sequence.desc(),
+                TrajectorySegmentModel.position.desc(),
+            )
+        else:
+            query = query.order_by(
+                TrajectorySegmentModel.start_at,
+                TrajectorySegmentModel.sequence,
+                TrajectorySegmentModel.position,
+            )
+        result = await self.session.execute(query.limit(1))
+        return result.scalar_one_or_none()
+
+
+class UnitCensusProjection:
+    """Keeps per-unit occupancy counters and the current occupant list.
+
+    Must run after TrajectorySegmentProjection: an admission's unit is the
+    location of its open active segment, so late points and corrections are
+    already resolved when the counters move.
+    """
+
+    def __init__(self, session: AsyncSession, tenant_id: UUID) -> None:
+        self.session = session
+        self.tenant_id = tenant_id
+
+    async def handle(self, event: EventEnvelope | dict) -> None:
+        event = EventEnvelope.wrap(event)
+        if event.event_type != "admission.location_changed":
+            return
+
+        admission_id = event.uuid("admission_id")
+        result = await self.session.execute(
+            select(TrajectorySegmentModel)
+            .where(TrajectorySegmentModel.tenant_id == self.tenant_id)
+            .where(TrajectorySegmentModel.admission_id == admission_id)
+            .where(TrajectorySegmentModel.active.is_(True))
+            .where(TrajectorySegmentModel.end_at.is_(None))
+            .limit(1)
+        )
+        open_segment = result.scalar_one_or_none()
+        if open_segment is not None and open_segment.location in DISCHARGE_LOCATIONS:
+            open_segment = None
+
+        occupant = await self.session.get(CensusOccupantModel, admission_id)
+        if occupant is not None and open_segment is not None and occupant.location == open_segment.location:
+            occupant.since = open_segment.start_at
+            return
+
+        if occupant is not None:
+            await self._adjust(occupant.location, -1, event.now)
+            if open_segment is None:
+                await self.session.delete(occupant)
+        if open_segment is None:
+            return
+        location = open_segment.location
+
+        if occupant is None:
+            self.session.add(
+                CensusOccupantModel(
+                    admission_id=admission_id,
+                    tenant_id=self.tenant_id,
+                    location=location,
+                    since=open_segment.start_at,
+                )
+            )
+        else:
+            occupant.location = location
+            occupant.since = open_segment.start_at
+        await self._adjust(location, 1, event.now)
+
+    async def _adjust(self, location: str, delta: int, now: datetime) -> None:
+        census = await self.session.get(UnitCensusModel, (self.tenant_id, location))
+        if census is None:
+            census = UnitCensusModel(tenant_id=self.tenant_id, location=location, occupancy=0)
+            self.session.add(census)
+        census.occupancy = max(census.occupancy + delta, 0)
+        census.updated_at = now
+
+
+class CareTeamProjection:
+    """Inverted index from clinician and role to the admissions they cover.
+
+    Must run after TrajectorySegmentProjection: a location step's team is
+    assigned for the span of the step's segment, which later or corrected
+    points can still move. Bedside procedures assign their team from
+    ``occurred_at`` to ``end_datetime``.
+    """
+
+    def __init__(self, session: AsyncSession, tenant_id: UUID) -> None:
+        self.session = session
+        self.tenant_id = tenant_id
+
+    async def handle(self, event: EventEnvelope | dict) -> None:
+        event = EventEnvelope.wrap(event)
+        if event.event_type == "admission.location_changed":
+            data = event.data
+            admission_id = event.uuid("admission_id")
+            teams = data.get("teams") or (data.get("legacy_fields") or {}).get("teams")
+            await self._assign(
+                admission_id=admission_id,
+                source="location",
+                source_id=event.id_or_event_id("trajectory_id"),
+                location=data.get("to_location") or None,
+                start_at=event.timestamp("effective_at"),
+                end_at=None,
+                teams=teams,
+            )
+            await self._sync_location_spans(admission_id)
+        elif event.event_type == "clinical_event.recorded":
+            data = event.data
+            if not data.get("teams"):
+                return
+            await self._assign(
+                admission_id=event.uuid("admission_id"),
+                source=str(data.get("event_type") or "clinical_event")[:50],
+                source_id=event.id_or_event_id("event_id"),
+                location=data.get("location") or None,
+                start_at=event.timestamp("occurred_at"),
+                # A procedure without an end is recorded as an instant.
+                end_at=event.timestamp("end_datetime" if data.get("end_datetime") else "occurred_at"),
+                teams=data["teams"],
+            )
+
+    async def _assign(
+        self,
+        admission_id: UUID,
+        source: str,
+        source_id: UUID,
+        location: str | None,
+        start_at: datetime,
+        end_at: datetime | None,
+        teams: Any,
+    ) -> None:
+        for role, key, name in parse_teams(teams):
+            assignment_id = uuid5(source_id, f"{role}:{key}")
+            assignment = await self.session.get(CareTeamAssignmentModel, assignment_id)
+            if assignment is None:
+                assignment = CareTeamAssignmentModel(id=assignment_id, tenant_id=self.tenant_id)
+                self.session.add(assignment)
+            assignment.clinician_key = key
+            assignment.clinician_name = name
+            assignment.role = role
+            assignment.admission_id = admission_id
+            assignment.location = location
+            assignment.source = source
+            assignment.source_id = source_id
+            assignment.start_at = start_at
+            assignment.end_at = end_at
+            assignment.active = True
+
+    async def _sync_location_spans(self, admission_id: UUID) -> None:
+        result = await self.session.execute(
+            select(CareTeamAssignmentModel)
+            .where(CareTeamAssignmentModel.tenant_id == self.tenant_id)
+            .where(CareTeamAssignmentModel.admission_id == admission_id)
+            .where(CareTeamAssignmentModel.source == "location")
+        )
+        assignments = result.scalars().all()
+        if not assignments:
+            return
+        result = await self.session.execute(
+            select(TrajectorySegmentModel)
+            .where(TrajectorySegmentModel.tenant_id == self.tenant_id)
+            .where(TrajectorySegmentModel.admission_id == admission_id)
+        )
+        segments = {segment.id: segment for segment in result.scalars().all()}
+        for assignment in assignments:
+            segment = segments.get(assignment.source_id)
+            if segment is None:
+                continue
+            assignment.start_at = segment.start_at
+            assignment.end_at = segment.end_at
+            assignment.active = segment.active
+
+
+def parse_teams(value: Any) -> list[tuple[str, str, str]]:
+    """(role, clinician key, display name) for each member of a teams value.
+
+    Legacy steps store teams as JSON text, sometimes encoded twice, shaped
+    like ``{"surgeon": [{"name": "Dr A"}], "anesthesia": [...]}``. Members
+    may carry an ``id``; otherwise the normalised name is the key.
+    """
+    for _ in range(2):
+        if not isinstance(value, str):
+            break
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return []
+    if not isinstance(value, dict):
+        return []
+
+    members: list[tuple[str, str, str]] = []
+    seen: set[tuple[str, str]] = set()
+    for role, people in value.items():
+        if not isinstance(people, list):
+            continue
+        role = str(role).strip().lower()[:100]
+        for person in people:
+            if isinstance(person, str):
+                person = {"name": person}
+            if not isinstance(person, dict):
+                continue
+            name = " ".join(str(person.get("name") or "").split())
+            key = clinician_key(person.get("id") or name)
+            if not role or not key or (role, key) in seen:
+                continue
+            seen.add((role, key))
+            members.append((role, key[:200], (name or key)[:200]))
+    return members
+
+
+def clinician_key(value) -> str:
+    """Case- and whitespace-insensitive lookup key for a clinician id or name."""
+    return " ".join(str(value or "").split()).lower()
+
+
+class ReviewQueueProjection:
+    """Keeps review date and on-track status per admission for the review queue.
+
+    Only each patient's latest admission (by admit date) is ``is_current``,
+    matching the legacy active admission.
+    """
+
+    def __init__(self, session: AsyncSession, tenant_id: UUID) -> None:
+        self.session = session
+        self.tenant_id = tenant_id
+
+    async def handle(self, event: EventEnvelope | dict) -> None:
+        event = EventEnvelope.wrap(event)
+        if event.event_type == "admission.created":
+            data = event.data
+            entry = await self._get_or_create(event.uuid("admission_id"))
+            entry.patient_id = event.uuid("patient_id")
+            entry.admit_at = event.timestamp("admit_date") if data.get("admit_date") else None
+            review_date = data.get("review_date") or (data.get("legacy_fields") or {}).get("review_date")
+            entry.review_date = _parse_timestamp(review_date)
+            entry.updated_at = event.now
+            await self._mark_current(entry)
+        elif event.event_type == "clinical_event.recorded":
+            data = event.data
+            if data.get("event_type") != "course_correction":
+                return
+            entry = await self._get_or_create(event.uuid("admission_id"))
+            entry.correction_count += 1
+            detail = "".join(str(data.get("detail") or "").split()).lower()
+            occurred_at = event.timestamp("occurred_at")
+            if (
+                data.get("correction_type") == "set"
+                and "ontrack:" in detail
+                and _is_newer(occurred_at, entry.on_track_set_at)
+            ):
+                entry.on_track_set = "ontrack:no" not in detail
+                entry.on_track_set_at = occurred_at
+            entry.on_track = entry.on_track_set is not False
+            entry.updated_at = event.now
+
+    async def _get_or_create(self, admission_id: UUID) -> ReviewQueueModel:
+        entry = await self.session.get(ReviewQueueModel, admission_id)
+        if entry is None:
+            entry = ReviewQueueModel(
+                admission_id=admission_id,
+                tenant_id=self.tenant_id,
+                is_current=True,
+                on_track=False,
+                correction_count=0,
+            )
+            self.session.add(entry)
+        return entry
+
+    async def _mark_current(self, entry: ReviewQueueModel) -> None:
+        result = await self.session.execute(
+            select(ReviewQueueModel)
+            .where(ReviewQueueModel.tenant_id == self.tenant_id)
+            .where(ReviewQueueModel.patient_id == entry.patient_id)
+        )
+        admissions = [a for a in result.scalars().all() if a.admission_id != entry.admission_id]
+        latest = entry
+        for admission in admissions:
+            if admission.admit_at is not None and (
+                latest.admit_at is None or _as_utc(admission.admit_at) > _as_utc(latest.admit_at)
+            ):
+                latest = admission
+        for admission in [entry, *admissions]:
+            admission.is_current = admission is latest
+
+
+# Promoted column -> source field in clinical_event.recorded data, per kind.
+CLINICAL_KIND_FIELDS = {
+    "annotation": {
+        "annotation": "annotation",
+        "annotation_type": "annotation_type",
+        "href": "href",
+        "special_node": "special_node",
+        "format": "format",
+    },
+    "feedback": {
+        "exit_at": "exit_datetime",
+        "score": "score",
+        "score_value": "score",
+        "performance": "performance",
+        "outcome": "outcome",
+        "notes": "notes",
+        "graph_visible": "graph_visible",
+        "suggested_edit": "suggested_edit",
+    },
+    "conference": {
+        "conference_type": "conference_type",
+        "action_items": "action_items",
+        "notes": "notes",
+    },
+    "bedside_procedure": {
+        "end_at": "end_datetime",
+        "procedure_type": "procedure_type",
+        "teams": "teams",
+        "notes": "notes",
+    },
+    "continuous_therapy": {
+        "therapy_type": "therapy_type",
+        "status": "status",
+        "notes": "notes",
+    },
+    "course_correction": {
+        "correction_type": "correction_type",
+        "detail": "detail",
+    },
+}
+
+
+class ClinicalKindProjection:
+    """Copies each clinical event kind into its own narrow, indexed table.
+
+    The full payload stays in ``timeline_events``; these tables hold only the
+    promoted columns that kind-specific filters need.
+    """
+
+    def __init__(self, session: AsyncSession, tenant_id: UUID) -> None:
+        self.session = session
+        self.tenant_id = tenant_id
+
+    async def handle(self, event: EventEnvelope | dict) -> None:
+        event = EventEnvelope.wrap(event)
+        if event.event_type != "clinical_event.recorded":
+            return
+        kind = str(event.data.get("event_type") or "")
+        model = CLINICAL_KIND_MODELS.get(kind)
+        if model is None:
+            return
+
+        event_id = event.id_or_event_id("event_id")
+        row = await self.session.get(model, event_id)
+        if row is None:
+            row = model(id=event_id, tenant_id=self.tenant_id)
+            self.session.add(row)
+        row.admission_id = event.uuid("admission_id")
+        row.occurred_at = event.timestamp("occurred_at")
+        for column, convert, field in _promoted_columns(kind):
+            setattr(row, column, convert(event.data.get(field)))
+
+
+class AdmissionWatermarkProjection:
+    """Records the position of the last event applied to each admission.
+
+    Written in the same transaction as the rows it vouches for, so an ETag
+    built from it never runs ahead of what readers can see.
+    """
+
+    def __init__(self, session: AsyncSession, tenant_id: UUID) -> None:
+        self.session = session
+        self.tenant_id = tenant_id
+
+    async def handle(self, event: EventEnvelope | dict) -> None:
+        event = EventEnvelope.wrap(event)
+        admission_id = event.optional_uuid("admission_id")
+        if admission_id is None:
+            return
+
+        watermark = await self.session.get(AdmissionWatermarkModel, admission_id)
+        if watermark is None:
+            watermark = AdmissionWatermarkModel(admission_id=admission_id, tenant_id=self.tenant_id, last_position=0)
+            self.session.add(watermark)
+        watermark.last_position = max(watermark.last_position, event.global_position)
+        watermark.projected_at = event.now
+
+
+@lru_cache(maxsize=None)
+def _promoted_columns(kind: str) -> tuple:
+    table = CLINICAL_KIND_MODELS[kind].__table__
+    return tuple(
+        (column, _column_converter(table.c[column]), field)
+        for column, field in CLINICAL_KIND_FIELDS[kind].items()
+    )
+
+
+def _column_converter(column):
+    if isinstance(column.type, DateTime):
+        return _parse_timestamp
+    if isinstance(column.type, Boolean):
+        return lambda value: str(value or "").strip().upper() in ("Y", "YES", "TRUE", "1")
+    if isinstance(column.type, Float):
+        return _parse_float
+    length = getattr(column.type, "length", None)
+
+    def to_text(value):
+        if value is None or value == "":
+            return None
+        text = value if isinstance(value, str) else json.dumps(value)
+        return text[:length] if length else text
+
+    return to_text
+
+
+def _parse_float(value) -> float | None:
     try:
-        parsed = datetime.fromisoformat(value)
-        if parsed.tzinfo is None:
-            return parsed.replace(tzinfo=timezone.utc)
-        return parsed
+        return float(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def _same_admission(a: TrajectorySegmentModel, b: TrajectorySegmentModel) -> bool:
+    return a.tenant_id == b.tenant_id and a.admission_id == b.admission_id
+
+
+def _close_segment(segment: TrajectorySegmentModel, end_at: datetime | None) -> None:
+    segment.end_at = end_at
+    if end_at is None:
+        segment.duration_hours = None
+    else:
+        segment.duration_hours = (_as_utc(end_at) - _as_utc(segment.start_at)).total_seconds() / 3600
+
+
+def _risk_level(data: dict) -> str | None:
+    if data.get("risk_level"):
+        return str(data["risk_level"])
+    # Legacy risks carry free text after the status word, e.g. "Procedure - cath".
+    words = str(data.get("risk") or "").split()
+    return words[0] if words else None
+
+
+def _parse_timestamp(value) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return _as_utc(datetime.fromisoformat(str(value)))
     except ValueError:
-        return datetime.now(timezone.utc)
+        return None
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _is_newer(candidate: datetime, current: datetime | None, strict: bool = False) -> bool:
+    if current is None:
+        return True
+    return _as_utc(candidate) > _as_utc(current) if strict else _as_utc(candidate) >= _as_utc(current)
+
+
+def _earliest(current: datetime | None, candidate: datetime) -> datetime:
+    if current is None or _as_utc(candidate) < _as_utc(current):
+        return candidate
+    return current
+
+
+def _latest(current: datetime | None, candidate: datetime) -> datetime:
+    if current is None or _as_utc(candidate) > _as_utc(current):
+        return candidate
+    return current
+
@@ -0,0 +1,334 @@
+import logging
+import time
+import traceback
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Iterable
+from uuid import UUID
+
+from sqlalchemy import DateTime, Table, bindparam, func, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+from sqlalchemy.schema import CreateTable, DropTable
+
+from app.core.plugins.registry import plugin_registry
+from app.infrastructure.event_store import EventStore
+from app.models.event_store import EventModel
+from app.models.read_models import READ_MODEL_TABLES
+from app.models.types import GUID
+from app.projections.dead_letters import apply_isolated, projection_name
+from app.projections.envelope import EventEnvelope
+from app.projections.pool import ProjectionFactory
+from app.projections.registry import (
+    BACKFILL_LANE,
+    LIVE_LANE,
+    build_projections,
+    subscription_id_for,
+)
+
+LOG = logging.getLogger("projections.rebuild")
+
+SHADOW_SCHEMA = "rebuild"
+
+
+class RebuildVerificationError(Exception):
+    """Raised when shadow tables fail the row-count check before cutover."""
+
+
+@dataclass
+class RebuildReport:
+    events: int = 0
+    seconds: float = 0.0
+    positions: dict[UUID, int] = field(default_factory=dict)
+    row_counts: dict[str, tuple[int, int]] = field(default_factory=dict)
+    parked: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.seconds if self.seconds > 0 else 0.0
+
+
+class ProjectionRebuilder:
+    """Rebuilds read models into shadow tables and swaps them in.
+
+    Projections run unchanged against a connection whose schema translate map
+    points the read-model tables at the ``rebuild`` schema (an attached
+    database on SQLite). Shadow tables are created without secondary indexes,
+    filled by replaying events through the normal projections and committing
+    every ``batch_size`` events, then indexed, checked against the live row
+    counts and swapped in with the subscription checkpoints in a single
+    transaction.
+
+    A batch that fails is replayed with each (event, projection) pair in its
+    own savepoint, as the runner does, so one malformed event cannot abort
+    the rebuild; the pairs that still fail are parked in
+    ``projection_dead_letters`` by the swap. The swap also resolves the open
+    letters of the rebuilt subscriptions, since the rebuild replayed those
+    events and a later ``retry`` must not apply them twice.
+
+    The shadow tables are filled by replay rather than bulk inserts on
+    purpose: the projections upsert and correct rows (segments, summaries,
+    census), so only the projection code knows the final rows, and reusing
+    it keeps a rebuild identical to live projection. Index-free shadow
+    tables and large commits carry most of the speed-up.
+
+    On PostgreSQL the swap drops each live table and moves the shadow table
+    into its schema (``ALTER TABLE ... SET SCHEMA``), which is a rename. On
+    SQLite a table cannot move between attached databases, so the swap
+    deletes the live rows and copies the shadow rows in. Both run in one
+    transaction, so readers see either the old or the new read models, but
+    on SQLite the swap costs a full copy.
+
+    Stop the live projection runner before the cutover; it resumes from the
+    rebuilt checkpoints once restarted.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        projection_factory: ProjectionFactory = build_projections,
+        tables: Iterable[Table] | None = None,
+        batch_size: int = 5000,
+        report_interval_seconds: float = 10.0,
+        allow_shrink: bool = False,
+    ) -> None:
+        self.engine = engine
+        self.projection_factory = projection_factory
+        # Plugin read models are rebuilt alongside the core ones by default.
+        self.tables = list(tables if tables is not None else READ_MODEL_TABLES + plugin_registry.tables())
+        self.batch_size = batch_size
+        self.report_interval_seconds = report_interval_seconds
+        self.allow_shrink = allow_shrink
+
+    async def rebuild(self) -> RebuildReport:
+        report = RebuildReport()
+        started = time.monotonic()
+
+        async with self.engine.begin() as conn:
+            # Plugin tables may not exist yet on a fresh install.
+            for table in self.tables:
+                await conn.run_sync(table.create, checkfirst=True)
+
+        async with self.engine.connect() as shadow:
+            await self._prepare_shadow(shadow)
+            try:
+                async with AsyncSession(self.engine) as reader, AsyncSession(bind=shadow) as writer:
+                    for tenant_id in await self._tenants(reader):
+                        report.positions[tenant_id] = await self._project_tenant(
+                            reader, writer, tenant_id, report, started
+                        )
+
+                async with shadow.begin():
+                    for table in self.tables:
+                        for index in table.indexes:
+                            # Index.create honours dialect-conditional (ddl_if) indexes.
+                            await shadow.run_sync(index.create)
+
+                report.row_counts = await self._verify(shadow)
+                await self._swap(shadow, report.positions, report.parked)
+            finally:
+                await self._release_shadow(shadow)
+
+        report.seconds = time.monotonic() - started
+        LOG.info(
+            "Rebuild complete: %d events in %.1fs (%.0f events/sec)",
+            report.events,
+            report.seconds,
+            report.events_per_second,
+        )
+        return report
+
+    async def _prepare_shadow(self, shadow: AsyncConnection) -> None:
+        if shadow.dialect.name == "sqlite":
+            await shadow.exec_driver_sql(f"ATTACH DATABASE ':memory:' AS {SHADOW_SCHEMA}")
+        else:
+            await shadow.exec_driver_sql(f"CREATE SCHEMA IF NOT EXISTS {SHADOW_SCHEMA}")
+        await shadow.commit()
+
+        # Modifies the connection in place: every ORM/Core statement on it now
+        # targets the shadow schema. Raw SQL below is deliberately untranslated.
+        await shadow.execution_options(schema_translate_map={None: SHADOW_SCHEMA})
+        async with shadow.begin():
+            for table in self.tables:
+                await shadow.execute(DropTable(table, if_exists=True))
+                await shadow.execute(CreateTable(table))
+
+    async def _release_shadow(self, shadow: AsyncConnection) -> None:
+        await shadow.rollback()
+        if shadow.dialect.name == "sqlite":
+            await shadow.exec_driver_sql(f"DETACH DATABASE {SHADOW_SCHEMA}")
+            await shadow.commit()
+
+    async def _tenants(self, reader: AsyncSession) -> list[UUID]:
+        result = await reader.execute(select(EventModel.tenant_id).distinct())
+        return list(result.scalars().all())
+
+    async def _project_tenant(
+        self,
+        reader: AsyncSession,
+        writer: AsyncSession,
+        tenant_id: UUID,
+        report: RebuildReport,
+        started: float,
+    ) -> int:
+        store = EventStore(session=reader, tenant_id=tenant_id)
+        projections = self.projection_factory(writer, tenant_id)
+        position = 0
+        last_report = time.monotonic()
+
+        while True:
+            events = await store.get_all_events_since(position=position, limit=self.batch_size)
+            if not events:
+                return position
+
+            envelopes = [EventEnvelope(event) for event in events]
+            try:
+                for envelope in envelopes:
+                    for projection in projections:
+                        await projection.handle(envelope)
+                await writer.commit()
+            except Exception:
+                await writer.rollback()
+                LOG.warning("Rebuild batch after position %s failed for tenant %s; isolating events", position, tenant_id)
+                for envelope in envelopes:
+                    for projection in projections:
+                        exc = await apply_isolated(writer, projection, envelope)
+                        if exc is not None:
+                            report.parked.append(_dead_letter(tenant_id, projection, envelope, exc))
+                await writer.commit()
+            position = events[-1]["global_position"]
+            report.events += len(events)
+
+            writer.expunge_all()
+            reader.expunge_all()
+
+            now = time.monotonic()
+            if now - last_report >= self.report_interval_seconds:
+                LOG.info(
+                    "Rebuild progress: tenant=%s position=%d events=%d (%.0f events/sec)",
+                    tenant_id,
+                    position,
+                    report.events,
+                    report.events / (now - started),
+                )
+                last_report = now
+
+    async def _verify(self, shadow: AsyncConnection) -> dict[str, tuple[int, int]]:
+        counts: dict[str, tuple[int, int]] = {}
+        async with AsyncSession(self.engine) as live:
+            for table in self.tables:
+                query = select(func.count()).select_from(table)
+                live_count = int((await live.execute(query)).scalar_one())
+                shadow_count = int((await shadow.execute(query)).scalar_one())
+                counts[table.name] = (live_count, shadow_count)
+                LOG.info("Row counts for %s: live=%d shadow=%d", table.name, live_count, shadow_count)
+        await shadow.rollback()
+
+        shrunk = [name for name, (live_count, shadow_count) in counts.items() if shadow_count < live_count]
+        if shrunk and not self.allow_shrink:
+            raise RebuildVerificationError(
+                f"Shadow tables have fewer rows than live tables: {', '.join(shrunk)}"
+            )
+        return counts
+
+    async def _swap(
+        self, shadow: AsyncConnection, positions: dict[UUID, int], parked: list[dict[str, Any]]
+    ) -> None:
+        async with shadow.begin():
+            if shadow.dialect.name == "sqlite":
+                for table in self.tables:
+                    # Named columns: a migrated table may order them differently from the model.
+                    columns = ", ".join(f'"{column.name}"' for column in table.columns)
+                    await shadow.exec_driver_sql(f"DELETE FROM main.{table.name}")
+                    await shadow.exec_driver_sql(
+                        f"INSERT INTO main.{table.name} ({columns}) "
+                        f"SELECT {columns} FROM {SHADOW_SCHEMA}.{table.name}"
+                    )
+            else:
+                live_schema = (await shadow.exec_driver_sql("SELECT current_schema()")).scalar_one()
+                for table in self.tables:
+                    await shadow.exec_driver_sql(f"DROP TABLE {live_schema}.{table.name}")
+                    await shadow.exec_driver_sql(
+                        f"ALTER TABLE {SHADOW_SCHEMA}.{table.name} SET SCHEMA {live_schema}"
+                    )
+
+            subscription_ids = []
+            for tenant_id, position in positions.items():
+                # Rebuilt tables cover every origin, so both lanes resume here.
+                for lane in (LIVE_LANE, BACKFILL_LANE):
+                    subscription_ids.append(subscription_id_for(tenant_id, lane))
+                    await _set_checkpoint(shadow, subscription_ids[-1], position)
+            await _reset_dead_letters(shadow, subscription_ids, parked)
+
+
+async def _set_checkpoint(conn: AsyncConnection, subscription_id: str, position: int) -> None:
+    # Plain SQL so the shadow connection's schema translation does not apply.
+    # A Python timestamp keeps the milliseconds the checkpoint ETag reads, so a
+    # rebuild within the same second as the run it replays still changes it.
+    updated_at = bindparam("updated_at", type_=DateTime(timezone=True))
+    params = {"subscription_id": subscription_id, "position": position, "updated_at": datetime.now(timezone.utc)}
+    result = await conn.execute(
+        text(
+            "UPDATE subscriptions SET last_position = :position, updated_at = :updated_at "
+            "WHERE subscription_id = :subscription_id"
+        ).bindparams(updated_at),
+        params,
+    )
+    if result.rowcount == 0:
+        await conn.execute(
+            text(
+                "INSERT INTO subscriptions (subscription_id, last_position, updated_at) "
+                "VALUES (:subscription_id, :position, :updated_at)"
+            ).bindparams(updated_at),
+            params,
+        )
+
+
+def _dead_letter(tenant_id: UUID, projection: Any, event: EventEnvelope, exc: Exception) -> dict[str, Any]:
+    name = projection_name(projection)
+    LOG.warning("Parking event %s (%s) for %s: %s", event["global_position"], event["event_type"], name, exc)
+    return {
+        "subscription_id": subscription_id_for(tenant_id),
+        "projection": name,
+        "tenant_id": tenant_id,
+        "event_id": UUID(event["event_id"]),
+        "event_type": event["event_type"],
+        "global_position": event["global_position"],
+        "error": "".join(traceback.format_exception(exc)),
+    }
+
+
+async def _reset_dead_letters(
+    conn: AsyncConnection, subscription_ids: list[str], parked: list[dict[str, Any]]
+) -> None:
+    # Plain SQL, as in _set_checkpoint. Every open letter was replayed by the
+    # rebuild, so all are resolved and the ones that failed again reopened.
+    now = bindparam("now", type_=DateTime(timezone=True))
+    await conn.execute(
+        text(
+            "UPDATE projection_dead_letters SET resolved_at = :now "
+            "WHERE resolved_at IS NULL AND subscription_id IN :subscription_ids"
+        ).bindparams(now, bindparam("subscription_ids", expanding=True)),
+        {"now": datetime.now(timezone.utc), "subscription_ids": subscription_ids},
+    )
+    ids = [bindparam(name, type_=GUID()) for name in ("id", "tenant_id", "event_id")]
+    for letter in parked:
+        params = {**letter, "id": uuid.uuid4(), "now": datetime.now(timezone.utc)}
+        result = await conn.execute(
+            text(
+                "UPDATE projection_dead_letters SET error = :error, attempts = attempts + 1, "
+                "last_attempt_at = :now, resolved_at = NULL "
+                "WHERE subscription_id = :subscription_id AND projection = :projection AND event_id = :event_id"
+            ).bindparams(now, ids[2]),
+            params,
+        )
+        if result.rowcount == 0:
+            await conn.execute(
+                text(
+                    "INSERT INTO projection_dead_letters (id, subscription_id, projection, tenant_id, event_id, "
+                    "event_type, global_position, error, attempts, created_at, last_attempt_at) "
+                    "VALUES (:id, :subscription_id, :projection, :tenant_id, :event_id, "
+                    ":event_type, :global_position, :error, 1, :now, :now)"
+                ).bindparams(now, *ids),
+                params,
+            )
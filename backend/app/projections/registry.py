@@ -0,0 +1,58 @@
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.plugins.registry import plugin_registry
+from app.projections.read_model_projections import (
+    PatientProjection,
+    AdmissionProjection,
+    FlightPlanProjection,
+    TimelineProjection,
+    AttachmentProjection,
+    AdmissionSummaryProjection,
+    TrajectorySegmentProjection,
+    UnitCensusProjection,
+    CareTeamProjection,
+    ReviewQueueProjection,
+    ClinicalKindProjection,
+    AdmissionWatermarkProjection,
+)
+
+READ_MODEL_SUBSCRIPTION = "read-models"
+LIVE_LANE = "live"
+BACKFILL_LANE = "backfill"
+
+
+def build_projections(session: AsyncSession, tenant_id: UUID) -> list[Any]:
+    return [
+        PatientProjection(session, tenant_id),
+        AdmissionProjection(session, tenant_id),
+        FlightPlanProjection(session, tenant_id),
+        TimelineProjection(session, tenant_id),
+        AttachmentProjection(session, tenant_id),
+        AdmissionSummaryProjection(session, tenant_id),
+        TrajectorySegmentProjection(session, tenant_id),
+        # Both read the segments written above.
+        UnitCensusProjection(session, tenant_id),
+        CareTeamProjection(session, tenant_id),
+        ReviewQueueProjection(session, tenant_id),
+        ClinicalKindProjection(session, tenant_id),
+        AdmissionWatermarkProjection(session, tenant_id),
+        *plugin_registry.build_projections(session, tenant_id),
+    ]
+
+
+def subscription_id_for(tenant_id: UUID, lane: str = LIVE_LANE) -> str:
+    """Checkpoint name for a tenant's read-model subscription.
+
+    The default tenant keeps the original unsuffixed name so single-tenant and
+    pooled runners share one checkpoint. The live lane uses the plain name;
+    the backfill lane appends ``:backfill``.
+    """
+    if tenant_id == UUID(get_settings().default_tenant_id):
+        name = READ_MODEL_SUBSCRIPTION
+    else:
+        name = f"{READ_MODEL_SUBSCRIPTION}:{tenant_id}"
+    return name if lane == LIVE_LANE else f"{name}:{lane}"
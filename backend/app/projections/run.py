@@ -1,40 +1,189 @@
+import argparse
 import asyncio
+import json
+import logging
+from pathlib import Path
 from uuid import UUID
 
 from app.core.config import get_settings
-from app.core.database import async_session_factory
+from app.core.database import async_session_factory, engine
+from app.core.plugins.registry import plugin_registry
 from app.infrastructure.event_store import EventStore
-from app.projections.read_model_projections import (
-    PatientProjection,
-    AdmissionProjection,
-    FlightPlanProjection,
-    TimelineProjection,
-    AttachmentProjection,
-)
+from app.projections.dead_letters import pending_subscriptions, replay_dead_letters
+from app.projections.lanes import PriorityLaneRunner
+from app.projections.pool import TenantProjectionPool
+from app.projections.rebuild import ProjectionRebuilder
+from app.projections.registry import build_projections, subscription_id_for
+from app.projections.snapshot import dump_snapshot, restore_snapshot
+from app.projections.status import projection_status
 from app.projections.runner import ProjectionRunner
 
 
-async def main() -> None:
+async def main(batch_size: int = 100) -> None:
     settings = get_settings()
     tenant_id = UUID(settings.default_tenant_id)
 
     async with async_session_factory() as session:
         event_store = EventStore(session=session, tenant_id=tenant_id)
-        projections = [
-            PatientProjection(session, tenant_id),
-            AdmissionProjection(session, tenant_id),
-            FlightPlanProjection(session, tenant_id),
-            TimelineProjection(session, tenant_id),
-            AttachmentProjection(session, tenant_id),
-        ]
+        projections = build_projections(session, tenant_id)
         runner = ProjectionRunner(
             event_store=event_store,
             projections=projections,
-            subscription_id="read-models",
+            subscription_id=subscription_id_for(tenant_id),
             session=session,
+            batch_size=batch_size,
         )
         await runner.run()
 
 
+async def main_lanes(batch_size: int, backfill_batch_size: int, backfill_rate: float) -> None:
+    runner = PriorityLaneRunner(
+        session_factory=async_session_factory,
+        tenant_id=UUID(get_settings().default_tenant_id),
+        live_batch_size=batch_size,
+        backfill_batch_size=backfill_batch_size,
+        backfill_events_per_second=backfill_rate,
+    )
+    await runner.run()
+
+
+async def main_all_tenants(workers: int, batch_size: int) -> None:
+    pool = TenantProjectionPool(
+        session_factory=async_session_factory,
+        max_workers=workers,
+        batch_size=batch_size,
+    )
+    await pool.run()
+
+
+async def rebuild(batch_size: int, allow_shrink: bool) -> None:
+    rebuilder = ProjectionRebuilder(
+        engine=engine,
+        batch_size=batch_size,
+        allow_shrink=allow_shrink,
+    )
+    await rebuilder.rebuild()
+
+
+async def retry() -> None:
+    async with async_session_factory() as session:
+        pending = await pending_subscriptions(session)
+
+    for tenant_id, subscription_id in pending:
+        async with async_session_factory() as session:
+            await replay_dead_letters(
+                session,
+                tenant_id=tenant_id,
+                subscription_id=subscription_id,
+                projections=build_projections(session, tenant_id),
+            )
+
+
+async def snapshot(path: Path) -> None:
+    counts = await dump_snapshot(engine, path)
+    print(f"Wrote {sum(counts.values())} rows from {len(counts)} tables to {path}")
+
+
+async def restore(path: Path, replace: bool) -> None:
+    counts = await restore_snapshot(engine, path, replace=replace)
+    print(f"Restored {sum(counts.values())} rows into {len(counts)} tables from {path}")
+
+
+async def status(all_tenants: bool) -> None:
+    tenant_ids = [UUID(get_settings().default_tenant_id)]
+    if all_tenants:
+        pool = TenantProjectionPool(session_factory=async_session_factory)
+        tenant_ids = await pool.discover_tenants()
+
+    async with async_session_factory() as session:
+        for tenant_id in tenant_ids:
+            print(json.dumps(await projection_status(session, tenant_id), indent=2))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Project events into read models.")
+    parser.add_argument("--log-level", default="INFO")
+    parser.add_argument(
+        "--all-tenants",
+        action="store_true",
+        help="Project every active tenant from the tenants table instead of the default tenant.",
+    )
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument(
+        "--lanes",
+        action="store_true",
+        help=(
+            "Project live events ahead of legacy backfill, each lane with its own checkpoint. "
+            "Once used, keep using it (or rebuild) so backfill events are not skipped."
+        ),
+    )
+    parser.add_argument("--backfill-batch-size", type=int, default=500)
+    parser.add_argument(
+        "--backfill-rate",
+        type=float,
+        default=2000.0,
+        help="Maximum backfill events per second with --lanes (0 for no limit).",
+    )
+
+    commands = parser.add_subparsers(dest="command")
+    rebuild_parser = commands.add_parser(
+        "rebuild",
+        help="Rebuild all read models into shadow tables and swap them in. Stop the runner first.",
+    )
+    rebuild_parser.add_argument("--batch-size", type=int, default=5000)
+    rebuild_parser.add_argument(
+        "--allow-shrink",
+        action="store_true",
+        help="Cut over even if a rebuilt table has fewer rows than the live one.",
+    )
+    commands.add_parser(
+        "retry",
+        help="Replay events parked in projection_dead_letters and resolve the ones that now succeed.",
+    )
+    snapshot_parser = commands.add_parser(
+        "snapshot",
+        help="Dump read models and checkpoints to a compressed snapshot file.",
+    )
+    snapshot_parser.add_argument("path", type=Path)
+    restore_parser = commands.add_parser(
+        "restore",
+        help="Load a snapshot into an empty database; the runner then projects only the tail.",
+    )
+    restore_parser.add_argument("path", type=Path)
+    restore_parser.add_argument(
+        "--replace",
+        action="store_true",
+        help="Delete existing read-model rows and checkpoints before loading.",
+    )
+    commands.add_parser(
+        "status",
+        help="Print checkpoint, lag and handle timings (use --all-tenants for every tenant).",
+    )
+    args = parser.parse_args()
+    if args.lanes and args.all_tenants and args.command is None:
+        # The pool projects each tenant over the single live checkpoint.
+        parser.error("--lanes projects the default tenant only; it cannot be combined with --all-tenants")
+    return args
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_args()
+    logging.basicConfig(level=args.log_level.upper(), format="%(levelname)s %(message)s")
+    asyncio.run(plugin_registry.create_tables(engine))
+    if args.command == "rebuild":
+        asyncio.run(rebuild(args.batch_size, args.allow_shrink))
+    elif args.command == "retry":
+        asyncio.run(retry())
+    elif args.command == "snapshot":
+        asyncio.run(snapshot(args.path))
+    elif args.command == "restore":
+        asyncio.run(restore(args.path, args.replace))
+    elif args.command == "status":
+        asyncio.run(status(args.all_tenants))
+    elif args.lanes:
+        asyncio.run(main_lanes(args.batch_size, args.backfill_batch_size, args.backfill_rate))
+    elif args.all_tenants:
+        asyncio.run(main_all_tenants(args.workers, args.batch_size))
+    else:
+        asyncio.run(main(args.batch_size))
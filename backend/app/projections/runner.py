@@ -1,11 +1,30 @@
 import asyncio
-from typing import Any
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Protocol
+from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.infrastructure.event_store import EventStore
+from app.infrastructure.response_cache import response_cache
 from app.models.event_store import SubscriptionModel
+from app.projections.batching import AdaptiveBatchController
+from app.projections.dead_letters import apply_isolated, park, projection_name
+from app.projections.envelope import EventEnvelope, touched_ids
+from app.projections.metrics import RunnerMetrics
+from app.projections.progress import projection_progress
+
+LOG = logging.getLogger("projections.runner")
+
+
+class EventSource(Protocol):
+    """What the runner reads events from: ``EventStore`` or a lane's view of it."""
+
+    tenant_id: UUID
+
+    async def get_all_events_since(self, position: int, limit: int = 1000) -> list[dict[str, Any]]: ...
 
 
 class ProjectionRunner:
@@ -13,37 +32,111 @@ class ProjectionRunner:
 
     def __init__(
         self,
-        event_store: EventStore,
+        event_store: EventSource,
         projections: list[Any],
         subscription_id: str,
         session: AsyncSession,
         poll_interval_seconds: float = 1.0,
+        batch_size: int = 100,
+        metrics: RunnerMetrics | None = None,
+        max_batch_size: int = 5000,
+        max_idle_seconds: float = 10.0,
     ) -> None:
         self.event_store = event_store
         self.projections = projections
         self.subscription_id = subscription_id
         self.session = session
         self.poll_interval_seconds = poll_interval_seconds
+        self.batch_size = batch_size
+        self.metrics = metrics or RunnerMetrics()
+        self.controller = AdaptiveBatchController(
+            name=subscription_id,
+            min_size=batch_size,
+            max_size=max_batch_size,
+            poll_interval_seconds=poll_interval_seconds,
+            max_idle_seconds=max_idle_seconds,
+        )
+        self._position: int | None = None
 
     async def run(self) -> None:
-        position = await self._get_checkpoint()
-
+        """Project continuously, sizing each batch with the adaptive controller."""
         while True:
-            events = await self.event_store.get_all_events_since(
-                position=position,
-                limit=100,
-            )
+            started = time.perf_counter()
+            processed = await self.run_once()
+            delay = self.controller.after_batch(processed, time.perf_counter() - started)
+            self.batch_size = self.controller.size
+            self.metrics.record_mode(self.controller.mode, self.batch_size, self.controller.transitions)
+            if delay:
+                await asyncio.sleep(delay)
 
-            if not events:
-                await asyncio.sleep(self.poll_interval_seconds)
-                continue
+    async def run_once(self) -> int:
+        """Project a single batch and commit it with the checkpoint.
 
-            for event in events:
-                for projection in self.projections:
-                    await projection.handle(event)
-                position = event["global_position"]
+        Returns the number of events applied; a full batch means more events
+        are likely waiting. If the batch fails, it is rolled back and replayed
+        with each (event, projection) pair in its own savepoint; pairs that
+        still fail are parked in ``projection_dead_letters`` and the
+        checkpoint moves past them.
+        """
+        if self._position is None:
+            self._position = await self._get_checkpoint()
 
+        started = time.perf_counter()
+        events = await self.event_store.get_all_events_since(
+            position=self._position,
+            limit=self.batch_size,
+        )
+        self.metrics.fetch.observe(time.perf_counter() - started)
+        if not events:
+            return 0
+
+        position = events[-1]["global_position"]
+        # Decode once; every projection shares the envelope's parsed fields.
+        envelopes = [EventEnvelope(event) for event in events]
+        names = [projection_name(projection) for projection in self.projections]
+        try:
+            for envelope in envelopes:
+                for name, projection in zip(names, self.projections):
+                    handle_started = time.perf_counter()
+                    await projection.handle(envelope)
+                    self.metrics.observe_handle(
+                        name, envelope.event_type, time.perf_counter() - handle_started
+                    )
+            self.metrics.record_batch(len(events), time.perf_counter() - started)
+            await self._save_checkpoint(position)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            LOG.warning(
+                "Batch after position %s failed for %s; isolating events",
+                self._position,
+                self.subscription_id,
+            )
+            await self._run_isolated(envelopes)
+            self.metrics.record_batch(len(events), time.perf_counter() - started)
             await self._save_checkpoint(position)
+            await self.session.commit()
+
+        self._position = position
+        # Invalidate first: a reader released by the advance must not find the old entry.
+        if response_cache.enabled:
+            await response_cache.invalidate(self.event_store.tenant_id, *touched_ids(envelopes))
+        projection_progress.advance(self.subscription_id, position)
+        return len(events)
+
+    async def _run_isolated(self, events: list[EventEnvelope]) -> None:
+        for event in events:
+            for projection in self.projections:
+                exc = await apply_isolated(self.session, projection, event)
+                if exc is not None:
+                    await park(
+                        self.session,
+                        self.subscription_id,
+                        self.event_store.tenant_id,
+                        projection,
+                        event,
+                        exc,
+                    )
 
     async def _get_checkpoint(self) -> int:
         result = await self.session.execute(
@@ -65,6 +158,13 @@ class ProjectionRunner:
                 SubscriptionModel.subscription_id == self.subscription_id
             )
         )
-        subscription = result.scalar_one()
+        subscription = result.scalar_one_or_none()
+        if subscription is None:
+            # The row created by _get_checkpoint is lost if the batch rolled back.
+            subscription = SubscriptionModel(subscription_id=self.subscription_id)
+            self.session.add(subscription)
         subscription.last_position = position
+        subscription.stats = self.metrics.snapshot()
+        subscription.updated_at = datetime.now(timezone.utc)
         await self.session.flush()
+
@@ -0,0 +1,217 @@
+"""Dump and restore projected read models for bootstrapping a node.
+
+A snapshot is a gzip-compressed JSON Lines file: a header, then for each
+table a ``table`` line with its column names, one JSON array per row, and an
+``end`` line with the row count. Every table is read in one repeatable-read
+transaction, so the read models and the ``subscriptions`` checkpoints in the
+file agree. A node restored from it resumes projecting from those
+checkpoints.
+"""
+import gzip
+import json
+import logging
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator, cast
+from uuid import UUID
+
+from sqlalchemy import JSON, DateTime, Table, func, inspect, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.plugins.registry import plugin_registry
+from app.models.event_store import ProjectionDeadLetterModel, SubscriptionModel
+from app.models.read_models import READ_MODEL_TABLES
+from app.models.types import GUID
+
+LOG = logging.getLogger("projections.snapshot")
+
+SNAPSHOT_FORMAT = "flightplan-read-models"
+SNAPSHOT_VERSION = 1
+COPY_CHUNK_ROWS = 5000
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot file cannot be restored into this database."""
+
+
+def snapshot_tables() -> list[Table]:
+    # Dead letters travel with the checkpoints that moved past them.
+    return [
+        *READ_MODEL_TABLES,
+        *plugin_registry.tables(),
+        cast(Table, SubscriptionModel.__table__),
+        cast(Table, ProjectionDeadLetterModel.__table__),
+    ]
+
+
+async def dump_snapshot(
+    engine: AsyncEngine,
+    path: Path,
+    tables: Iterable[Table] | None = None,
+) -> dict[str, int]:
+    tables = list(tables) if tables is not None else snapshot_tables()
+    counts: dict[str, int] = {}
+
+    async with engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execution_options(isolation_level="REPEATABLE READ")
+        async with conn.begin():
+            # Plugin tables only exist once a runner has started with the plugin.
+            existing = set(await conn.run_sync(lambda sync: inspect(sync).get_table_names()))
+            tables = [table for table in tables if table.name in existing]
+            with gzip.open(path, "wt", encoding="utf-8") as handle:
+                _write(
+                    handle,
+                    {
+                        "format": SNAPSHOT_FORMAT,
+                        "version": SNAPSHOT_VERSION,
+                        "created_at": datetime.now(timezone.utc).isoformat(),
+                        "tables": [table.name for table in tables],
+                    },
+                )
+                for table in tables:
+                    columns = [column.name for column in table.columns]
+                    _write(handle, {"table": table.name, "columns": columns})
+                    rows = 0
+                    result = await conn.stream(select(table))
+                    async for partition in result.partitions(COPY_CHUNK_ROWS):
+                        for row in partition:
+                            handle.write(json.dumps(list(row), default=_encode, separators=(",", ":")))
+                            handle.write("\n")
+                        rows += len(partition)
+                    _write(handle, {"end": table.name, "rows": rows})
+                    counts[table.name] = rows
+                    LOG.info("Dumped %d rows from %s", rows, table.name)
+    return counts
+
+
+async def restore_snapshot(
+    engine: AsyncEngine,
+    path: Path,
+    tables: Iterable[Table] | None = None,
+    replace: bool = False,
+) -> dict[str, int]:
+    """Load a snapshot in one transaction, using COPY on PostgreSQL.
+
+    Refuses to touch non-empty tables unless ``replace`` is set, in which
+    case the existing rows are removed first.
+    """
+    tables_by_name = {
+        table.name: table for table in (list(tables) if tables is not None else snapshot_tables())
+    }
+    counts: dict[str, int] = {}
+
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        lines = iter(handle)
+        header = json.loads(next(lines, "{}"))
+        if header.get("format") != SNAPSHOT_FORMAT or header.get("version") != SNAPSHOT_VERSION:
+            raise SnapshotError(f"{path} is not a version {SNAPSHOT_VERSION} read-model snapshot")
+        unknown = [name for name in header["tables"] if name not in tables_by_name]
+        if unknown:
+            raise SnapshotError(f"Snapshot has tables this database does not: {', '.join(unknown)}")
+
+        async with engine.begin() as conn:
+            for name in header["tables"]:
+                await conn.run_sync(tables_by_name[name].create, checkfirst=True)
+            await _clear(conn, [tables_by_name[name] for name in header["tables"]], replace)
+
+            for _ in header["tables"]:
+                section = json.loads(next(lines))
+                table = tables_by_name[section["table"]]
+                expected = [column.name for column in table.columns]
+                if section["columns"] != expected:
+                    raise SnapshotError(
+                        f"Columns of {table.name} differ from the snapshot; migrate both to the same revision"
+                    )
+                rows = await _load_table(conn, table, _section_rows(lines, table))
+                counts[table.name] = rows
+                LOG.info("Restored %d rows into %s", rows, table.name)
+    return counts
+
+
+async def _clear(conn: AsyncConnection, tables: list[Table], replace: bool) -> None:
+    populated = []
+    for table in tables:
+        count = (await conn.execute(select(func.count()).select_from(table))).scalar_one()
+        if count:
+            populated.append(table.name)
+    if populated and not replace:
+        raise SnapshotError(
+            f"Tables already contain rows: {', '.join(populated)} (pass replace to overwrite)"
+        )
+    for table in tables:
+        if table.name in populated:
+            await conn.execute(table.delete())
+
+
+def _section_rows(lines: Iterator[str], table: Table) -> Iterator[list[Any]]:
+    decoders = [_decoder(column) for column in table.columns]
+    for line in lines:
+        if line.startswith("{"):
+            marker = json.loads(line)
+            if marker.get("end") != table.name:
+                raise SnapshotError(f"Snapshot section for {table.name} is truncated")
+            return
+        values = json.loads(line)
+        yield [decode(value) if value is not None else None for decode, value in zip(decoders, values)]
+    raise SnapshotError(f"Snapshot ended inside {table.name}")
+
+
+async def _load_table(conn: AsyncConnection, table: Table, rows: Iterator[list[Any]]) -> int:
+    names = [column.name for column in table.columns]
+    total = 0
+    chunk: list[list[Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= COPY_CHUNK_ROWS:
+            total += await _copy(conn, table, names, chunk)
+            chunk = []
+    if chunk:
+        total += await _copy(conn, table, names, chunk)
+    return total
+
+
+async def _copy(conn: AsyncConnection, table: Table, names: list[str], chunk: list[list[Any]]) -> int:
+    if conn.dialect.name == "postgresql" and conn.dialect.driver == "asyncpg":
+        raw = await conn.get_raw_connection()
+        driver_connection = raw.driver_connection
+        if driver_connection is None:
+            raise SnapshotError("the database connection was closed during restore")
+        json_columns = [isinstance(column.type, JSON) for column in table.columns]
+        records = [
+            tuple(
+                json.dumps(value) if is_json and value is not None else value
+                for is_json, value in zip(json_columns, row)
+            )
+            for row in chunk
+        ]
+        await driver_connection.copy_records_to_table(table.name, records=records, columns=names)
+    else:
+        await conn.execute(table.insert(), [dict(zip(names, row)) for row in chunk])
+    return len(chunk)
+
+
+def _decoder(column) -> Any:
+    if isinstance(column.type, DateTime):
+        return _parse_datetime
+    if isinstance(column.type, GUID):
+        return UUID
+    return lambda value: value
+
+
+def _parse_datetime(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Cannot encode {type(value).__name__} in a snapshot")
+
+
+def _write(handle, payload: dict[str, Any]) -> None:
+    handle.write(json.dumps(payload))
+    handle.write("\n")
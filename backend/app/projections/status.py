@@ -0,0 +1,95 @@
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.event_store import EventModel, SubscriptionModel
+from app.projections.lanes import LANES
+from app.projections.registry import LIVE_LANE, subscription_id_for
+
+
+async def projection_status(session: AsyncSession, tenant_id: UUID) -> dict[str, Any]:
+    """Checkpoint, lag and the runner's last published timings for a tenant.
+
+    A tenant projected through lanes has a checkpoint per lane. Each lane's
+    position and lag (events of its own origin past its checkpoint) is listed
+    under ``lanes``, and the top-level position is the lowest of them, so a
+    live lane that is caught up does not hide a backfill that is behind.
+    """
+    subscription_id = subscription_id_for(tenant_id)
+    subscription = await session.get(SubscriptionModel, subscription_id)
+    position = int(subscription.last_position) if subscription else 0
+
+    result = await session.execute(
+        select(func.max(EventModel.global_position)).where(EventModel.tenant_id == tenant_id)
+    )
+    head = int(result.scalar_one_or_none() or 0)
+
+    lanes: dict[str, dict[str, Any]] = {}
+    for lane in LANES.values():
+        if lane.name == LIVE_LANE:
+            continue
+        checkpoint = await session.get(SubscriptionModel, subscription_id_for(tenant_id, lane.name))
+        if checkpoint is None:
+            continue
+        if not lanes:
+            lanes[LIVE_LANE] = await _lane_status(session, tenant_id, LIVE_LANE, subscription)
+        lanes[lane.name] = await _lane_status(session, tenant_id, lane.name, checkpoint)
+    if lanes:
+        position = min(lane_status["position"] for lane_status in lanes.values())
+
+    last_event_at: datetime | None = None
+    if position:
+        last_event_at = await session.scalar(
+            select(EventModel.created_at).where(EventModel.global_position == position)
+        )
+
+    now = datetime.now(timezone.utc)
+    status = {
+        "subscription_id": subscription_id,
+        "position": position,
+        "head_position": head,
+        "lag_events": max(head - position, 0),
+        "last_event_at": _iso(last_event_at),
+        "last_event_age_seconds": (
+            round((now - _as_utc(last_event_at)).total_seconds(), 1) if last_event_at else None
+        ),
+        "checkpoint_updated_at": _iso(subscription.updated_at) if subscription else None,
+        "runner": subscription.stats if subscription and subscription.stats else None,
+    }
+    if lanes:
+        status["lanes"] = lanes
+    return status
+
+
+async def _lane_status(
+    session: AsyncSession,
+    tenant_id: UUID,
+    lane: str,
+    checkpoint: SubscriptionModel | None,
+) -> dict[str, Any]:
+    position = int(checkpoint.last_position) if checkpoint else 0
+    result = await session.execute(
+        select(func.count())
+        .select_from(EventModel)
+        .where(EventModel.tenant_id == tenant_id)
+        .where(EventModel.global_position > position)
+        .where(LANES[lane].filter())
+    )
+    return {
+        "subscription_id": subscription_id_for(tenant_id, lane),
+        "position": position,
+        "lag_events": int(result.scalar_one()),
+        "checkpoint_updated_at": _iso(checkpoint.updated_at) if checkpoint else None,
+        "runner": checkpoint.stats if checkpoint and checkpoint.stats else None,
+    }
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _iso(value: datetime | None) -> str | None:
+    return _as_utc(value).isoformat() if value else None
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+"""Measure the per-event decode cost saved by sharing one EventEnvelope.
+
+Two measurements over the same synthetic events:
+
+* decode: the UUID/timestamp reads each read-model projection makes for an
+  event type, done with a fresh envelope per projection (the old behaviour,
+  where every projection re-parsed the raw dict) versus one shared envelope
+  (what the runner does now).
+* projections: the real read-model projections against an in-memory session
+  stub, which adds model and SQL statement construction. Statement building
+  dominates here, so expect the decode saving to show up as a smaller share.
+
+    PYTHONPATH=. python scripts/bench_event_envelope.py --events 20000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from app.projections.envelope import EventEnvelope
+from app.projections.registry import build_projections
+
+# Fields each projection decodes, per event type (see read_model_projections).
+DECODES = {
+    "admission.location_changed": [
+        # AdmissionProjection
+        [("uuid", "admission_id"), ("ts", "effective_at"), ("id", "trajectory_id")],
+        # AdmissionSummaryProjection
+        [("uuid", "admission_id"), ("now", None), ("ts", "effective_at")],
+        # TrajectorySegmentProjection
+        [("id", "trajectory_id"), ("uuid", "admission_id"), ("ts", "effective_at"), ("opt", "corrects_point_id")],
+        # UnitCensusProjection
+        [("uuid", "admission_id")],
+    ],
+    "clinical_event.recorded": [
+        # TimelineProjection
+        [("uuid", "admission_id"), ("ts", "occurred_at"), ("id", "event_id")],
+        # AdmissionSummaryProjection
+        [("uuid", "admission_id"), ("now", None), ("ts", "occurred_at")],
+    ],
+}
+
+
+class _Result:
+    def scalar_one_or_none(self):
+        return None
+
+
+class StubSession:
+    """Just enough of AsyncSession for projections to run without a database."""
+
+    def add(self, instance) -> None:
+        pass
+
+    async def get(self, model, key):
+        return None
+
+    async def execute(self, statement):
+        return _Result()
+
+    async def delete(self, instance) -> None:
+        pass
+
+
+def build_events(count: int) -> list[dict]:
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    admission_ids = [str(uuid4()) for _ in range(max(count // 20, 1))]
+    events = []
+    for index in range(count):
+        admission_id = admission_ids[index % len(admission_ids)]
+        at = (start + timedelta(minutes=index)).isoformat()
+        if index % 2:
+            event_type = "admission.location_changed"
+            data = {
+                "admission_id": admission_id,
+                "trajectory_id": str(uuid4()),
+                "to_location": "CICU",
+                "effective_at": at,
+            }
+        else:
+            event_type = "clinical_event.recorded"
+            data = {
+                "admission_id": admission_id,
+                "event_id": str(uuid4()),
+                "event_type": "note",
+                "occurred_at": at,
+            }
+        events.append(
+            {
+                "event_id": str(uuid4()),
+                "event_type": event_type,
+                "data": data,
+                "global_position": index + 1,
+            }
+        )
+    return events
+
+
+def _read(envelope: EventEnvelope, kind: str, key: str | None) -> None:
+    if kind == "uuid":
+        envelope.uuid(key)
+    elif kind == "ts":
+        envelope.timestamp(key)
+    elif kind == "id":
+        envelope.id_or_event_id(key)
+    elif kind == "opt":
+        envelope.optional_uuid(key)
+    else:
+        envelope.now
+
+
+def decode(events: list[dict], shared: bool) -> float:
+    gc.collect()
+    started = time.process_time()
+    for event in events:
+        envelope = EventEnvelope(event)
+        for reads in DECODES[event["event_type"]]:
+            item = envelope if shared else EventEnvelope(event)
+            for kind, key in reads:
+                _read(item, kind, key)
+    return time.process_time() - started
+
+
+async def project(events: list[dict], shared: bool) -> float:
+    projections = build_projections(StubSession(), uuid4())
+    gc.collect()
+    started = time.process_time()
+    for event in events:
+        item = EventEnvelope(event) if shared else event
+        for projection in projections:
+            await projection.handle(item)
+    return time.process_time() - started
+
+
+async def main(count: int, rounds: int) -> None:
+    events = build_events(count)
+    print(f"{count} events, best of {rounds}")
+
+    for title, bench in (("decode", decode), ("projections", project)):
+        best = {False: float("inf"), True: float("inf")}
+        # Interleave the modes so warm-up and GC pressure hit both equally.
+        for _ in range(rounds):
+            for shared in (False, True):
+                result = bench(events, shared)
+                if asyncio.iscoroutine(result):
+                    result = await result
+                best[shared] = min(best[shared], result)
+        print(f"{title}:")
+        print(f"  per projection   {best[False] * 1e6 / count:8.2f} us/event")
+        print(f"  shared envelope  {best[True] * 1e6 / count:8.2f} us/event")
+        print(f"  saved            {(best[False] - best[True]) * 1e6 / count:8.2f} us/event")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark shared event envelopes.")
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=5)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(main(args.events, args.rounds))
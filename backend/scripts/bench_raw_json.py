@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+"""Measure what passing stored JSON through undecoded saves per read request.
+
+Both paths read one admission's timeline from a file-backed SQLite database
+and build the response body:
+
+* decode: select ORM rows (the driver decodes each ``data`` column into
+  dicts), then run them through ``jsonable_encoder`` and ``JSONResponse``,
+  which is what FastAPI does for a route returning a dict.
+* passthrough: select ``CAST(data AS TEXT)`` and splice the text into the
+  body (``app.api.raw_json``), encoding only the envelope.
+
+Latency is wall time per request, including the query; CPU is process time
+across all threads, so it includes the aiosqlite worker running the query.
+
+    PYTHONPATH=. python scripts/bench_raw_json.py --rows 500 --requests 200
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.api import raw_json
+from app.models.base import Base
+from app.models.read_models import TimelineEventModel
+
+
+def build_rows(tenant_id, admission_id, count: int) -> list[TimelineEventModel]:
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    rows = []
+    for index in range(count):
+        at = start + timedelta(minutes=index)
+        rows.append(
+            TimelineEventModel(
+                id=uuid4(),
+                tenant_id=tenant_id,
+                admission_id=admission_id,
+                event_type="vital",
+                occurred_at=at,
+                data={
+                    "event_id": str(uuid4()),
+                    "event_type": "vital",
+                    "occurred_at": at.isoformat(),
+                    "details": {"hr": 120 + index % 30, "map": 60 + index % 15, "spo2": 92, "source": "monitor"},
+                    "legacy_fields": {f"field_{n}": f"value {n}" for n in range(20)},
+                },
+            )
+        )
+    return rows
+
+
+def _query(tenant_id, admission_id):
+    return (
+        select(TimelineEventModel)
+        .where(TimelineEventModel.tenant_id == tenant_id)
+        .where(TimelineEventModel.admission_id == admission_id)
+        .order_by(TimelineEventModel.occurred_at)
+    )
+
+
+async def decode(session, query) -> bytes:
+    rows = (await session.execute(query)).scalars().all()
+    return JSONResponse(jsonable_encoder({"items": [row.data for row in rows]})).body
+
+
+async def passthrough(session, query) -> bytes:
+    texts = (await session.execute(query.with_only_columns(raw_json.raw_data(TimelineEventModel)))).scalars().all()
+    return raw_json.splice({"items": texts}, "items")
+
+
+async def run(async_session, bench, query, requests: int) -> tuple[float, float, int]:
+    gc.collect()
+    size = 0
+    wall, cpu = time.perf_counter(), time.process_time()
+    for _ in range(requests):
+        # A session per request, as get_session gives each route.
+        async with async_session() as session:
+            size = len(await bench(session, query))
+    return time.perf_counter() - wall, time.process_time() - cpu, size
+
+
+async def main(rows: int, requests: int, rounds: int, directory: str) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(directory, 'bench.db')}")
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    tenant_id, admission_id = uuid4(), uuid4()
+    async with async_session() as session:
+        session.add_all(build_rows(tenant_id, admission_id, rows))
+        await session.commit()
+    query = _query(tenant_id, admission_id)
+
+    encoder = "orjson" if raw_json.orjson is not None else "json"
+    print(f"{rows} rows per response, {requests} requests, best of {rounds}, envelope via {encoder}")
+    benches = (("decode", decode), ("passthrough", passthrough))
+    best = {title: (float("inf"), float("inf"), 0) for title, _ in benches}
+    # Interleave the paths so warm-up and GC pressure hit both equally.
+    for _ in range(rounds):
+        for title, bench in benches:
+            wall, cpu, size = await run(async_session, bench, query, requests)
+            best[title] = (min(best[title][0], wall), min(best[title][1], cpu), size)
+    for title, (wall, cpu, size) in best.items():
+        print(f"{title}:")
+        print(f"  latency  {wall * 1e3 / requests:8.3f} ms/request")
+        print(f"  cpu      {cpu * 1e3 / requests:8.3f} ms/request")
+        print(f"  body     {size:8d} bytes")
+    (decode_wall, decode_cpu, _), (raw_wall, raw_cpu, _) = best["decode"], best["passthrough"]
+    print(f"saved: {(decode_wall - raw_wall) * 1e3 / requests:.3f} ms latency, {(decode_cpu - raw_cpu) * 1e3 / requests:.3f} ms cpu per request")
+    await engine.dispose()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark raw JSON passthrough against decoding.")
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(main(args.rows, args.requests, args.rounds, directory))
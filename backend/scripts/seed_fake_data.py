@@ -15,13 +15,8 @@ from app.core.config import get_settings
 from app.core.database import async_session_factory
 from app.infrastructure.event_store import EventStore, EventToAppend
 from app.models.event_store import EventModel
-from app.projections.read_model_projections import (
-    AdmissionProjection,
-    FlightPlanProjection,
-    PatientProjection,
-    TimelineProjection,
-    AttachmentProjection,
-)
+from app.projections.envelope import EventEnvelope
+from app.projections.registry import build_projections
 
 
 FIRST_NAMES = [
@@ -309,20 +304,15 @@ async def _project_from_position(
     start_position: int,
 ) -> int:
     position = start_position
-    projections = [
-        PatientProjection(session, store.tenant_id),
-        AdmissionProjection(session, store.tenant_id),
-        FlightPlanProjection(session, store.tenant_id),
-        TimelineProjection(session, store.tenant_id),
-        AttachmentProjection(session, store.tenant_id),
-    ]
+    projections = build_projections(session, store.tenant_id)
     while True:
         events = await store.get_all_events_since(position=position, limit=200)
         if not events:
             break
         for event in events:
+            envelope = EventEnvelope(event)
             for projection in projections:
-                await projection.handle(event)
+                await projection.handle(envelope)
             position = event["global_position"]
         await session.flush()
     return position
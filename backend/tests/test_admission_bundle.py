@@ -0,0 +1,220 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.models.base import Base
+from app.models.read_models import (
+    AdmissionSummaryModel,
+    AttachmentReadModel,
+    TimelineEventModel,
+    TrajectoryPointModel,
+)
+
+
+def _at(hour):
+    return datetime(2026, 1, 1, hour, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_bundle_merges_lanes_in_time_order_with_summary():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    admission_id = uuid.uuid4()
+    other_admission = uuid.uuid4()
+
+    async with async_session() as session:
+        for hour, location in [(1, "ED"), (5, "CICU")]:
+            session.add(
+                TrajectoryPointModel(
+                    id=uuid.uuid4(),
+                    tenant_id=tenant_id,
+                    admission_id=admission_id,
+                    location=location,
+                    effective_at=_at(hour),
+                    sequence=0,
+                    data={"to_location": location},
+                )
+            )
+        session.add(
+            TimelineEventModel(
+                id=uuid.uuid4(),
+                tenant_id=tenant_id,
+                admission_id=admission_id,
+                event_type="note",
+                occurred_at=_at(3),
+                data={"event_type": "note"},
+            )
+        )
+        session.add(
+            TimelineEventModel(
+                id=uuid.uuid4(),
+                tenant_id=tenant_id,
+                admission_id=other_admission,
+                event_type="note",
+                occurred_at=_at(2),
+                data={"event_type": "elsewhere"},
+            )
+        )
+        session.add(
+            AttachmentReadModel(
+                id=uuid.uuid4(),
+                tenant_id=tenant_id,
+                admission_id=admission_id,
+                occurred_at=_at(5),
+                data={"filename": "echo.pdf"},
+            )
+        )
+        session.add(
+            AdmissionSummaryModel(
+                id=admission_id,
+                tenant_id=tenant_id,
+                current_location="CICU",
+                location_change_count=2,
+                clinical_event_count=1,
+            )
+        )
+        await session.commit()
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine.sync_engine, "before_cursor_execute", listener)
+        body = (await client.get(f"/api/v1/admissions/{admission_id}/bundle", headers=headers)).json()
+        event.remove(engine.sync_engine, "before_cursor_execute", listener)
+        # The ETag reads the watermark; the summary and lanes are one statement.
+        reads = [sql for sql in statements if "admission_watermarks" not in sql]
+        assert len(reads) == 1 and "admission_summaries" in reads[0] and "UNION ALL" in reads[0]
+        assert body["summary"]["current_location"] == "CICU"
+        assert [(i["lane"], i["data"]) for i in body["items"]] == [
+            ("locations", {"to_location": "ED"}),
+            ("events", {"event_type": "note"}),
+            ("locations", {"to_location": "CICU"}),
+            ("attachments", {"filename": "echo.pdf"}),
+        ]
+
+        body = (
+            await client.get(f"/api/v1/admissions/{admission_id}/bundle", headers={"X-Tenant-ID": str(uuid.uuid4())})
+        ).json()
+        assert body["summary"] is None
+        assert body["items"] == []
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_bundle_breaks_time_ties_by_lane_then_sequence():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    admission_id = uuid.uuid4()
+    empty_admission = uuid.uuid4()
+
+    # Everything lands at the same instant and is inserted in reverse order.
+    async with async_session() as session:
+        session.add(
+            AttachmentReadModel(
+                id=uuid.uuid4(),
+                tenant_id=tenant_id,
+                admission_id=admission_id,
+                occurred_at=_at(4),
+                data={"filename": "echo.pdf"},
+            )
+        )
+        session.add(
+            TimelineEventModel(
+                id=uuid.uuid4(),
+                tenant_id=tenant_id,
+                admission_id=admission_id,
+                event_type="note",
+                occurred_at=_at(4),
+                data={"event_type": "note"},
+            )
+        )
+        for sequence, location in [(1, "CICU"), (0, "OR")]:
+            session.add(
+                TrajectoryPointModel(
+                    id=uuid.uuid4(),
+                    tenant_id=tenant_id,
+                    admission_id=admission_id,
+                    location=location,
+                    effective_at=_at(4),
+                    sequence=sequence,
+                    data={"to_location": location},
+                )
+            )
+        session.add(
+            AdmissionSummaryModel(
+                id=empty_admission,
+                tenant_id=tenant_id,
+                current_location="ED",
+                location_change_count=0,
+                clinical_event_count=0,
+            )
+        )
+        await session.commit()
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        body = (await client.get(f"/api/v1/admissions/{admission_id}/bundle", headers=headers)).json()
+        assert body["summary"] is None
+        assert [(i["lane"], i["data"]) for i in body["items"]] == [
+            ("locations", {"to_location": "OR"}),
+            ("locations", {"to_location": "CICU"}),
+            ("events", {"event_type": "note"}),
+            ("attachments", {"filename": "echo.pdf"}),
+        ]
+
+        # A summary without lane rows, and an admission that was never seen.
+        body = (await client.get(f"/api/v1/admissions/{empty_admission}/bundle", headers=headers)).json()
+        assert body["summary"]["current_location"] == "ED"
+        assert body["items"] == []
+        # Nothing in an ETag'd bundle may depend on the clock.
+        assert "length_of_stay_days" not in body["summary"]
+        resp = await client.get(f"/api/v1/admissions/{uuid.uuid4()}/bundle", headers=headers)
+        assert resp.status_code == 200
+        assert resp.json()["summary"] is None and resp.json()["items"] == []
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
@@ -0,0 +1,194 @@
+import uuid
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.models.base import Base
+from app.models.read_models import AdmissionSummaryModel
+from app.projections.read_model_projections import AdmissionSummaryProjection
+
+
+def _location(admission_id, location, effective_at):
+    return {
+        "event_type": "admission.location_changed",
+        "event_id": str(uuid.uuid4()),
+        "data": {
+            "admission_id": str(admission_id),
+            "to_location": location,
+            "effective_at": effective_at,
+        },
+    }
+
+
+def _clinical(admission_id, occurred_at, **data):
+    return {
+        "event_type": "clinical_event.recorded",
+        "event_id": str(uuid.uuid4()),
+        "data": {
+            "event_id": str(uuid.uuid4()),
+            "admission_id": str(admission_id),
+            "occurred_at": occurred_at,
+            **data,
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_admission_summary_tracks_current_state_incrementally():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    admission_id = uuid.uuid4()
+    patient_id = uuid.uuid4()
+
+    async with async_session() as session:
+        projection = AdmissionSummaryProjection(session=session, tenant_id=tenant_id)
+        await projection.handle(_location(admission_id, "ED", "2026-01-01T08:00:00"))
+        await projection.handle(
+            {
+                "event_type": "admission.created",
+                "event_id": str(uuid.uuid4()),
+                "data": {
+                    "admission_id": str(admission_id),
+                    "patient_id": str(patient_id),
+                    "admit_date": "2026-01-01T06:00:00",
+                },
+            }
+        )
+        await session.commit()
+
+    # A fresh session reloads the row, as the runner does between batches.
+    async with async_session() as session:
+        projection = AdmissionSummaryProjection(session=session, tenant_id=tenant_id)
+        await projection.handle(_location(admission_id, "CICU", "2026-01-03T10:00:00"))
+        # Late-arriving older step must not replace the current location.
+        await projection.handle(_location(admission_id, "OR", "2026-01-02T09:00:00"))
+        await projection.handle(_clinical(admission_id, "2026-01-02T09:30:00", event_type="procedure"))
+        await projection.handle(
+            _clinical(admission_id, "2026-01-03T11:00:00", event_type="risk_status", risk="Critical - ECMO")
+        )
+        await projection.handle(
+            _clinical(admission_id, "2026-01-03T12:00:00", event_type="risk_status", risk_level="high")
+        )
+        await projection.handle(_location(admission_id, "DC", "2026-01-05T15:00:00"))
+        await session.commit()
+
+        summary = await session.get(AdmissionSummaryModel, admission_id)
+        assert summary.patient_id == patient_id
+        assert summary.admit_at.isoformat().startswith("2026-01-01T06:00:00")
+        assert summary.current_location == "DC"
+        assert summary.current_risk == "high"
+        assert summary.last_procedure_at.isoformat().startswith("2026-01-02T09:30:00")
+        assert summary.discharge_at.isoformat().startswith("2026-01-05T15:00:00")
+        assert summary.location_change_count == 4
+        assert summary.clinical_event_count == 3
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get(
+            f"/api/v1/admissions/{admission_id}/summary",
+            headers={"X-Tenant-ID": str(tenant_id)},
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["current_location"] == "DC"
+        assert body["length_of_stay_days"] == 4
+
+        resp = await client.get(
+            "/api/v1/admission-summaries",
+            headers={"X-Tenant-ID": str(tenant_id)},
+            params={"patient_id": str(patient_id)},
+        )
+        assert resp.status_code == 200
+        assert [item["admission_id"] for item in resp.json()["items"]] == [str(admission_id)]
+
+        resp = await client.get(
+            f"/api/v1/admissions/{uuid.uuid4()}/summary",
+            headers={"X-Tenant-ID": str(tenant_id)},
+        )
+        assert resp.json()["detail"] == "not found"
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_admission_created_without_patient_and_summary_paging():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    admission_ids = [uuid.uuid4() for _ in range(3)]
+
+    async with async_session() as session:
+        projection = AdmissionSummaryProjection(session=session, tenant_id=tenant_id)
+        # A legacy admission.created without a patient.
+        await projection.handle(
+            {
+                "event_type": "admission.created",
+                "event_id": str(uuid.uuid4()),
+                "data": {"admission_id": str(admission_ids[0]), "admit_date": "2026-01-02T06:00:00"},
+            }
+        )
+        # An out-of-order earlier step must not move the recorded admit time.
+        await projection.handle(_location(admission_ids[0], "ED", "2026-01-01T22:00:00"))
+        for admission_id in admission_ids[1:]:
+            await projection.handle(_location(admission_id, "ED", "2026-01-01T08:00:00"))
+        await session.commit()
+
+        summary = await session.get(AdmissionSummaryModel, admission_ids[0])
+        assert summary.admission_created and summary.patient_id is None
+        assert summary.admit_at.isoformat().startswith("2026-01-02T06:00:00")
+        assert not (await session.get(AdmissionSummaryModel, admission_ids[1])).admission_created
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        seen = []
+        params = {"limit": 2}
+        while True:
+            body = (await client.get("/api/v1/admission-summaries", params=params, headers=headers)).json()
+            seen += [item["admission_id"] for item in body["items"]]
+            if not body["next_cursor"]:
+                break
+            params = {"limit": 2, "cursor": body["next_cursor"]}
+        assert sorted(seen) == sorted(str(admission_id) for admission_id in admission_ids)
+        assert len(seen) == 3
+
+        resp = await client.get("/api/v1/admission-summaries", params={"cursor": "not-a-cursor"}, headers=headers)
+        assert resp.status_code == 400
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
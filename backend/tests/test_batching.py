@@ -0,0 +1,47 @@
+import logging
+
+from app.projections.batching import CATCH_UP, LIVE, AdaptiveBatchController
+
+
+def test_controller_grows_in_catch_up_and_resets_when_live(caplog):
+    controller = AdaptiveBatchController(
+        name="read-models",
+        min_size=100,
+        max_size=1000,
+        poll_interval_seconds=0.5,
+        max_idle_seconds=2.0,
+    )
+
+    with caplog.at_level(logging.INFO, logger="projections.batching"):
+        sizes = []
+        for _ in range(5):
+            assert controller.after_batch(controller.size, 0.1) == 0.0
+            sizes.append(controller.size)
+        assert controller.mode == CATCH_UP
+        assert sizes == [200, 400, 800, 1000, 1000]
+
+        # A slow batch shrinks the next one.
+        controller.after_batch(controller.size, 5.0)
+        assert controller.size == 500
+
+        assert controller.after_batch(3, 0.01) == 0.0
+        assert controller.mode == LIVE
+        assert controller.size == 100
+
+    assert controller.transitions == 2
+    assert "live -> catch-up" in caplog.text
+    assert "catch-up -> live" in caplog.text
+
+
+def test_controller_backs_off_exponentially_when_idle():
+    controller = AdaptiveBatchController(
+        name="read-models",
+        poll_interval_seconds=0.5,
+        max_idle_seconds=3.0,
+    )
+
+    delays = [controller.after_batch(0, 0.001) for _ in range(5)]
+    assert delays == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+    controller.after_batch(1, 0.001)
+    assert controller.after_batch(0, 0.001) == 0.5
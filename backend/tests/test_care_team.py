@@ -0,0 +1,229 @@
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.models.base import Base
+from app.models.read_models import CareTeamAssignmentModel
+from app.projections.read_model_projections import (
+    CareTeamProjection,
+    TrajectorySegmentProjection,
+    parse_teams,
+)
+
+
+def _location(admission_id, location, effective_at, position, teams=None, point_id=None, corrects_point_id=None):
+    legacy_fields = {"teams": json.dumps(json.dumps(teams))} if teams else {}
+    data = {
+        "admission_id": str(admission_id),
+        "trajectory_id": str(point_id or uuid.uuid4()),
+        "to_location": location,
+        "effective_at": effective_at,
+        "legacy_fields": legacy_fields,
+    }
+    if corrects_point_id:
+        data["corrects_point_id"] = str(corrects_point_id)
+    return {
+        "event_type": "admission.location_changed",
+        "event_id": str(uuid.uuid4()),
+        "global_position": position,
+        "data": data,
+    }
+
+
+def _engine():
+    return create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+
+def test_parse_teams_handles_legacy_encodings():
+    teams = {"surgeon": [{"name": "Dr  Heart"}, {"name": ""}], "anesthesia": [{"name": "Dr Gas", "id": "U42"}]}
+    expected = [("surgeon", "dr heart", "Dr Heart"), ("anesthesia", "u42", "Dr Gas")]
+    assert parse_teams(teams) == expected
+    assert parse_teams(json.dumps(json.dumps(teams))) == expected
+    assert parse_teams("not json") == []
+    assert parse_teams(None) == []
+
+
+@pytest.mark.asyncio
+async def test_care_team_index_tracks_spans_and_serves_lookups():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    first, second = uuid.uuid4(), uuid.uuid4()
+    events = [
+        _location(first, "CTOR", "2026-01-01T08:00:00", 1, {"surgeon": [{"name": "Dr Heart"}]}),
+        _location(first, "CICU", "2026-01-01T12:00:00", 2, {"attending": [{"name": "Dr Ice"}]}),
+        _location(second, "CICU", "2026-01-02T09:00:00", 3, {"attending": [{"name": " Dr  Ice"}]}),
+        {
+            "event_type": "clinical_event.recorded",
+            "event_id": str(uuid.uuid4()),
+            "global_position": 4,
+            "data": {
+                "event_id": str(uuid.uuid4()),
+                "admission_id": str(second),
+                "event_type": "bedside_procedure",
+                "occurred_at": "2026-01-02T10:00:00",
+                "end_datetime": "2026-01-02T11:00:00",
+                "teams": json.dumps({"surgeon": [{"name": "Dr Heart"}]}),
+            },
+        },
+    ]
+
+    async with async_session() as session:
+        projections = [
+            TrajectorySegmentProjection(session=session, tenant_id=tenant_id),
+            CareTeamProjection(session=session, tenant_id=tenant_id),
+        ]
+        for event in events:
+            for projection in projections:
+                await projection.handle(event)
+                await session.flush()
+        await session.commit()
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/care-team/clinicians/Dr%20Heart/admissions", headers=headers)
+        items = resp.json()["items"]
+        assert [(i["admission_id"], i["source"]) for i in items] == [
+            (str(second), "bedside_procedure"),
+            (str(first), "location"),
+        ]
+        # The CTOR step ends when the CICU step starts.
+        assert items[1]["end_at"].startswith("2026-01-01T12:00:00")
+
+        resp = await client.get(
+            "/api/v1/care-team/clinicians/DR ICE/admissions",
+            params={"role": "attending", "current": "true"},
+            headers=headers,
+        )
+        assert {i["admission_id"] for i in resp.json()["items"]} == {str(first), str(second)}
+
+        resp = await client.get(
+            "/api/v1/care-team/clinicians/dr heart/admissions",
+            params={"at": "2026-01-01T09:00:00Z"},
+            headers=headers,
+        )
+        assert [i["admission_id"] for i in resp.json()["items"]] == [str(first)]
+
+        resp = await client.get("/api/v1/care-team/workload", headers=headers)
+        assert resp.json()["items"][0] == {
+            "clinician": "dr ice",
+            "name": "Dr Ice",
+            "role": "attending",
+            "admissions": 2,
+        }
+
+        resp = await client.get(f"/api/v1/admissions/{first}/care-team", headers=headers)
+        assert [i["role"] for i in resp.json()["items"]] == ["surgeon", "attending"]
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_care_team_spans_follow_late_points_and_corrections():
+    engine = _engine()
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    admission_id, other_admission_id = uuid.uuid4(), uuid.uuid4()
+    or_point = uuid.uuid4()
+    events = [
+        _location(admission_id, "CTOR", "2026-01-01T08:00:00", 1, {"surgeon": [{"name": "Dr Heart"}]}),
+        _location(admission_id, "CICU", "2026-01-01T12:00:00", 2, {"attending": [{"name": "Dr Ice"}]}),
+        # Arrives after the CICU step it precedes.
+        _location(admission_id, "OR", "2026-01-01T10:00:00", 3, {"surgeon": [{"name": "Dr Cut"}]}, point_id=or_point),
+        # Another admission cannot correct this one's points.
+        _location(other_admission_id, "PICU", "2026-01-01T10:00:00", 4, corrects_point_id=or_point),
+        _location(
+            admission_id,
+            "PICU",
+            "2026-01-01T10:00:00",
+            5,
+            {"attending": [{"name": "Dr Fix"}]},
+            corrects_point_id=or_point,
+        ),
+        # A clinical event without teams assigns nobody.
+        {
+            "event_type": "clinical_event.recorded",
+            "event_id": str(uuid.uuid4()),
+            "global_position": 6,
+            "data": {"admission_id": str(admission_id), "event_type": "note", "occurred_at": "2026-01-01T13:00:00"},
+        },
+    ]
+
+    async with async_session() as session:
+        projections = [
+            TrajectorySegmentProjection(session=session, tenant_id=tenant_id),
+            CareTeamProjection(session=session, tenant_id=tenant_id),
+        ]
+        for index, event in enumerate(events):
+            for projection in projections:
+                await projection.handle(event)
+                await session.flush()
+            if index == 2:
+                result = await session.execute(
+                    select(CareTeamAssignmentModel).where(CareTeamAssignmentModel.clinician_key == "dr heart")
+                )
+                heart = result.scalar_one()
+                assert heart.end_at.replace(tzinfo=None) == datetime(2026, 1, 1, 10)
+        await session.commit()
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/care-team/clinicians/dr cut/admissions", headers=headers)
+        assert resp.json()["items"] == []
+
+        resp = await client.get("/api/v1/care-team/clinicians/dr fix/admissions", headers=headers)
+        [fix] = resp.json()["items"]
+        assert fix["start_at"].startswith("2026-01-01T10:00:00")
+        assert fix["end_at"].startswith("2026-01-01T12:00:00")
+
+        resp = await client.get(f"/api/v1/admissions/{admission_id}/care-team", headers=headers)
+        assert [i["clinician"] for i in resp.json()["items"]] == ["dr heart", "dr fix", "dr ice"]
+
+        resp = await client.get(f"/api/v1/admissions/{other_admission_id}/care-team", headers=headers)
+        assert resp.json()["items"] == []
+
+        resp = await client.get("/api/v1/care-team/clinicians/nobody/admissions", headers=headers)
+        assert resp.json()["items"] == []
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
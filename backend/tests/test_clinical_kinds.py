@@ -0,0 +1,172 @@
+import uuid
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.models.base import Base
+from app.models.read_models import ContinuousTherapyReadModel, FeedbackReadModel
+from app.projections.read_model_projections import CareTeamProjection, ClinicalKindProjection
+
+
+def _clinical(admission_id, kind, occurred_at, **fields):
+    return {
+        "event_type": "clinical_event.recorded",
+        "global_position": 1,
+        "data": {
+            "event_id": str(uuid.uuid4()),
+            "admission_id": str(admission_id),
+            "event_type": kind,
+            "occurred_at": occurred_at,
+            **fields,
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_clinical_kinds_are_promoted_into_typed_tables():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    first, second = uuid.uuid4(), uuid.uuid4()
+    events = [
+        _clinical(
+            first, "feedback", "2026-01-01T00:00:00",
+            score="4", outcome="Good", graph_visible="Y", exit_datetime="2026-01-03T00:00:00",
+        ),
+        _clinical(second, "feedback", "2026-01-02T00:00:00", score="n/a", outcome="Poor", graph_visible="N"),
+        _clinical(first, "continuous_therapy", "2026-01-01T06:00:00", therapy_type="ECMO", status="Active"),
+        _clinical(first, "note", "2026-01-01T07:00:00", text="not promoted"),
+        _clinical(
+            second, "bedside_procedure", "2026-01-02T01:00:00",
+            procedure_type="Chest tube", teams={"surgeon": [{"name": "Dr Heart"}]},
+        ),
+    ]
+
+    async with async_session() as session:
+        projections = [
+            ClinicalKindProjection(session=session, tenant_id=tenant_id),
+            CareTeamProjection(session=session, tenant_id=tenant_id),
+        ]
+        for event in events:
+            for projection in projections:
+                await projection.handle(event)
+        await session.commit()
+
+        feedback = await session.get(FeedbackReadModel, uuid.UUID(events[0]["data"]["event_id"]))
+        assert (feedback.score, feedback.score_value, feedback.graph_visible) == ("4", 4.0, True)
+        assert feedback.exit_at is not None
+        therapy = await session.get(ContinuousTherapyReadModel, uuid.UUID(events[2]["data"]["event_id"]))
+        assert (therapy.therapy_type, therapy.status) == ("ECMO", "Active")
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/clinical/feedback", params={"outcome": "Good"}, headers=headers)
+        assert [i["admission_id"] for i in resp.json()["items"]] == [str(first)]
+
+        resp = await client.get("/api/v1/clinical/feedback", params={"min_score": 3}, headers=headers)
+        assert [i["score"] for i in resp.json()["items"]] == ["4"]
+
+        resp = await client.get(
+            "/api/v1/clinical/continuous_therapy",
+            params={"therapy_type": "ECMO", "status": "Active"},
+            headers=headers,
+        )
+        assert len(resp.json()["items"]) == 1
+
+        # Feedback for admissions Dr Heart is on the team for.
+        resp = await client.get("/api/v1/clinical/feedback", params={"clinician": "dr heart"}, headers=headers)
+        assert [i["outcome"] for i in resp.json()["items"]] == ["Poor"]
+
+        resp = await client.get("/api/v1/clinical/feedback", params={"notes": "x"}, headers=headers)
+        assert resp.status_code == 400
+        # Parameters that are not columns of the kind are ignored.
+        resp = await client.get(
+            "/api/v1/clinical/feedback",
+            params={"outcome": "Good", "_": "1700000000", "tenant_id": str(uuid.uuid4())},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        assert [i["admission_id"] for i in resp.json()["items"]] == [str(first)]
+        resp = await client.get("/api/v1/clinical/note", headers=headers)
+        assert resp.json() == {"detail": "not found"}
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_clinical_kinds_handle_late_and_redelivered_events():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    admission_id = uuid.uuid4()
+    later = _clinical(admission_id, "continuous_therapy", "2026-01-02T00:00:00", therapy_type="CRRT", status="Active")
+    # Recorded after ``later`` but describing an earlier start.
+    earlier = _clinical(admission_id, "continuous_therapy", "2026-01-01T00:00:00", therapy_type="ECMO", status="Active")
+    # The same event applied again after a change to its payload.
+    redelivered = {**later, "data": {**later["data"], "status": "Stopped"}}
+    untyped = {**earlier, "data": {key: value for key, value in earlier["data"].items() if key != "event_type"}}
+
+    async with async_session() as session:
+        projection = ClinicalKindProjection(session=session, tenant_id=tenant_id)
+        for event in (later, earlier, redelivered, untyped):
+            await projection.handle(event)
+            await session.flush()
+        await session.commit()
+
+        count = await session.scalar(select(func.count()).select_from(ContinuousTherapyReadModel))
+        assert count == 2
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get(
+            "/api/v1/clinical/continuous_therapy",
+            params={"admission_id": str(admission_id)},
+            headers=headers,
+        )
+        assert [(i["therapy_type"], i["status"]) for i in resp.json()["items"]] == [
+            ("ECMO", "Active"),
+            ("CRRT", "Stopped"),
+        ]
+
+        resp = await client.get("/api/v1/clinical/continuous_therapy", params={"status": "Active"}, headers=headers)
+        assert [i["therapy_type"] for i in resp.json()["items"]] == ["ECMO"]
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
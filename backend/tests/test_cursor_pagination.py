@@ -0,0 +1,103 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.models.base import Base
+from app.models.read_models import AdmissionReadModel, PatientReadModel
+
+
+@pytest.mark.asyncio
+async def test_listings_page_with_stable_cursors():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    patient_id = uuid.uuid4()
+    # Several rows share a timestamp, as they do after a bulk import.
+    stamps = [datetime(2026, 1, 1, tzinfo=timezone.utc)] * 4 + [datetime(2026, 1, 2, tzinfo=timezone.utc)] * 3
+    async with async_session() as session:
+        for index, created_at in enumerate(stamps):
+            row_id = uuid.uuid4()
+            session.add(
+                PatientReadModel(
+                    id=row_id,
+                    tenant_id=tenant_id,
+                    data={"n": index},
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+            )
+            session.add(
+                AdmissionReadModel(
+                    id=uuid.uuid4(),
+                    tenant_id=tenant_id,
+                    patient_id=patient_id if index % 2 else uuid.uuid4(),
+                    data={"n": index},
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+            )
+        await session.commit()
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        seen = []
+        params = {"limit": 3}
+        pages = 0
+        while True:
+            body = (await client.get("/api/v1/patients", params=params, headers=headers)).json()
+            seen.extend(item["n"] for item in body["items"])
+            pages += 1
+            if body["next_cursor"] is None:
+                break
+            params = {"limit": 3, "cursor": body["next_cursor"]}
+        assert pages == 3
+        assert sorted(seen) == list(range(7))
+
+        # Offset paging still works and agrees with the cursor order.
+        body = (await client.get("/api/v1/patients", params={"limit": 3, "offset": 3}, headers=headers)).json()
+        assert [item["n"] for item in body["items"]] == seen[3:6]
+
+        body = (
+            await client.get(
+                "/api/v1/admissions",
+                params={"patient_id": str(patient_id), "limit": 2},
+                headers=headers,
+            )
+        ).json()
+        rest = (
+            await client.get(
+                "/api/v1/admissions",
+                params={"patient_id": str(patient_id), "limit": 2, "cursor": body["next_cursor"]},
+                headers=headers,
+            )
+        ).json()
+        assert sorted(item["n"] for item in body["items"] + rest["items"]) == [1, 3, 5]
+        assert rest["next_cursor"] is None
+
+        resp = await client.get("/api/v1/patients", params={"cursor": "not-a-cursor"}, headers=headers)
+        assert resp.status_code == 400
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
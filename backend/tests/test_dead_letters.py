@@ -0,0 +1,249 @@
+import uuid
+import pytest
+
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.infrastructure.event_store import EventStore, EventToAppend
+from app.infrastructure.response_cache import LocalCacheBackend, response_cache
+from app.models.base import Base
+from app.models.event_store import ProjectionDeadLetterModel, SubscriptionModel
+from app.models.read_models import AdmissionSummaryModel, TimelineEventModel
+from app.projections.dead_letters import pending_subscriptions, replay_dead_letters
+from app.projections.read_model_projections import (
+    AdmissionSummaryProjection,
+    AdmissionWatermarkProjection,
+    TimelineProjection,
+)
+from app.projections.registry import subscription_id_for
+from app.projections.runner import ProjectionRunner
+
+
+class FlakyProjection:
+    """Fails on events flagged ``poison`` until the bug is 'fixed'."""
+
+    fixed = False
+
+    def __init__(self):
+        self.handled = []
+
+    async def handle(self, event):
+        if event["data"].get("poison") and not self.fixed:
+            raise ValueError("cannot project poison")
+        self.handled.append(event["global_position"])
+
+
+class FlakyWrapper:
+    """Runs a real projection but fails on ``poison`` events until fixed."""
+
+    fixed = False
+
+    def __init__(self, projection):
+        self.projection = projection
+        self.name = type(projection).__name__
+
+    async def handle(self, event):
+        if event["data"].get("poison") and not self.fixed:
+            raise ValueError("cannot project poison")
+        await self.projection.handle(event)
+
+
+def _moved(admission_id, location, effective_at, **data):
+    return EventToAppend(
+        event_type="admission.location_changed",
+        data={"admission_id": str(admission_id), "to_location": location, "effective_at": effective_at, **data},
+        metadata={},
+        created_by=uuid.uuid4(),
+    )
+
+
+def _clinical(admission_id, **data):
+    payload = {"event_id": str(uuid.uuid4()), "occurred_at": "2026-01-01T00:00:00", **data}
+    if admission_id is not None:
+        payload["admission_id"] = str(admission_id)
+    return EventToAppend(
+        event_type="clinical_event.recorded",
+        data=payload,
+        metadata={},
+        created_by=uuid.uuid4(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_runner_parks_failing_events_and_retry_resolves_them():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    admission_id = uuid.uuid4()
+
+    async with async_session() as session:
+        store = EventStore(session=session, tenant_id=tenant_id)
+        await store.append(
+            stream_id=uuid.uuid4(),
+            stream_type="Admission",
+            events=[
+                _clinical(admission_id),
+                # Malformed: no admission_id, so TimelineProjection raises.
+                _clinical(None),
+                _clinical(admission_id, poison=True),
+                _clinical(admission_id),
+            ],
+        )
+        await session.commit()
+
+        flaky = FlakyProjection()
+        runner = ProjectionRunner(
+            event_store=store,
+            projections=[TimelineProjection(session, tenant_id), flaky],
+            subscription_id="test-sub",
+            session=session,
+        )
+        assert await runner.run_once() == 4
+
+        subscription = await session.get(SubscriptionModel, "test-sub")
+        assert subscription.last_position == 4
+
+        result = await session.execute(select(TimelineEventModel))
+        assert len(result.scalars().all()) == 3
+        # The failed first pass was rolled back; the isolated pass applies the rest.
+        assert flaky.handled[-3:] == [1, 2, 4]
+
+        result = await session.execute(
+            select(ProjectionDeadLetterModel).order_by(ProjectionDeadLetterModel.global_position)
+        )
+        letters = [(l.projection, l.global_position) for l in result.scalars().all()]
+        assert letters == [("TimelineProjection", 2), ("FlakyProjection", 3)]
+
+    async with async_session() as session:
+        assert await pending_subscriptions(session) == [(tenant_id, "test-sub")]
+
+        FlakyProjection.fixed = True
+        try:
+            flaky = FlakyProjection()
+            report = await replay_dead_letters(
+                session,
+                tenant_id=tenant_id,
+                subscription_id="test-sub",
+                projections=[TimelineProjection(session, tenant_id), flaky],
+            )
+        finally:
+            FlakyProjection.fixed = False
+
+        assert (report.resolved, report.failed) == (1, 1)
+        assert flaky.handled == [3]
+
+        result = await session.execute(
+            select(ProjectionDeadLetterModel).where(ProjectionDeadLetterModel.resolved_at.is_(None))
+        )
+        remaining = result.scalars().all()
+        assert [(l.projection, l.attempts) for l in remaining] == [("TimelineProjection", 2)]
+        assert "KeyError" in remaining[0].error
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_retry_after_later_events_keeps_newer_state_and_moves_etags():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    admission_id = uuid.uuid4()
+    subscription_id = subscription_id_for(tenant_id)
+
+    def projections(session):
+        return [
+            FlakyWrapper(TimelineProjection(session, tenant_id)),
+            FlakyWrapper(AdmissionSummaryProjection(session, tenant_id)),
+            AdmissionWatermarkProjection(session, tenant_id),
+        ]
+
+    async with async_session() as session:
+        store = EventStore(session=session, tenant_id=tenant_id)
+        await store.append(
+            stream_id=admission_id,
+            stream_type="Admission",
+            events=[
+                _moved(admission_id, "ED", "2026-01-01T01:00:00"),
+                _moved(admission_id, "OR", "2026-01-01T02:00:00", poison=True),
+                # Same instant, later in the log: CICU is where the patient is.
+                _moved(admission_id, "CICU", "2026-01-01T02:00:00"),
+                _clinical(admission_id, event_type="note", poison=True),
+                _clinical(admission_id, event_type="note", occurred_at="2026-01-01T04:00:00"),
+            ],
+        )
+        await session.commit()
+
+        runner = ProjectionRunner(
+            event_store=store,
+            projections=projections(session),
+            subscription_id=subscription_id,
+            session=session,
+        )
+        assert await runner.run_once() == 5
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+    previous_backend, previous_ttl = response_cache.backend, response_cache.ttl_seconds
+    response_cache.configure(LocalCacheBackend(), ttl_seconds=60)
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    url = f"/api/v1/admissions/{admission_id}/timeline"
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            resp = await client.get(url, headers=headers)
+            timeline_etag = resp.headers["etag"]
+            assert len(resp.json()["items"]) == 1
+            list_etag = (await client.get("/api/v1/patients", headers=headers)).headers["etag"]
+
+            FlakyWrapper.fixed = True
+            try:
+                async with async_session() as session:
+                    report = await replay_dead_letters(
+                        session, tenant_id=tenant_id, subscription_id=subscription_id, projections=projections(session)
+                    )
+            finally:
+                FlakyWrapper.fixed = False
+            assert (report.resolved, report.failed) == (4, 0)
+
+            resp = await client.get(url, headers={**headers, "If-None-Match": timeline_etag})
+            assert resp.status_code == 200
+            assert len(resp.json()["items"]) == 2
+            resp = await client.get("/api/v1/patients", headers={**headers, "If-None-Match": list_etag})
+            assert resp.status_code == 200
+    finally:
+        response_cache.configure(previous_backend, ttl_seconds=previous_ttl)
+        app.dependency_overrides.clear()
+
+    async with async_session() as session:
+        summary = await session.get(AdmissionSummaryModel, admission_id)
+        # The retried OR move is counted but does not displace the later CICU move.
+        assert (summary.current_location, summary.location_change_count) == ("CICU", 3)
+        assert (summary.clinical_event_count, summary.position) == (2, 5)
+
+    await engine.dispose()
@@ -0,0 +1,165 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.infrastructure.event_store import EventStore, EventToAppend
+from app.models.base import Base
+from app.models.event_store import SubscriptionModel
+from app.models.read_models import AdmissionWatermarkModel
+from app.projections.read_model_projections import AdmissionWatermarkProjection, TimelineProjection
+from app.projections.rebuild import ProjectionRebuilder
+from app.projections.registry import subscription_id_for
+
+
+def _clinical_event(admission_id, position):
+    return {
+        "event_type": "clinical_event.recorded",
+        "event_id": str(uuid.uuid4()),
+        "global_position": position,
+        "data": {
+            "event_id": str(uuid.uuid4()),
+            "admission_id": str(admission_id),
+            "event_type": "note",
+            "occurred_at": f"2026-01-01T0{position}:00:00",
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_conditional_gets_follow_admission_watermarks_and_checkpoints():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    admission_id, other_admission = uuid.uuid4(), uuid.uuid4()
+
+    async def project(*events):
+        async with async_session() as session:
+            projections = [
+                TimelineProjection(session=session, tenant_id=tenant_id),
+                AdmissionWatermarkProjection(session=session, tenant_id=tenant_id),
+            ]
+            for item in events:
+                for projection in projections:
+                    await projection.handle(item)
+            checkpoint = await session.get(SubscriptionModel, subscription_id_for(tenant_id))
+            if checkpoint is None:
+                checkpoint = SubscriptionModel(subscription_id=subscription_id_for(tenant_id), last_position=0)
+                session.add(checkpoint)
+            checkpoint.last_position = max(item["global_position"] for item in events)
+            await session.commit()
+
+    await project(_clinical_event(admission_id, 1), _clinical_event(other_admission, 2))
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    url = f"/api/v1/admissions/{admission_id}/timeline"
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get(url, headers=headers)
+        etag = resp.headers["etag"]
+        assert len(resp.json()["items"]) == 1
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine.sync_engine, "before_cursor_execute", listener)
+        resp = await client.get(url, headers={**headers, "If-None-Match": etag})
+        event.remove(engine.sync_engine, "before_cursor_execute", listener)
+        assert resp.status_code == 304
+        assert resp.headers["etag"] == etag
+        assert resp.content == b""
+        assert len(statements) == 1 and "admission_watermarks" in statements[0]
+
+        # Another admission's event leaves this ETag alone but moves the checkpoint.
+        list_etag = (await client.get("/api/v1/patients", headers=headers)).headers["etag"]
+        await project(_clinical_event(other_admission, 3))
+        resp = await client.get(url, headers={**headers, "If-None-Match": etag})
+        assert resp.status_code == 304
+        resp = await client.get("/api/v1/patients", headers={**headers, "If-None-Match": list_etag})
+        assert resp.status_code == 200
+
+        await project(_clinical_event(admission_id, 4))
+        resp = await client.get(url, headers={**headers, "If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+        assert len(resp.json()["items"]) == 2
+
+        # The same position under another tenant is a different resource.
+        resp = await client.get(url, headers={"X-Tenant-ID": str(uuid.uuid4()), "If-None-Match": etag})
+        assert resp.status_code == 200
+
+    async with async_session() as session:
+        assert (await session.get(AdmissionWatermarkModel, admission_id)).last_position == 4
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_rebuild_changes_etags_even_at_the_same_positions(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'etags.db'}", future=True)
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    admission_id = uuid.uuid4()
+    async with async_session() as session:
+        store = EventStore(session=session, tenant_id=tenant_id)
+        await store.append(
+            stream_id=admission_id,
+            stream_type="Admission",
+            events=[
+                EventToAppend(
+                    event_type="clinical_event.recorded",
+                    data=_clinical_event(admission_id, 1)["data"],
+                    metadata={},
+                    created_by=uuid.uuid4(),
+                )
+            ],
+        )
+        await session.commit()
+    await ProjectionRebuilder(engine=engine).rebuild()
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    urls = [f"/api/v1/admissions/{admission_id}/timeline", "/api/v1/patients"]
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        etags = [(await client.get(url, headers=headers)).headers["etag"] for url in urls]
+
+        # A rebuild replays the same positions into new rows.
+        await ProjectionRebuilder(engine=engine).rebuild()
+        for url, etag in zip(urls, etags):
+            resp = await client.get(url, headers={**headers, "If-None-Match": etag})
+            assert resp.status_code == 200
+            assert resp.headers["etag"] != etag
+            resp = await client.get(url, headers={**headers, "If-None-Match": resp.headers["etag"]})
+            assert resp.status_code == 304
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
@@ -0,0 +1,42 @@
+import uuid
+from datetime import timezone
+
+import pytest
+
+from app.projections.envelope import EventEnvelope
+
+
+def test_envelope_decodes_fields_once_and_shares_them():
+    admission_id = uuid.uuid4()
+    event_id = uuid.uuid4()
+    envelope = EventEnvelope(
+        {
+            "event_id": str(event_id),
+            "event_type": "admission.location_changed",
+            "global_position": 7,
+            "data": {
+                "admission_id": str(admission_id),
+                "effective_at": "2026-01-01T08:00:00",
+                "bad_at": "not a date",
+            },
+        }
+    )
+
+    assert envelope.uuid("admission_id") == admission_id
+    assert envelope.uuid("admission_id") is envelope.uuid("admission_id")
+    assert envelope.id_or_event_id("trajectory_id") == event_id
+    assert envelope.optional_uuid("corrects_point_id") is None
+
+    effective_at = envelope.timestamp("effective_at")
+    assert effective_at.tzinfo == timezone.utc
+    assert envelope.timestamp("effective_at") is effective_at
+    # Missing and unparseable timestamps fall back to one processing time.
+    assert envelope.timestamp("missing_at") is envelope.now
+    assert envelope.timestamp("bad_at") is envelope.now
+
+    assert envelope["global_position"] == 7
+    assert envelope.get("metadata", {}) == {}
+    assert EventEnvelope.wrap(envelope) is envelope
+
+    with pytest.raises(KeyError):
+        envelope.uuid("patient_id")
@@ -0,0 +1,97 @@
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.api import ndjson
+from app.core.database import get_session
+from app.models.base import Base
+from app.models.read_models import TimelineEventModel, TrajectoryPointModel
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+NDJSON = {"Accept": "application/x-ndjson"}
+
+
+@pytest.mark.asyncio
+async def test_reads_stream_ndjson_when_asked(monkeypatch):
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    admission_id = uuid.uuid4()
+
+    async with async_session() as session:
+        for minute in range(25):
+            session.add(
+                TimelineEventModel(
+                    id=uuid.uuid4(),
+                    tenant_id=tenant_id,
+                    admission_id=admission_id,
+                    event_type="vital",
+                    occurred_at=START + timedelta(minutes=minute),
+                    data={"minute": minute, "hr": 100 + minute},
+                )
+            )
+        for hour, location in [(0, "ED"), (2, "CTOR"), (6, "CICU")]:
+            session.add(
+                TrajectoryPointModel(
+                    id=uuid.uuid4(),
+                    tenant_id=tenant_id,
+                    admission_id=admission_id,
+                    location=location,
+                    effective_at=START + timedelta(hours=hour),
+                    sequence=0,
+                    data={"to_location": location},
+                )
+            )
+        await session.commit()
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+    # Small partitions so the stream spans several cursor fetches.
+    monkeypatch.setattr(ndjson, "STREAM_PARTITION_ROWS", 4)
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    base = f"/api/v1/admissions/{admission_id}"
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get(f"{base}/timeline", headers=headers)
+        assert resp.headers["content-type"] == "application/json"
+        assert [item["minute"] for item in resp.json()["items"]] == list(range(25))
+        etag = resp.headers["etag"]
+
+        resp = await client.get(f"{base}/timeline", headers={**headers, **NDJSON})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/x-ndjson"
+        assert resp.headers["etag"] == etag
+        assert resp.headers["vary"] == "Accept"
+        lines = resp.text.splitlines()
+        assert [json.loads(line)["minute"] for line in lines] == list(range(25))
+
+        resp = await client.get(f"{base}/timeline", params={"value": "hr", "points": 5}, headers={**headers, **NDJSON})
+        assert len(resp.text.splitlines()) == 5
+
+        resp = await client.get(f"{base}/trajectory", params={"from": "2026-01-01T03:00:00Z"}, headers={**headers, **NDJSON})
+        assert [json.loads(line)["to_location"] for line in resp.text.splitlines()] == ["CTOR", "CICU"]
+
+        resp = await client.get(f"{base}/attachments", headers={**headers, **NDJSON})
+        assert resp.status_code == 200 and resp.text == ""
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
@@ -0,0 +1,179 @@
+import uuid
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from pydantic import ValidationError
+from sqlalchemy import MetaData, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.core.plugins.projections import PluginProjectionSpec, compile_projection
+from app.core.plugins.registry import PluginRegistry, plugin_registry
+from app.models.base import Base
+
+
+def _clinical(admission_id, kind, occurred_at, position=1, **data):
+    return {
+        "event_type": "clinical_event.recorded",
+        "event_id": str(uuid.uuid4()),
+        "global_position": position,
+        "data": {
+            "event_id": str(uuid.uuid4()),
+            "admission_id": str(admission_id),
+            "event_type": kind,
+            "occurred_at": occurred_at,
+            **data,
+        },
+    }
+
+
+def test_plugin_projection_spec_rejects_reserved_columns():
+    with pytest.raises(ValidationError):
+        PluginProjectionSpec.model_validate(
+            {"name": "runs", "events": ["clinical_event.recorded"], "columns": {"id": {"field": "x"}}}
+        )
+
+
+@pytest.mark.asyncio
+async def test_manifest_projections_compile_and_project():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    registry = PluginRegistry(plugins_dir=Path(__file__).resolve().parents[1] / "plugins")
+    registry.load_all()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await registry.create_tables(engine)
+
+    tenant_id = uuid.uuid4()
+    admission_id = uuid.uuid4()
+    events = [
+        _clinical(admission_id, "continuous_therapy", "2026-01-01T08:00:00", therapy_type="ECMO VA", status="started"),
+        _clinical(admission_id, "continuous_therapy", "2026-01-01T09:00:00", therapy_type="CRRT"),
+        _clinical(admission_id, "bedside_procedure", "2026-01-02T09:00:00", procedure_type="Chest tube"),
+        _clinical(admission_id, "bedside_procedure", "2026-01-03T09:00:00", procedure_type="Chest tube"),
+        _clinical(admission_id, "risk_status", "2026-01-02T10:00:00", risk="Intubated / Conv Vent"),
+    ]
+
+    async with async_session() as session:
+        projections = registry.build_projections(session, tenant_id)
+        assert [p.name for p in projections] == [
+            "cardiac.ecmo_runs",
+            "cardiac.ventilation_periods",
+            "cardiac.procedure_counts",
+        ]
+        for event in events:
+            for projection in projections:
+                await projection.handle(event)
+        await session.commit()
+
+        ecmo = registry.get_projection("cardiac", "ecmo_runs").table
+        rows = (await session.execute(select(ecmo))).mappings().all()
+        assert [(r["admission_id"], r["status"]) for r in rows] == [(admission_id, "started")]
+
+        counts = registry.get_projection("cardiac", "procedure_counts").table
+        rows = (await session.execute(select(counts))).mappings().all()
+        assert [(r["procedure_type"], r["count"]) for r in rows] == [("Chest tube", 2)]
+
+    plugin_registry.ensure_loaded()
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get(
+            "/api/v1/specialties/cardiac/projections/ventilation_periods",
+            headers={"X-Tenant-ID": str(tenant_id)},
+            params={"admission_id": str(admission_id)},
+        )
+        items = resp.json()["items"]
+        assert [item["risk"] for item in items] == ["Intubated / Conv Vent"]
+        assert items[0]["started_at"].startswith("2026-01-02T10:00:00")
+
+        resp = await client.get(
+            "/api/v1/specialties/cardiac/projections/missing",
+            headers={"X-Tenant-ID": str(tenant_id)},
+        )
+        assert resp.json()["detail"] == "not found"
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+async def _keyed_projection():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    compiled = compile_projection(
+        "test",
+        PluginProjectionSpec.model_validate(
+            {
+                "name": "therapy_status",
+                "events": ["clinical_event.recorded"],
+                "key": "mrn",
+                "columns": {"status": {"field": "status"}},
+            }
+        ),
+        MetaData(),
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(compiled.table.create)
+    return engine, async_sessionmaker(engine, expire_on_commit=False), compiled
+
+
+@pytest.mark.asyncio
+async def test_upsert_projection_ignores_events_older_than_the_row():
+    engine, async_session, compiled = await _keyed_projection()
+    tenant_id = uuid.uuid4()
+    admission_id = uuid.uuid4()
+
+    async with async_session() as session:
+        projection = compiled.bind(session, tenant_id)
+        await projection.handle(_clinical(admission_id, "ecmo", "2026-01-01T09:00:00", 5, mrn="M1", status="running"))
+        # A retried dead letter from before the row's position.
+        await projection.handle(_clinical(admission_id, "ecmo", "2026-01-01T08:00:00", 3, mrn="M1", status="started"))
+        await session.commit()
+
+        rows = (await session.execute(select(compiled.table))).mappings().all()
+        assert [(r["status"], r["position"]) for r in rows] == [("running", 5)]
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_upsert_projection_keeps_tenants_apart_on_the_same_key():
+    engine, async_session, compiled = await _keyed_projection()
+    first_tenant, second_tenant = uuid.uuid4(), uuid.uuid4()
+
+    async with async_session() as session:
+        await compiled.bind(session, first_tenant).handle(
+            _clinical(uuid.uuid4(), "ecmo", "2026-01-01T08:00:00", 1, mrn="M1", status="started")
+        )
+        # Another hospital happens to use the same MRN.
+        await compiled.bind(session, second_tenant).handle(
+            _clinical(uuid.uuid4(), "ecmo", "2026-01-01T09:00:00", 2, mrn="M1", status="stopped")
+        )
+        await session.commit()
+
+        rows = (await session.execute(select(compiled.table).order_by(compiled.table.c.position))).mappings().all()
+        assert [(r["tenant_id"], r["id"], r["status"]) for r in rows] == [
+            (first_tenant, "M1", "started"),
+            (second_tenant, "M1", "stopped"),
+        ]
+
+    await engine.dispose()
@@ -0,0 +1,141 @@
+import asyncio
+import uuid
+import pytest
+
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.infrastructure.event_store import EventStore, EventToAppend
+from app.models.base import Base
+from app.models.event_store import SubscriptionModel
+from app.projections.lanes import BackfillThrottle, PriorityLaneRunner
+from app.projections.registry import BACKFILL_LANE, LIVE_LANE, subscription_id_for
+from app.projections.status import projection_status
+
+
+class RecordingProjection:
+    def __init__(self, log):
+        self.log = log
+
+    async def handle(self, event):
+        self.log.append(event["global_position"])
+
+
+def _event(source=None):
+    return EventToAppend(
+        event_type="clinical_event.recorded",
+        data={},
+        metadata={"source": source} if source else {},
+        created_by=uuid.uuid4(),
+    )
+
+
+def _engine():
+    return create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+
+@pytest.mark.asyncio
+async def test_lanes_keep_stream_order_and_resume_from_combined_checkpoint():
+    engine = _engine()
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    legacy_stream, live_stream = uuid.uuid4(), uuid.uuid4()
+    async with async_session() as session:
+        store = EventStore(session=session, tenant_id=tenant_id)
+        # 1-4: imported admission; 5: unrelated live admission;
+        # 6: live correction to the imported one; 7: live again.
+        await store.append(legacy_stream, "Admission", [_event("legacy_v2") for _ in range(4)])
+        await store.append(live_stream, "Admission", [_event()])
+        await store.append(legacy_stream, "Admission", [_event()], expected_version=4)
+        await store.append(live_stream, "Admission", [_event()], expected_version=1)
+        # Position 1 was projected before lanes were switched on.
+        session.add(SubscriptionModel(subscription_id=subscription_id_for(tenant_id), last_position=1))
+        await session.commit()
+
+    log: list[int] = []
+    runner = PriorityLaneRunner(
+        session_factory=async_session,
+        tenant_id=tenant_id,
+        projection_factory=lambda session, tenant: [RecordingProjection(log)],
+        live_batch_size=10,
+        backfill_batch_size=10,
+    )
+
+    # Live position 6 must wait for the imported events 2-4 of its stream.
+    assert await runner.run_lane_batch(LIVE_LANE) == 1
+
+    # The live lane has passed 5, but imported 2-4 are still unprojected.
+    async with async_session() as session:
+        status = await projection_status(session, tenant_id)
+    assert (status["position"], status["lag_events"]) == (1, 6)
+    assert status["lanes"][LIVE_LANE]["position"] == 5
+    assert status["lanes"][LIVE_LANE]["lag_events"] == 2
+    assert (status["lanes"][BACKFILL_LANE]["position"], status["lanes"][BACKFILL_LANE]["lag_events"]) == (1, 3)
+
+    assert await runner.run_lane_batch(BACKFILL_LANE) == 3
+    assert await runner.run_lane_batch(LIVE_LANE) == 2
+    assert log == [5, 2, 3, 4, 6, 7]
+
+    async with async_session() as session:
+        live = await session.get(SubscriptionModel, subscription_id_for(tenant_id, LIVE_LANE))
+        backfill = await session.get(SubscriptionModel, subscription_id_for(tenant_id, BACKFILL_LANE))
+        assert (live.last_position, backfill.last_position) == (7, 4)
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_live_events_are_projected_ahead_of_backfill():
+    engine = _engine()
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    async with async_session() as session:
+        store = EventStore(session=session, tenant_id=tenant_id)
+        await store.append(uuid.uuid4(), "Admission", [_event("legacy_v2") for _ in range(200)])
+        await store.append(uuid.uuid4(), "Admission", [_event()])
+        await session.commit()
+
+    log: list[int] = []
+    runner = PriorityLaneRunner(
+        session_factory=async_session,
+        tenant_id=tenant_id,
+        projection_factory=lambda session, tenant: [RecordingProjection(log)],
+        backfill_batch_size=50,
+        backfill_events_per_second=0,
+        poll_interval_seconds=0.01,
+    )
+    task = asyncio.create_task(runner.run())
+    for _ in range(200):
+        await asyncio.sleep(0.01)
+        if len(log) == 201:
+            break
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert log[0] == 201
+    assert log[1:] == list(range(1, 201))
+
+    await engine.dispose()
+
+
+def test_backfill_throttle_spaces_batches_by_rate():
+    throttle = BackfillThrottle(events_per_second=100)
+    assert throttle.delay() == 0
+    throttle.spent(50)
+    assert 0.4 < throttle.delay() <= 0.5
+
+    unlimited = BackfillThrottle(events_per_second=0)
+    unlimited.spent(1000)
+    assert unlimited.delay() == 0
@@ -0,0 +1,112 @@
+import uuid
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.infrastructure.event_store import EventStore, EventToAppend
+from app.models.base import Base
+from app.projections.metrics import Histogram
+from app.projections.registry import subscription_id_for
+from app.projections.runner import ProjectionRunner
+
+
+class RecordingProjection:
+    async def handle(self, event):
+        return None
+
+
+def _event(event_type):
+    return EventToAppend(event_type=event_type, data={}, metadata={}, created_by=uuid.uuid4())
+
+
+def test_histogram_quantiles_use_bucket_bounds():
+    histogram = Histogram()
+    for _ in range(99):
+        histogram.observe(0.001)
+    histogram.observe(2.0)
+
+    summary = histogram.to_dict()
+    assert summary["count"] == 100
+    assert summary["max"] == 2.0
+    assert 0.001 <= summary["p50"] < 0.002
+    assert summary["p99"] < 0.002
+    assert histogram.quantile(1.0) >= 2.0
+
+
+@pytest.mark.asyncio
+async def test_runner_publishes_timings_and_lag():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    stream_id = uuid.uuid4()
+
+    async with async_session() as session:
+        store = EventStore(session=session, tenant_id=tenant_id)
+        await store.append(
+            stream_id=stream_id,
+            stream_type="Admission",
+            events=[_event("admission.created"), _event("admission.location_changed")],
+        )
+        await session.commit()
+
+        runner = ProjectionRunner(
+            event_store=store,
+            projections=[RecordingProjection()],
+            subscription_id=subscription_id_for(tenant_id),
+            session=session,
+        )
+        assert await runner.run_once() == 2
+
+        await store.append(
+            stream_id=stream_id,
+            stream_type="Admission",
+            events=[_event("admission.location_changed")],
+            expected_version=2,
+        )
+        await session.commit()
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get(
+            "/api/v1/projections/metrics",
+            headers={"X-Tenant-ID": str(tenant_id)},
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["position"] == 2
+        assert body["head_position"] == 3
+        assert body["lag_events"] == 1
+        assert body["last_event_age_seconds"] is not None
+
+        runner_stats = body["runner"]
+        assert runner_stats["events"] == 2
+        assert runner_stats["fetch_seconds"]["count"] == 1
+        handled = {
+            (item["projection"], item["event_type"]): item["count"]
+            for item in runner_stats["handle_seconds"]
+        }
+        assert handled == {
+            ("RecordingProjection", "admission.created"): 1,
+            ("RecordingProjection", "admission.location_changed"): 1,
+        }
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
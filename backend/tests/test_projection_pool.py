@@ -0,0 +1,233 @@
+import asyncio
+import uuid
+import pytest
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.infrastructure.event_store import EventStore, EventToAppend
+from app.models.base import Base
+from app.models.event_store import SubscriptionModel
+from app.models.tenant import Tenant
+from app.projections.pool import TenantProjectionPool
+from app.projections.registry import subscription_id_for
+
+
+class RecordingProjection:
+    def __init__(self, log, tenant_id):
+        self.log = log
+        self.tenant_id = tenant_id
+
+    async def handle(self, event):
+        self.log.append(self.tenant_id)
+
+
+@pytest.mark.asyncio
+async def test_pool_interleaves_backlogged_tenant_with_others(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", future=True)
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    busy_tenant = uuid.uuid4()
+    quiet_tenant = uuid.uuid4()
+    inactive_tenant = uuid.uuid4()
+
+    async with async_session() as session:
+        session.add(Tenant(id=busy_tenant, name="Busy", is_active=True))
+        session.add(Tenant(id=quiet_tenant, name="Quiet", is_active=True))
+        session.add(Tenant(id=inactive_tenant, name="Closed", is_active=False))
+        await session.flush()
+
+        for tenant_id, count in [(busy_tenant, 30), (quiet_tenant, 2), (inactive_tenant, 3)]:
+            store = EventStore(session=session, tenant_id=tenant_id)
+            await store.append(
+                stream_id=uuid.uuid4(),
+                stream_type="Admission",
+                events=[
+                    EventToAppend(
+                        event_type="admission.created",
+                        data={},
+                        metadata={},
+                        created_by=uuid.uuid4(),
+                    )
+                    for _ in range(count)
+                ],
+            )
+        await session.commit()
+
+    log: list[uuid.UUID] = []
+    pool = TenantProjectionPool(
+        session_factory=async_session,
+        projection_factory=lambda session, tenant_id: [RecordingProjection(log, tenant_id)],
+        max_workers=1,
+        batch_size=5,
+        poll_interval_seconds=0.01,
+    )
+
+    assert set(await pool.discover_tenants()) == {busy_tenant, quiet_tenant}
+
+    task = asyncio.create_task(pool.run())
+    for _ in range(200):
+        await asyncio.sleep(0.01)
+        if len(log) == 32:
+            break
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert log.count(busy_tenant) == 30
+    assert log.count(quiet_tenant) == 2
+    assert inactive_tenant not in log
+    # The quiet tenant is served after at most one batch of the busy tenant's backlog.
+    assert log.index(quiet_tenant) <= 5
+
+    async with async_session() as session:
+        result = await session.execute(
+            select(SubscriptionModel.last_position).where(
+                SubscriptionModel.subscription_id == subscription_id_for(quiet_tenant)
+            )
+        )
+        assert result.scalar_one() > 0
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_backs_off_failing_tenant_and_counts_failures(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", future=True)
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    async with async_session() as session:
+        session.add(Tenant(id=tenant_id, name="Flaky", is_active=True))
+        await session.flush()
+        store = EventStore(session=session, tenant_id=tenant_id)
+        await store.append(
+            stream_id=uuid.uuid4(),
+            stream_type="Admission",
+            events=[EventToAppend(event_type="admission.created", data={}, metadata={}, created_by=uuid.uuid4())],
+        )
+        await session.commit()
+
+    log: list[uuid.UUID] = []
+    attempts: list[float] = []
+
+    def flaky_factory(session, tenant):
+        attempts.append(asyncio.get_running_loop().time())
+        if len(attempts) <= 2:
+            raise RuntimeError("read-model database unavailable")
+        return [RecordingProjection(log, tenant)]
+
+    pool = TenantProjectionPool(
+        session_factory=async_session,
+        projection_factory=flaky_factory,
+        max_workers=1,
+        batch_size=5,
+        poll_interval_seconds=0.01,
+        max_backoff_seconds=0.05,
+    )
+
+    task = asyncio.create_task(pool.run())
+    for _ in range(200):
+        await asyncio.sleep(0.01)
+        if pool.metrics(tenant_id).mode is not None:
+            break
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert log == [tenant_id]
+    assert len(attempts) >= 3
+    # The second failure doubles the first backoff.
+    assert attempts[2] - attempts[1] >= 0.02
+
+    stats = pool.stats()[str(tenant_id)]
+    assert stats["failed_batches"] == 2
+    assert stats["consecutive_failures"] == 0
+    assert stats["last_error"] == "RuntimeError: read-model database unavailable"
+    assert stats["mode"] == "live" and stats["batch_size"] == 5
+
+    async with async_session() as session:
+        result = await session.execute(
+            select(SubscriptionModel.stats).where(SubscriptionModel.subscription_id == subscription_id_for(tenant_id))
+        )
+        assert result.scalar_one()["failed_batches"] == 2
+
+    pool._retry_at[tenant_id] = float("inf")
+    pool._schedule(tenant_id)
+    assert pool._queue.empty()
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_gives_backlogged_tenant_more_turns_not_bigger_ones(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", future=True)
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    backlog_tenant = uuid.uuid4()
+    live_tenant = uuid.uuid4()
+
+    async def append(tenant_id, count):
+        async with async_session() as session:
+            store = EventStore(session=session, tenant_id=tenant_id)
+            await store.append(
+                stream_id=uuid.uuid4(),
+                stream_type="Admission",
+                events=[
+                    EventToAppend(event_type="admission.created", data={}, metadata={}, created_by=uuid.uuid4())
+                    for _ in range(count)
+                ],
+            )
+            await session.commit()
+
+    async with async_session() as session:
+        session.add(Tenant(id=backlog_tenant, name="Replaying", is_active=True))
+        session.add(Tenant(id=live_tenant, name="Live", is_active=True))
+        await session.commit()
+    await append(backlog_tenant, 60)
+
+    turns: list[tuple[uuid.UUID, int]] = []
+
+    class RecordingPool(TenantProjectionPool):
+        async def run_tenant_batch(self, tenant_id):
+            processed = await super().run_tenant_batch(tenant_id)
+            turns.append((tenant_id, processed))
+            # A live event arrives while the replay is well under way.
+            if len(turns) == 4:
+                await append(live_tenant, 1)
+                self._schedule(live_tenant)
+            return processed
+
+    pool = RecordingPool(
+        session_factory=async_session,
+        projection_factory=lambda session, tenant_id: [],
+        max_workers=1,
+        batch_size=5,
+        poll_interval_seconds=60,
+    )
+    pool._schedule(backlog_tenant)
+    worker = asyncio.create_task(pool._worker())
+    for _ in range(200):
+        await asyncio.sleep(0.01)
+        if sum(processed for tenant_id, processed in turns if tenant_id == backlog_tenant) == 60:
+            break
+    worker.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await worker
+
+    backlog_turns = [processed for tenant_id, processed in turns if tenant_id == backlog_tenant]
+    assert backlog_turns[:12] == [5] * 12
+    assert pool.stats()[str(backlog_tenant)]["batch_size"] == 5
+    # The live tenant is queued ahead of the backlog's next turn.
+    assert turns.index((live_tenant, 1)) == 4
+
+    await engine.dispose()
@@ -0,0 +1,113 @@
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.api import raw_json
+from app.core.database import get_session
+from app.infrastructure.response_cache import LocalCacheBackend, response_cache
+from app.models.base import Base
+from app.models.read_models import PatientReadModel, TimelineEventModel
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_splice_writes_raw_values_verbatim(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(raw_json, "orjson", None)
+    body = raw_json.splice(
+        {"items": ['{"a": 1}', '{"b": [2, 3]}'], "summary": '{"c": null}', "limit": 2, "next_cursor": None},
+        "items",
+        "summary",
+    )
+    assert body.startswith(b'{"items":[{"a": 1},{"b": [2, 3]}]')
+    assert json.loads(body) == {"items": [{"a": 1}, {"b": [2, 3]}], "summary": {"c": None}, "limit": 2, "next_cursor": None}
+    assert json.loads(raw_json.splice({"items": []}, "items")) == {"items": []}
+
+
+@pytest.mark.asyncio
+async def test_reads_pass_stored_json_through(monkeypatch):
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    admission_id = uuid.uuid4()
+    patient_ids = [uuid.uuid4() for _ in range(3)]
+
+    async with async_session() as session:
+        for index, patient_id in enumerate(patient_ids):
+            session.add(
+                PatientReadModel(
+                    id=patient_id,
+                    tenant_id=tenant_id,
+                    created_at=START + timedelta(minutes=index),
+                    data={"patient_id": str(patient_id), "name": "Zoë", "legacy_fields": {"n": index}},
+                )
+            )
+        for minute in range(3):
+            session.add(
+                TimelineEventModel(
+                    id=uuid.uuid4(),
+                    tenant_id=tenant_id,
+                    admission_id=admission_id,
+                    event_type="vital",
+                    occurred_at=START + timedelta(minutes=minute),
+                    data={"minute": minute},
+                )
+            )
+        await session.commit()
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+    monkeypatch.setattr(response_cache, "backend", LocalCacheBackend())
+    monkeypatch.setattr(response_cache, "ttl_seconds", 60.0)
+    monkeypatch.setattr(response_cache, "hits", 0)
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/patients", params={"limit": 2}, headers=headers)
+        assert resp.headers["content-type"] == "application/json"
+        assert "etag" in resp.headers
+        body = resp.json()
+        assert [item["legacy_fields"]["n"] for item in body["items"]] == [0, 1]
+        assert body["items"][0]["name"] == "Zoë"
+        assert body["limit"] == 2 and body["next_cursor"]
+
+        resp = await client.get("/api/v1/patients", params={"cursor": body["next_cursor"]}, headers=headers)
+        assert [item["legacy_fields"]["n"] for item in resp.json()["items"]] == [2]
+
+        url = f"/api/v1/patients/{patient_ids[1]}"
+        first = await client.get(url, headers=headers)
+        second = await client.get(url, headers=headers)
+        assert first.json()["patient_id"] == str(patient_ids[1])
+        assert second.content == first.content
+        assert response_cache.hits == 1
+
+        resp = await client.get(f"/api/v1/patients/{uuid.uuid4()}", headers=headers)
+        assert resp.json() == {"detail": "not found"}
+
+        resp = await client.get(f"/api/v1/admissions/{admission_id}/timeline", headers=headers)
+        assert resp.json() == {"items": [{"minute": 0}, {"minute": 1}, {"minute": 2}]}
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
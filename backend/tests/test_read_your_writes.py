@@ -0,0 +1,91 @@
+import asyncio
+import uuid
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.main import app
+from app.core.config import get_settings
+from app.core.database import get_session
+from app.infrastructure.event_store import EventStore
+from app.models.base import Base
+from app.projections.progress import ProjectionProgress
+from app.projections.read_model_projections import AdmissionProjection
+from app.projections.registry import subscription_id_for
+from app.projections.runner import ProjectionRunner
+
+
+@pytest.mark.asyncio
+async def test_progress_wait_polls_checkpoint_written_by_another_process():
+    progress = ProjectionProgress()
+    checkpoints = iter([0, 2, 5])
+
+    async def read_checkpoint():
+        return next(checkpoints)
+
+    assert await progress.wait_for("read-models", 5, 1.0, read_checkpoint)
+    assert progress.position("read-models") == 5
+
+    async def stuck():
+        return 1
+
+    assert not await progress.wait_for("other", 2, 0.05, stuck)
+
+
+@pytest.mark.asyncio
+async def test_reads_wait_for_the_position_returned_by_a_command(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'ryw.db'}", future=True)
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    tenant_id = uuid.uuid4()
+    admission_id = uuid.uuid4()
+
+    async def project():
+        async with async_session() as session:
+            runner = ProjectionRunner(
+                event_store=EventStore(session=session, tenant_id=tenant_id),
+                projections=[AdmissionProjection(session, tenant_id)],
+                subscription_id=subscription_id_for(tenant_id),
+                session=session,
+            )
+            await runner.run_once()
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    url = f"/api/v1/admissions/{admission_id}/trajectory"
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.post(
+            f"/api/v1/admissions/{admission_id}/location",
+            json={"to_location": "CICU", "effective_at": "2026-01-01T08:00:00Z", "created_by": str(uuid.uuid4())},
+            headers=headers,
+        )
+        body = resp.json()
+        assert body == {"new_version": 1, "global_position": 1}
+
+        read = asyncio.create_task(client.get(url, params={"min_position": body["global_position"]}, headers=headers))
+        await asyncio.sleep(0.05)
+        assert not read.done()
+        await project()
+        resp = await asyncio.wait_for(read, 2)
+        assert [item["to_location"] for item in resp.json()["items"]] == ["CICU"]
+
+        resp = await client.get(url, headers={**headers, "X-Min-Position": "1"})
+        assert resp.status_code == 200
+
+        monkeypatch.setattr(get_settings(), "read_consistency_timeout_seconds", 0.05)
+        resp = await client.get(url, params={"min_position": 2}, headers=headers)
+        assert resp.status_code == 503
+        assert resp.headers["retry-after"] == "1"
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
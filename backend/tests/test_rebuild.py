@@ -0,0 +1,201 @@
+import uuid
+import pytest
+
+from sqlalchemy import Column, MetaData, Table, select
+from sqlalchemy.schema import CreateTable, DropTable
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.infrastructure.event_store import EventStore, EventToAppend
+from app.models.base import Base
+from app.models.event_store import ProjectionDeadLetterModel, SubscriptionModel
+from app.models.read_models import PatientReadModel, TimelineEventModel
+from app.projections.dead_letters import replay_dead_letters
+from app.projections.rebuild import ProjectionRebuilder, RebuildVerificationError
+from app.projections.registry import build_projections, subscription_id_for
+
+
+class PoisonProjection:
+    """Fails on the third event until ``fixed`` is set."""
+
+    fixed = False
+
+    def __init__(self):
+        self.handled = []
+
+    async def handle(self, event):
+        if event["global_position"] == 3 and not self.fixed:
+            raise ValueError("cannot project event 3")
+        self.handled.append(event["global_position"])
+
+
+async def _seed(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'rebuild.db'}", future=True)
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    patient_id = uuid.uuid4()
+    admission_id = uuid.uuid4()
+    async with async_session() as session:
+        store = EventStore(session=session, tenant_id=tenant_id)
+        await store.append(
+            stream_id=patient_id,
+            stream_type="Patient",
+            events=[
+                EventToAppend(
+                    event_type="patient.created",
+                    data={"patient_id": str(patient_id), "name": "Rebuilt"},
+                    metadata={},
+                    created_by=uuid.uuid4(),
+                )
+            ],
+        )
+        await store.append(
+            stream_id=admission_id,
+            stream_type="Admission",
+            events=[
+                EventToAppend(
+                    event_type="clinical_event.recorded",
+                    data={
+                        "event_id": str(uuid.uuid4()),
+                        "admission_id": str(admission_id),
+                        "event_type": "procedure",
+                        "occurred_at": f"2026-01-02T0{i}:00:00",
+                    },
+                    metadata={},
+                    created_by=uuid.uuid4(),
+                )
+                for i in range(3)
+            ],
+        )
+        await session.commit()
+    return engine, async_session, tenant_id, patient_id
+
+
+@pytest.mark.asyncio
+async def test_rebuild_swaps_shadow_tables_and_sets_checkpoint(tmp_path):
+    engine, async_session, tenant_id, patient_id = await _seed(tmp_path)
+
+    report = await ProjectionRebuilder(engine=engine, batch_size=2).rebuild()
+
+    assert report.events == 4
+    assert report.positions[tenant_id] == 4
+    assert report.row_counts["timeline_events"] == (0, 3)
+
+    async with async_session() as session:
+        patient = await session.get(PatientReadModel, patient_id)
+        assert patient.data["name"] == "Rebuilt"
+        rows = (await session.execute(select(TimelineEventModel))).scalars().all()
+        assert len(rows) == 3
+        checkpoint = await session.get(SubscriptionModel, subscription_id_for(tenant_id))
+        assert checkpoint.last_position == 4
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_rebuild_refuses_cutover_when_rows_would_be_lost(tmp_path):
+    engine, async_session, tenant_id, _ = await _seed(tmp_path)
+
+    async with async_session() as session:
+        for _ in range(2):
+            stray_id = uuid.uuid4()
+            session.add(PatientReadModel(id=stray_id, tenant_id=tenant_id, data={"patient_id": str(stray_id)}))
+        await session.commit()
+
+    with pytest.raises(RebuildVerificationError):
+        await ProjectionRebuilder(engine=engine).rebuild()
+
+    async with async_session() as session:
+        rows = (await session.execute(select(PatientReadModel))).scalars().all()
+        assert len(rows) == 2
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_rebuild_parks_failing_events_and_resolves_replayed_letters(tmp_path):
+    engine, async_session, tenant_id, _ = await _seed(tmp_path)
+    subscription_id = subscription_id_for(tenant_id)
+
+    # The runner parked event 2 before the bug behind it was fixed.
+    async with async_session() as session:
+        session.add(
+            ProjectionDeadLetterModel(
+                subscription_id=subscription_id,
+                projection="TimelineProjection",
+                tenant_id=tenant_id,
+                event_id=uuid.uuid4(),
+                event_type="clinical_event.recorded",
+                global_position=2,
+                error="KeyError: 'admission_id'",
+            )
+        )
+        await session.commit()
+
+    report = await ProjectionRebuilder(
+        engine=engine,
+        projection_factory=lambda session, tenant: build_projections(session, tenant) + [PoisonProjection()],
+        batch_size=2,
+    ).rebuild()
+
+    assert report.positions[tenant_id] == 4
+    assert [(letter["projection"], letter["global_position"]) for letter in report.parked] == [
+        ("PoisonProjection", 3)
+    ]
+
+    async with async_session() as session:
+        # Only the poison projection lost the event; the timeline has every row.
+        rows = (await session.execute(select(TimelineEventModel))).scalars().all()
+        assert len(rows) == 3
+        result = await session.execute(
+            select(ProjectionDeadLetterModel).order_by(ProjectionDeadLetterModel.global_position)
+        )
+        letters = [(l.projection, l.global_position, l.resolved_at is None) for l in result.scalars().all()]
+        assert letters == [("TimelineProjection", 2, False), ("PoisonProjection", 3, True)]
+
+        PoisonProjection.fixed = True
+        try:
+            poison = PoisonProjection()
+            replay = await replay_dead_letters(
+                session,
+                tenant_id=tenant_id,
+                subscription_id=subscription_id,
+                projections=build_projections(session, tenant_id) + [poison],
+            )
+        finally:
+            PoisonProjection.fixed = False
+
+        # The letter the rebuild already replayed is not applied again.
+        assert (replay.resolved, replay.failed) == (1, 0)
+        assert poison.handled == [3]
+        rows = (await session.execute(select(TimelineEventModel))).scalars().all()
+        assert len(rows) == 3
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_rebuild_copies_rows_by_column_name_on_sqlite(tmp_path):
+    engine, async_session, tenant_id, _ = await _seed(tmp_path)
+
+    # Migrations append columns, so a live table's order can differ from the model's.
+    live = TimelineEventModel.__table__
+    reordered = Table(
+        live.name,
+        MetaData(),
+        *(Column(c.name, c.type, primary_key=c.primary_key, nullable=c.nullable) for c in reversed(live.columns)),
+    )
+    async with engine.begin() as conn:
+        await conn.execute(DropTable(live))
+        await conn.execute(CreateTable(reordered))
+
+    await ProjectionRebuilder(engine=engine).rebuild()
+
+    async with async_session() as session:
+        rows = (await session.execute(select(TimelineEventModel))).scalars().all()
+        assert sorted(row.data["event_type"] for row in rows) == ["procedure"] * 3
+        assert {row.tenant_id for row in rows} == {tenant_id}
+
+    await engine.dispose()
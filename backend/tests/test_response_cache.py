@@ -0,0 +1,157 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.infrastructure.event_store import EventStore, EventToAppend
+from app.infrastructure.response_cache import LocalCacheBackend, ResponseCache, response_cache
+from app.models.base import Base
+from app.projections.read_model_projections import AdmissionWatermarkProjection, TimelineProjection
+from app.projections.runner import ProjectionRunner
+
+
+@pytest.mark.asyncio
+async def test_local_backend_evicts_least_recently_used_and_invalidates_by_tag():
+    backend = LocalCacheBackend(max_entries=2, max_bytes=100)
+    await backend.set("a", b"1" * 10, ["t1"], 60)
+    await backend.set("b", b"2" * 10, ["t2"], 60)
+    assert await backend.get("a") == b"1" * 10
+    await backend.set("c", b"3" * 10, ["t1"], 60)
+    # "b" was least recently used.
+    assert await backend.get("b") is None
+    assert backend.stats() == {"entries": 2, "bytes": 22, "evictions": 1}
+
+    assert await backend.invalidate(["t1"]) == 2
+    assert backend.stats()["entries"] == 0 and backend.stats()["bytes"] == 0
+
+    await backend.set("big", b"x" * 99, [], 60)
+    await backend.set("small", b"y", [], 60)
+    assert await backend.get("big") is None
+
+    await backend.set("short", b"z", [], 0)
+    assert await backend.get("short") is None
+
+
+@pytest.mark.asyncio
+async def test_invalidation_only_discards_in_flight_puts_of_its_tenant():
+    cache = ResponseCache(LocalCacheBackend(), ttl_seconds=60)
+    busy_tenant, quiet_tenant = uuid.uuid4(), uuid.uuid4()
+    busy_generation, quiet_generation = cache.generation(busy_tenant), cache.generation(quiet_tenant)
+
+    # The runner commits a batch for one tenant while both responses are being built.
+    await cache.invalidate(busy_tenant, [uuid.uuid4()])
+
+    await cache.put("busy", {"items": []}, [], busy_tenant, busy_generation)
+    await cache.put("quiet", {"items": []}, [], quiet_tenant, quiet_generation)
+    assert await cache.get("busy") is None
+    assert await cache.get("quiet") == b'{"items":[]}'
+
+
+def _note(admission_id, hour):
+    return EventToAppend(
+        event_type="clinical_event.recorded",
+        data={
+            "event_id": str(uuid.uuid4()),
+            "admission_id": str(admission_id),
+            "event_type": "note",
+            "occurred_at": f"2026-01-01T{hour:02d}:00:00",
+        },
+        metadata={},
+        created_by=uuid.uuid4(),
+    )
+
+
+async def _invalidated_elsewhere(*args, **kwargs):
+    return 0
+
+
+@pytest.mark.asyncio
+async def test_runner_invalidates_cached_admission_responses():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    admission_id, other_admission = uuid.uuid4(), uuid.uuid4()
+
+    async def append_and_project(*events):
+        async with async_session() as session:
+            store = EventStore(session=session, tenant_id=tenant_id)
+            for stream_id, event in events:
+                await store.append(stream_id, "Admission", [event])
+            await session.commit()
+            runner = ProjectionRunner(
+                event_store=store,
+                projections=[
+                    TimelineProjection(session, tenant_id),
+                    AdmissionWatermarkProjection(session, tenant_id),
+                ],
+                subscription_id="read-models-test",
+                session=session,
+            )
+            await runner.run_once()
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+    previous_backend, previous_ttl = response_cache.backend, response_cache.ttl_seconds
+    response_cache.configure(LocalCacheBackend(), ttl_seconds=60)
+    response_cache.hits = response_cache.misses = 0
+
+    try:
+        await append_and_project((admission_id, _note(admission_id, 1)))
+
+        headers = {"X-Tenant-ID": str(tenant_id)}
+        url = f"/api/v1/admissions/{admission_id}/timeline"
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.get(url, headers=headers)
+            second = await client.get(url, headers=headers)
+            assert first.json() == second.json()
+            assert len(second.json()["items"]) == 1
+            assert second.headers["etag"] == first.headers["etag"]
+
+            # Another tenant's request is keyed apart.
+            other = await client.get(url, headers={"X-Tenant-ID": str(uuid.uuid4())})
+            assert other.json() == {"items": []}
+
+            # A batch for another admission leaves the entry in place.
+            await append_and_project((other_admission, _note(other_admission, 2)))
+            assert (await client.get(url, headers=headers)).json() == first.json()
+
+            await append_and_project((admission_id, _note(admission_id, 3)))
+            resp = await client.get(url, headers=headers)
+            assert len(resp.json()["items"]) == 2
+
+            stats = (await client.get("/api/v1/projections/response-cache")).json()
+            assert (stats["hits"], stats["misses"]) == (2, 3)
+            assert stats["hit_ratio"] == 0.4
+            assert stats["entries"] == 2 and stats["bytes"] > 0
+
+            # A runner in another process commits without invalidating this
+            # cache; the moved watermark keys the next read apart.
+            cached = await client.get(url, headers=headers)
+            with pytest.MonkeyPatch.context() as patch:
+                patch.setattr(response_cache, "invalidate", _invalidated_elsewhere)
+                await append_and_project((admission_id, _note(admission_id, 4)))
+            resp = await client.get(url, headers={**headers, "If-None-Match": cached.headers["etag"]})
+            assert resp.status_code == 200
+            assert len(resp.json()["items"]) == 3
+            assert resp.headers["etag"] != cached.headers["etag"]
+    finally:
+        response_cache.configure(previous_backend, ttl_seconds=previous_ttl)
+        app.dependency_overrides.clear()
+        await engine.dispose()
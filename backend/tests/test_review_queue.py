@@ -0,0 +1,182 @@
+import uuid
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.models.base import Base
+from app.models.read_models import ReviewQueueModel
+from app.projections.read_model_projections import ReviewQueueProjection
+
+
+def _admission(admission_id, patient_id, admit_date, review_date, position):
+    return {
+        "event_type": "admission.created",
+        "global_position": position,
+        "data": {
+            "admission_id": str(admission_id),
+            "patient_id": str(patient_id),
+            "admit_date": admit_date,
+            "legacy_fields": {"review_date": review_date},
+        },
+    }
+
+
+def _correction(admission_id, correction_type, detail, occurred_at, position):
+    return {
+        "event_type": "clinical_event.recorded",
+        "global_position": position,
+        "data": {
+            "event_id": str(uuid.uuid4()),
+            "admission_id": str(admission_id),
+            "event_type": "course_correction",
+            "occurred_at": occurred_at,
+            "correction_type": correction_type,
+            "detail": detail,
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_review_queue_tracks_review_dates_and_on_track_status():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    ann, bob, cy = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    ann_old, ann_new, bob_adm, cy_adm = uuid.uuid4(), uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    events = [
+        _admission(ann_old, ann, "2025-01-01T00:00:00", "2026-03-01T00:00:00", 1),
+        _admission(bob_adm, bob, "2026-01-01T00:00:00", "2026-03-01T00:00:00", 2),
+        _admission(cy_adm, cy, "2026-01-05T00:00:00", "2026-02-01T00:00:00", 3),
+        # Ann's second admission becomes her current one.
+        _admission(ann_new, ann, "2026-01-10T00:00:00", "2026-02-20T00:00:00", 4),
+        _correction(bob_adm, "note", "started diuretics", "2026-01-02T00:00:00", 5),
+        _correction(cy_adm, "set", "On Track: No", "2026-01-06T00:00:00", 6),
+        _correction(ann_new, "set", "ontrack: no", "2026-01-11T00:00:00", 7),
+        _correction(ann_new, "set", "ontrack: yes", "2026-01-12T00:00:00", 8),
+        # A late-arriving older "set" does not override the newer one.
+        _correction(ann_new, "set", "ontrack:no", "2026-01-10T12:00:00", 9),
+    ]
+
+    async with async_session() as session:
+        projection = ReviewQueueProjection(session=session, tenant_id=tenant_id)
+        for event in events:
+            await projection.handle(event)
+            await session.flush()
+        await session.commit()
+
+        assert (await session.get(ReviewQueueModel, ann_old)).is_current is False
+        new = await session.get(ReviewQueueModel, ann_new)
+        assert (new.is_current, new.on_track, new.correction_count) == (True, True, 3)
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/review-queue", params={"as_of": "2026-02-10"}, headers=headers)
+        items = resp.json()["items"]
+        assert [i["admission_id"] for i in items] == [str(ann_new), str(bob_adm)]
+        assert all(i["up_for_review"] for i in items)
+        assert items[1]["on_track"] is True
+
+        resp = await client.get(
+            "/api/v1/review-queue",
+            params={"as_of": "2026-02-10", "up_for_review": "false"},
+            headers=headers,
+        )
+        assert [(i["admission_id"], i["on_track"]) for i in resp.json()["items"]] == [(str(cy_adm), False)]
+
+        resp = await client.get(
+            "/api/v1/review-queue",
+            params={"as_of": "2026-01-01", "sort": "-review_date", "limit": 2},
+            headers=headers,
+        )
+        assert [i["admission_id"] for i in resp.json()["items"]] == [str(bob_adm), str(ann_new)]
+
+        resp = await client.get(
+            "/api/v1/review-queue",
+            params={"as_of": "2026-01-01", "on_track": "false"},
+            headers=headers,
+        )
+        assert [i["admission_id"] for i in resp.json()["items"]] == [str(cy_adm)]
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_review_queue_handles_out_of_order_events():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id, other_tenant_id = uuid.uuid4(), uuid.uuid4()
+    patient_id = uuid.uuid4()
+    older, newer, foreign = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    async with async_session() as session:
+        projection = ReviewQueueProjection(session=session, tenant_id=tenant_id)
+        for event in [
+            # The correction is projected before its admission.
+            _correction(newer, "set", "OnTrack: No", "2026-01-11T00:00:00", 1),
+            _admission(newer, patient_id, "2026-01-10T00:00:00", "2026-02-20T00:00:00", 2),
+            # An earlier admission imported later does not become current.
+            _admission(older, patient_id, "2025-06-01T00:00:00", "2026-03-01T00:00:00", 3),
+        ]:
+            await projection.handle(event)
+            await session.flush()
+        # Another tenant reusing the patient id leaves this tenant's queue alone.
+        await ReviewQueueProjection(session=session, tenant_id=other_tenant_id).handle(
+            _admission(foreign, patient_id, "2026-02-01T00:00:00", "2026-02-25T00:00:00", 4)
+        )
+        await session.commit()
+
+        entry = await session.get(ReviewQueueModel, newer)
+        assert (entry.patient_id, entry.is_current, entry.on_track, entry.correction_count) == (
+            patient_id,
+            True,
+            False,
+            1,
+        )
+        assert (await session.get(ReviewQueueModel, older)).is_current is False
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/review-queue", params={"as_of": "2026-02-10"}, headers=headers)
+        assert [(i["admission_id"], i["on_track"]) for i in resp.json()["items"]] == [(str(newer), False)]
+
+        resp = await client.get("/api/v1/review-queue", params={"sort": "patient"}, headers=headers)
+        assert resp.status_code == 422
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
@@ -22,7 +22,10 @@ async def test_run_main_invokes_runner(monkeypatch):
             self.tenant_id = tenant_id
 
     class DummyRunner:
-        def __init__(self, event_store, projections, subscription_id, session, poll_interval_seconds=1.0):
+        def __init__(
+            self, event_store, projections, subscription_id, session, poll_interval_seconds=1.0, batch_size=100
+        ):
+            called["batch_size"] = batch_size
             self.event_store = event_store
             self.projections = projections
             self.subscription_id = subscription_id
@@ -46,5 +49,15 @@ async def test_run_main_invokes_runner(monkeypatch):
     monkeypatch.setattr(run_module, "get_settings", lambda: DummySettings())
     monkeypatch.setattr(run_module, "async_session_factory", DummySessionFactory())
 
-    await run_module.main()
+    await run_module.main(batch_size=250)
     assert called["run"] is True
+    assert called["batch_size"] == 250
+
+
+def test_parse_args_rejects_lanes_with_all_tenants(monkeypatch):
+    monkeypatch.setattr("sys.argv", ["run", "--all-tenants", "--batch-size", "50"])
+    assert run_module.parse_args().batch_size == 50
+
+    monkeypatch.setattr("sys.argv", ["run", "--all-tenants", "--lanes"])
+    with pytest.raises(SystemExit):
+        run_module.parse_args()
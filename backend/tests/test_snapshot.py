@@ -0,0 +1,73 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+from app.models.event_store import SubscriptionModel
+from app.models.read_models import PatientReadModel, TimelineEventModel
+from app.projections.snapshot import SnapshotError, dump_snapshot, restore_snapshot
+
+
+def _engine():
+    return create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+
+@pytest.mark.asyncio
+async def test_snapshot_round_trips_read_models_and_checkpoints(tmp_path):
+    source, target = _engine(), _engine()
+    for engine in (source, target):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    patient_id = uuid.uuid4()
+    admission_id = uuid.uuid4()
+    occurred_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    async with async_sessionmaker(source)() as session:
+        session.add(PatientReadModel(id=patient_id, tenant_id=tenant_id, data={"name": "Avery", "tags": [1, 2]}))
+        session.add(
+            TimelineEventModel(
+                id=uuid.uuid4(),
+                tenant_id=tenant_id,
+                admission_id=admission_id,
+                event_type="note",
+                occurred_at=occurred_at,
+                data={},
+            )
+        )
+        session.add(SubscriptionModel(subscription_id="read-models", last_position=42))
+        await session.commit()
+
+    path = tmp_path / "read-models.jsonl.gz"
+    counts = await dump_snapshot(source, path)
+    assert counts["patient_read_models"] == 1
+    assert counts["subscriptions"] == 1
+
+    restored = await restore_snapshot(target, path)
+    assert restored == counts
+
+    async with async_sessionmaker(target)() as session:
+        patient = await session.get(PatientReadModel, patient_id)
+        assert patient.data == {"name": "Avery", "tags": [1, 2]}
+        timeline = (await session.execute(select(TimelineEventModel))).scalar_one()
+        assert timeline.admission_id == admission_id
+        assert timeline.occurred_at.replace(tzinfo=timezone.utc) == occurred_at
+        subscription = await session.get(SubscriptionModel, "read-models")
+        assert subscription.last_position == 42
+
+    with pytest.raises(SnapshotError):
+        await restore_snapshot(target, path)
+    assert await restore_snapshot(target, path, replace=True) == counts
+
+    await source.dispose()
+    await target.dispose()
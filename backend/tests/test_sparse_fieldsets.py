@@ -0,0 +1,110 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.api import fieldsets
+from app.core.database import get_session
+from app.models.base import Base
+from app.models.read_models import AdmissionReadModel, PatientReadModel
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_fields_project_patient_and_admission_payloads(monkeypatch):
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    patient_id = uuid.uuid4()
+    admission_ids = [uuid.uuid4(), uuid.uuid4()]
+    legacy = {f"field_{n}": "x" * 50 for n in range(40)}
+
+    async with async_session() as session:
+        session.add(
+            PatientReadModel(
+                id=patient_id,
+                tenant_id=tenant_id,
+                created_at=START,
+                data={"patient_id": str(patient_id), "mrn": "MRN-1", "deceased": False, "legacy_fields": legacy},
+            )
+        )
+        for index, admission_id in enumerate(admission_ids):
+            data = {"admission_id": str(admission_id), "status": "active", "legacy_fields": legacy}
+            if index:
+                data["location"] = {"unit": "CICU", "bed": 4}
+            session.add(
+                AdmissionReadModel(
+                    id=admission_id,
+                    tenant_id=tenant_id,
+                    patient_id=patient_id,
+                    created_at=START + timedelta(minutes=index),
+                    data=data,
+                )
+            )
+        await session.commit()
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        full = await client.get("/api/v1/patients", headers=headers)
+        resp = await client.get("/api/v1/patients", params={"fields": "patient_id,deceased"}, headers=headers)
+        assert resp.json()["items"] == [{"patient_id": str(patient_id), "deceased": False}]
+        assert len(resp.content) < len(full.content) / 10
+
+        resp = await client.get(f"/api/v1/patients/{patient_id}", params={"fields": "mrn"}, headers=headers)
+        assert resp.json() == {"mrn": "MRN-1"}
+
+        resp = await client.get(
+            "/api/v1/admissions",
+            params={"patient_id": str(patient_id), "fields": "admission_id, location,location", "limit": 1},
+            headers=headers,
+        )
+        body = resp.json()
+        # The first admission has no location, so the key is left out.
+        assert body["items"] == [{"admission_id": str(admission_ids[0])}]
+        resp = await client.get(
+            "/api/v1/admissions",
+            params={"fields": "admission_id,location", "cursor": body["next_cursor"]},
+            headers=headers,
+        )
+        assert resp.json()["items"] == [{"admission_id": str(admission_ids[1]), "location": {"unit": "CICU", "bed": 4}}]
+
+        for fields in ("", "a.b", "$.legacy_fields", ",".join(f"f{n}" for n in range(51))):
+            resp = await client.get("/api/v1/patients", params={"fields": fields}, headers=headers)
+            assert resp.status_code == 400
+            resp = await client.get(f"/api/v1/patients/{patient_id}", params={"fields": fields}, headers=headers)
+            assert resp.status_code == 400
+        resp = await client.get("/api/v1/admissions", params={"fields": "admission_id", "cursor": "bogus"}, headers=headers)
+        assert resp.status_code == 400
+
+        resp = await client.get(f"/api/v1/patients/{patient_id}", params={"fields": "nope"}, headers=headers)
+        assert resp.json() == {}
+
+        # The JSON -> operator needs SQLite 3.38.
+        monkeypatch.setattr(fieldsets.sqlite3, "sqlite_version_info", (3, 37, 2))
+        resp = await client.get("/api/v1/patients", params={"fields": "name"}, headers=headers)
+        assert resp.status_code == 501
+        assert (await client.get("/api/v1/patients", headers=headers)).status_code == 200
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
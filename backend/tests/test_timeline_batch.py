@@ -0,0 +1,130 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.api.routes import read_models
+from app.core.database import get_session
+from app.models.base import Base
+from app.models.read_models import AttachmentReadModel, TimelineEventModel, TrajectoryPointModel
+
+
+def _at(hour):
+    return datetime(2026, 1, 1, hour, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_batch_timelines_group_per_admission_in_one_streamed_query(monkeypatch):
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    first, second, empty = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    async with async_session() as session:
+        for admission_id, hour, location in [(first, 1, "ED"), (first, 4, "CICU"), (second, 2, "CTOR")]:
+            session.add(
+                TrajectoryPointModel(
+                    id=uuid.uuid4(),
+                    tenant_id=tenant_id,
+                    admission_id=admission_id,
+                    location=location,
+                    effective_at=_at(hour),
+                    sequence=0,
+                    data={"to_location": location},
+                )
+            )
+        session.add(
+            TimelineEventModel(
+                id=uuid.uuid4(),
+                tenant_id=tenant_id,
+                admission_id=first,
+                event_type="note",
+                occurred_at=_at(2),
+                data={"event_type": "note"},
+            )
+        )
+        session.add(
+            AttachmentReadModel(
+                id=uuid.uuid4(),
+                tenant_id=tenant_id,
+                admission_id=second,
+                occurred_at=_at(2),
+                data={"filename": "echo.pdf"},
+            )
+        )
+        await session.commit()
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.post(
+            "/api/v1/admissions/timelines",
+            json={"admission_ids": [str(second), str(empty), str(first), str(second)]},
+            headers=headers,
+        )
+        body = resp.json()
+        assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 1
+        assert [group["admission_id"] for group in body["items"]] == [str(second), str(empty), str(first)]
+        assert [(i["lane"], i["data"]) for i in body["items"][0]["items"]] == [
+            ("locations", {"to_location": "CTOR"}),
+            ("attachments", {"filename": "echo.pdf"}),
+        ]
+        assert body["items"][1]["items"] == []
+        assert [i["lane"] for i in body["items"][2]["items"]] == ["locations", "events", "locations"]
+
+        # One row per cursor partition: admissions and the empty ones between
+        # them still come back whole and in request order.
+        monkeypatch.setattr(read_models, "STREAM_PARTITION_ROWS", 1)
+        unknown = uuid.uuid4()
+        resp = await client.post(
+            "/api/v1/admissions/timelines",
+            json={"admission_ids": [str(unknown), str(first), str(empty), str(second), str(uuid.uuid4())]},
+            headers=headers,
+        )
+        groups = resp.json()["items"]
+        assert [group["admission_id"] for group in groups][:4] == [str(unknown), str(first), str(empty), str(second)]
+        assert [len(group["items"]) for group in groups] == [0, 3, 0, 2, 0]
+
+        resp = await client.post("/api/v1/admissions/timelines", json={"admission_ids": []}, headers=headers)
+        assert resp.status_code == 422
+
+        resp = await client.post(
+            "/api/v1/admissions/timelines",
+            json={"admission_ids": [str(uuid.uuid4()) for _ in range(300)]},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        assert all(group["items"] == [] for group in resp.json()["items"])
+
+        resp = await client.post(
+            "/api/v1/admissions/timelines",
+            json={"admission_ids": [str(uuid.uuid4()) for _ in range(301)]},
+            headers=headers,
+        )
+        assert resp.status_code == 422
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
@@ -0,0 +1,130 @@
+import math
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.api import downsample
+from app.core.database import get_session
+from app.models.base import Base
+from app.models.read_models import TimelineEventModel, TrajectoryPointModel
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def test_lttb_keeps_endpoints_and_extremes():
+    xs = list(range(100))
+    ys = [math.sin(x / 5) for x in xs]
+    ys[37] = 10.0
+    ys[71] = -10.0
+    keep = downsample.lttb_indices(xs, ys, 12)
+    assert len(keep) == 12
+    assert keep[0] == 0 and keep[-1] == 99
+    assert keep == sorted(set(keep))
+    assert 37 in keep and 71 in keep
+
+    assert downsample.lttb_indices(xs, ys, 200) == xs
+    assert downsample.lttb_indices(xs[:2], ys[:2], 3) == [0, 1]
+
+
+def test_uniform_time_indices_pick_points_nearest_even_times():
+    # A burst of points early on does not crowd out the sparse tail.
+    xs = [0, 1, 2, 3, 4, 5, 50, 98, 99, 100]
+    assert downsample.uniform_time_indices(xs, 5) == [0, 5, 6, 7, 9]
+    assert downsample.uniform_time_indices([5.0] * 10, 4) == [0, 9]
+    assert downsample.uniform_time_indices(xs, 20) == list(range(10))
+
+
+@pytest.mark.asyncio
+async def test_timeline_and_trajectory_windows_and_downsampling():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    admission_id = uuid.uuid4()
+
+    async with async_session() as session:
+        for hour in range(200):
+            # A flat MAP series with one spike at hour 120.
+            value = 140 if hour == 120 else 65
+            session.add(
+                TimelineEventModel(
+                    id=uuid.uuid4(),
+                    tenant_id=tenant_id,
+                    admission_id=admission_id,
+                    event_type="vital",
+                    occurred_at=START + timedelta(hours=hour),
+                    data={"hour": hour, "map": value},
+                )
+            )
+        session.add(
+            TimelineEventModel(
+                id=uuid.uuid4(),
+                tenant_id=tenant_id,
+                admission_id=admission_id,
+                event_type="note",
+                occurred_at=START + timedelta(hours=50, minutes=30),
+                data={"hour": "note"},
+            )
+        )
+        for hour, location in [(0, "ED"), (10, "CTOR"), (20, "CICU"), (90, "Floor")]:
+            session.add(
+                TrajectoryPointModel(
+                    id=uuid.uuid4(),
+                    tenant_id=tenant_id,
+                    admission_id=admission_id,
+                    location=location,
+                    effective_at=START + timedelta(hours=hour),
+                    sequence=0,
+                    data={"to_location": location},
+                )
+            )
+        await session.commit()
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    base = f"/api/v1/admissions/{admission_id}"
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        window = {"from": "2026-01-03T00:00:00Z", "to": "2026-01-03T06:00:00Z"}
+        body = (await client.get(f"{base}/timeline", params=window, headers=headers)).json()
+        assert [item["hour"] for item in body["items"]] == [48, 49, 50, "note", 51, 52, 53]
+
+        body = (await client.get(f"{base}/timeline", params={"value": "map", "points": 20}, headers=headers)).json()
+        assert body["total"] == 200
+        hours = [item["hour"] for item in body["items"]]
+        assert len(hours) == 20 and hours[0] == 0 and hours[-1] == 199
+        assert 120 in hours
+
+        body = (await client.get(f"{base}/trajectory", params={"from": "2026-01-01T15:00:00Z"}, headers=headers)).json()
+        # CTOR was in effect when the window opened.
+        assert [item["to_location"] for item in body["items"]] == ["CTOR", "CICU", "Floor"]
+
+        resp = await client.post(
+            "/api/v1/admissions/timelines",
+            json={"admission_ids": [str(admission_id)], "from": "2026-01-02T00:00:00Z", "points": 10},
+            headers=headers,
+        )
+        items = resp.json()["items"][0]["items"]
+        assert [item["data"]["to_location"] for item in items if item["lane"] == "locations"] == ["Floor"]
+        assert len([item for item in items if item["lane"] == "events"]) == 10
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
@@ -0,0 +1,138 @@
+import uuid
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.models.base import Base
+from app.models.read_models import TrajectorySegmentModel
+from app.projections.read_model_projections import TrajectorySegmentProjection
+
+
+def _point(admission_id, location, effective_at, position, **extra):
+    point_id = extra.pop("point_id", uuid.uuid4())
+    return point_id, {
+        "event_type": "admission.location_changed",
+        "event_id": str(uuid.uuid4()),
+        "global_position": position,
+        "data": {
+            "admission_id": str(admission_id),
+            "trajectory_id": str(point_id),
+            "to_location": location,
+            "effective_at": effective_at,
+            **extra,
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_segments_relink_on_late_points_and_corrections():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    admission_id = uuid.uuid4()
+
+    async with async_session() as session:
+        projection = TrajectorySegmentProjection(session=session, tenant_id=tenant_id)
+        _, ed = _point(admission_id, "ED", "2026-01-01T00:00:00", 1)
+        _, floor = _point(admission_id, "Floor", "2026-01-01T12:00:00", 2)
+        late_id, late = _point(admission_id, "CICU", "2026-01-01T06:00:00", 3)
+        _, fix = _point(
+            admission_id, "PICU", "2026-01-01T06:00:00", 4, corrects_point_id=str(late_id)
+        )
+        for event in (ed, floor, late, fix):
+            await projection.handle(event)
+        await session.commit()
+
+        result = await session.execute(
+            select(TrajectorySegmentModel)
+            .where(TrajectorySegmentModel.active.is_(True))
+            .order_by(TrajectorySegmentModel.start_at)
+        )
+        segments = [(s.location, s.duration_hours) for s in result.scalars().all()]
+        assert segments == [("ED", 6.0), ("PICU", 6.0), ("Floor", None)]
+
+        corrected = await session.get(TrajectorySegmentModel, late_id)
+        assert corrected.active is False
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get(
+            f"/api/v1/admissions/{admission_id}/segments",
+            headers={"X-Tenant-ID": str(tenant_id)},
+        )
+        assert [item["location"] for item in resp.json()["items"]] == ["ED", "PICU", "Floor"]
+
+        resp = await client.get(
+            f"/api/v1/admissions/{admission_id}/time-in-location",
+            headers={"X-Tenant-ID": str(tenant_id)},
+            params={"from": "2026-01-01T03:00:00+00:00", "to": "2026-01-01T14:00:00+00:00"},
+        )
+        hours = {item["location"]: item["hours"] for item in resp.json()["items"]}
+        assert hours == {"ED": 3.0, "PICU": 6.0, "Floor": 2.0}
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_corrections_stay_within_their_admission():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    admission_id = uuid.uuid4()
+    other_admission_id = uuid.uuid4()
+
+    async with async_session() as session:
+        projection = TrajectorySegmentProjection(session=session, tenant_id=tenant_id)
+        target_id = uuid.uuid4()
+        # The correction is projected before the point it supersedes.
+        _, fix = _point(admission_id, "PICU", "2026-01-01T06:00:00", 1, corrects_point_id=str(target_id))
+        _, stray = _point(other_admission_id, "OR", "2026-01-01T07:00:00", 2, corrects_point_id=str(target_id))
+        _, target = _point(admission_id, "CICU", "2026-01-01T06:00:00", 3, point_id=target_id)
+        other_id, other = _point(other_admission_id, "ED", "2026-01-01T05:00:00", 4)
+        # Names the other admission's point but belongs to this admission.
+        _, cross = _point(admission_id, "Floor", "2026-01-01T09:00:00", 5, corrects_point_id=str(other_id))
+        for event in (fix, stray, target, other, cross):
+            await projection.handle(event)
+        await session.commit()
+
+        assert (await session.get(TrajectorySegmentModel, target_id)).active is False
+        assert (await session.get(TrajectorySegmentModel, other_id)).active is True
+
+        result = await session.execute(
+            select(TrajectorySegmentModel)
+            .where(TrajectorySegmentModel.admission_id == other_admission_id)
+            .where(TrajectorySegmentModel.active.is_(True))
+            .order_by(TrajectorySegmentModel.start_at)
+        )
+        assert [(s.location, s.duration_hours) for s in result.scalars().all()] == [("ED", 2.0), ("OR", None)]
+
+    await engine.dispose()
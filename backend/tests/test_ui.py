@@ -11,3 +11,6 @@ async def test_timeline_ui_returns_html():
         resp = await client.get("/ui/timeline")
         assert resp.status_code == 200
         assert "Timeline Preview" in resp.text
+        # fields= is retried without it where the database lacks JSON functions.
+        assert 'fetchFields("/api/v1/patients?limit=2", "patient_id")' in resp.text
+        assert 'error.message !== "Request failed: 501"' in resp.text
@@ -0,0 +1,113 @@
+import uuid
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.core.database import get_session
+from app.models.base import Base
+from app.models.read_models import CensusOccupantModel, UnitCensusModel
+from app.projections.read_model_projections import (
+    TrajectorySegmentProjection,
+    UnitCensusProjection,
+)
+
+
+def _location(admission_id, location, effective_at, position):
+    return {
+        "event_type": "admission.location_changed",
+        "event_id": str(uuid.uuid4()),
+        "global_position": position,
+        "data": {
+            "admission_id": str(admission_id),
+            "trajectory_id": str(uuid.uuid4()),
+            "to_location": location,
+            "effective_at": effective_at,
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_unit_census_counts_occupants_and_history():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    tenant_id = uuid.uuid4()
+    first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    events = [
+        _location(first, "CICU", "2026-01-01T00:00:00", 1),
+        _location(second, "CICU", "2026-01-01T02:00:00", 2),
+        _location(third, "ED", "2026-01-01T03:00:00", 3),
+        _location(first, "Floor", "2026-01-01T05:00:00", 4),
+        _location(third, "CICU", "2026-01-01T06:00:00", 5),
+        _location(second, "Discharge", "2026-01-01T07:00:00", 6),
+    ]
+
+    async with async_session() as session:
+        projections = [
+            TrajectorySegmentProjection(session=session, tenant_id=tenant_id),
+            UnitCensusProjection(session=session, tenant_id=tenant_id),
+        ]
+        for event in events:
+            for projection in projections:
+                await projection.handle(event)
+                await session.flush()
+        await session.commit()
+
+        cicu = await session.get(UnitCensusModel, (tenant_id, "CICU"))
+        ed = await session.get(UnitCensusModel, (tenant_id, "ED"))
+        assert cicu.occupancy == 1
+        assert ed.occupancy == 0
+        assert (await session.get(CensusOccupantModel, second)) is None
+        assert (await session.get(CensusOccupantModel, third)).location == "CICU"
+
+    async def _override_get_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_get_session
+
+    headers = {"X-Tenant-ID": str(tenant_id)}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/api/v1/census", headers=headers)
+        counts = {item["location"]: item["occupancy"] for item in resp.json()["items"]}
+        assert counts == {"CICU": 1, "ED": 0, "Floor": 1}
+
+        resp = await client.get("/api/v1/census/CICU", headers=headers)
+        assert [o["admission_id"] for o in resp.json()["occupants"]] == [str(third)]
+
+        resp = await client.get(
+            "/api/v1/census/CICU",
+            headers=headers,
+            params={"at": "2026-01-01T04:00:00+00:00"},
+        )
+        body = resp.json()
+        assert body["occupancy"] == 2
+        assert {o["admission_id"] for o in body["occupants"]} == {str(first), str(second)}
+
+        resp = await client.get(
+            "/api/v1/census/CICU/hourly",
+            headers=headers,
+            params={"from": "2026-01-01T00:00:00+00:00", "to": "2026-01-01T08:00:00+00:00"},
+        )
+        assert [item["occupancy"] for item in resp.json()["items"]] == [1, 1, 2, 2, 2, 1, 2, 1]
+
+        resp = await client.get(
+            "/api/v1/census/CICU/hourly",
+            headers=headers,
+            params={"from": "2026-01-01T00:00:00+00:00", "to": "2026-03-01T00:00:00+00:00"},
+        )
+        assert resp.status_code == 400
+
+    app.dependency_overrides.clear()
+    await engine.dispose()